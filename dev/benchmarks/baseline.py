@@ -0,0 +1,89 @@
+"""JSON baselines for benchmark results and regression checks against them."""
+
+import json
+import math
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+def percentile(values: Iterable[float], fraction: float) -> float:
+    """Return the nearest-rank percentile, or 0 for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine a result was produced on."""
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def save_baseline(path: Path, results: Dict[str, Any]) -> None:
+    """Write results with a timestamp and environment description."""
+    payload = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        **results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+def compare_metrics(
+    current: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float,
+    higher_is_better: Iterable[str] = (),
+    min_delta: float = 0.0,
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Compare metrics present in both results.
+
+    Args:
+        current: Metric values of this run
+        baseline: Metric values of the baseline
+        tolerance: Allowed relative change in the wrong direction, e.g. 0.1
+        higher_is_better: Metrics such as throughput where lower values regress;
+            all other metrics are treated as costs
+        min_delta: Absolute change below which a metric never regresses, so that
+            noise on near-zero values is ignored
+
+    Returns:
+        List[Tuple[str, float, float, float]]: ``(name, baseline, current,
+        relative change)`` for every metric that regressed beyond the tolerance
+    """
+    better_high = set(higher_is_better)
+    regressions = []
+    for name in sorted(current.keys() & baseline.keys()):
+        before, after = baseline[name], current[name]
+        if not before:
+            continue
+        change = (after - before) / before
+        regressed = -change if name in better_high else change
+        if regressed > tolerance and abs(after - before) > min_delta:
+            regressions.append((name, before, after, change))
+    return regressions
+
+
+def report_regressions(regressions: List[Tuple[str, float, float, float]]) -> None:
+    if not regressions:
+        print("No regressions beyond the tolerance")
+        return
+    print("Regressions:")
+    for name, before, after, change in regressions:
+        print(f"  {name:<56} {before:>12.4f} -> {after:>12.4f} ({change:+.1%})")
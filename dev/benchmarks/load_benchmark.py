@@ -0,0 +1,336 @@
+"""End-to-end load benchmark of POST /research against mocked dependencies.
+
+Runs the FastAPI app in-process through an ASGI transport, with the search
+client, scraper and LLM replaced by mocks that inject latency, failures and
+payload sizes. Reports throughput, latency percentiles and the per-stage
+breakdown taken from ``metadata.timings``, and can save or compare JSON
+baselines.
+
+Latency specs are ``distribution:mean[:spread]`` in seconds, for example
+``constant:0.2``, ``uniform:0.5:0.2`` or ``lognormal:2.0:0.6``.
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+from dev.benchmarks.baseline import (
+    BASELINE_DIR,
+    compare_metrics,
+    load_baseline,
+    percentile,
+    report_regressions,
+    save_baseline,
+)
+from dev.mocks import (
+    LatencyProfile,
+    MockLLMClient,
+    MockScrapingService,
+    MockSearchClient,
+)
+from starprobe.api.main import app
+from starprobe.config import AppSettings, ScrapingSettings
+from starprobe.dependencies import (
+    get_app_settings,
+    get_domain_policy,
+    get_llm_client,
+    get_scraping_service,
+    get_search_client,
+)
+from starprobe.services import DomainPolicyService
+
+DEFAULT_BASELINE = BASELINE_DIR / "load_benchmark.json"
+
+
+def _build_search_results(count: int, snippet_words: int) -> List[Dict[str, Any]]:
+    snippet = " ".join(["renewable energy storage capacity"] * (snippet_words // 4))
+    return [
+        {
+            "title": f"Renewable energy storage report {index}",
+            "url": f"https://site{index}.example.com/reports/{index}",
+            "content": snippet,
+            "raw_content": snippet,
+        }
+        for index in range(count)
+    ]
+
+
+def _build_page(size_chars: int) -> str:
+    paragraph = (
+        "Grid operators expanded battery storage to balance variable solar and wind "
+        "output, and reported lower curtailment during evening demand peaks. "
+    )
+    return (paragraph * (size_chars // len(paragraph) + 1))[:size_chars]
+
+
+def _mock_overrides(args: argparse.Namespace) -> Dict[Callable, Callable]:
+    search = MockSearchClient(
+        _build_search_results(args.results, args.snippet_words),
+        latency=LatencyProfile.parse(
+            args.search_latency, args.search_failure_rate, args.seed
+        ),
+    )
+    scraper = MockScrapingService(
+        _build_page(args.page_chars),
+        latency=LatencyProfile.parse(
+            args.scrape_latency, args.scrape_failure_rate, args.seed
+        ),
+    )
+    llm = MockLLMClient(
+        summary_chars=args.summary_chars,
+        latency=LatencyProfile.parse(
+            args.llm_latency, args.llm_failure_rate, args.seed
+        ),
+    )
+    return {
+        get_search_client: lambda: search,
+        get_scraping_service: lambda: scraper,
+        get_llm_client: lambda: llm,
+    }
+
+
+async def run_load(
+    overrides: Dict[Callable, Callable],
+    query_for: Callable[[int], str],
+    clients: int,
+    requests: int,
+    warmup: int = 0,
+    track_memory: bool = False,
+) -> Dict[str, Any]:
+    """
+    Send research requests from concurrent clients to the in-process app.
+
+    Args:
+        overrides: Dependency overrides that replace the app's clients
+        query_for: Returns the research query of the n-th request; warm-up
+            requests use negative indexes
+        clients: Number of concurrent clients
+        requests: Total number of measured requests
+        warmup: Requests sent one at a time before measuring
+        track_memory: Trace allocations with tracemalloc and report the peak and
+            retained memory of each request (slows requests down noticeably)
+
+    Returns:
+        Dict[str, Any]: Throughput, latency percentiles, per-stage percentiles
+            and, when tracking memory, per-request memory percentiles in KiB
+    """
+    # Keep benchmark scrapes out of the persisted domain stats
+    domain_policy = DomainPolicyService(ScrapingSettings(scraping_domain_stats_path=""))
+    app.dependency_overrides.update({get_domain_policy: lambda: domain_policy})
+    app.dependency_overrides.update(overrides)
+
+    latencies: List[float] = []
+    stages: Dict[str, List[float]] = defaultdict(list)
+    memory: Dict[str, List[float]] = defaultdict(list)
+    failures = 0
+    counter = itertools.count()
+
+    transport = httpx.ASGITransport(app=app)
+    if track_memory:
+        tracemalloc.start()
+        # Allocation-site snapshots would dominate the measured latency
+        app_settings = AppSettings(memory_top_allocations=0)
+        app.dependency_overrides[get_app_settings] = lambda: app_settings
+    try:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://benchmark", timeout=None
+            ) as client:
+
+                async def request(index: int) -> httpx.Response:
+                    return await client.post(
+                        "/research", json={"query": query_for(index)}
+                    )
+
+                for index in range(warmup):
+                    await request(-index - 1)
+
+                async def worker() -> None:
+                    nonlocal failures
+                    while (index := next(counter)) < requests:
+                        started = time.perf_counter()
+                        response = await request(index)
+                        latencies.append(time.perf_counter() - started)
+                        body = response.json() if response.status_code == 200 else {}
+                        if not body.get("success"):
+                            failures += 1
+                        metadata = body.get("metadata") or {}
+                        for key, value in metadata.get("memory", {}).items():
+                            if key != "nodes":
+                                memory[key].append(value)
+                        timings = metadata.get("timings") or {}
+                        for node, node_timing in timings.items():
+                            stages[node].append(node_timing["duration"])
+                            for call, call_timing in node_timing["calls"].items():
+                                stages[f"{node}.{call}"].append(call_timing["duration"])
+
+                started = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(clients)))
+                wall_time = time.perf_counter() - started
+    finally:
+        app.dependency_overrides.clear()
+        if track_memory:
+            tracemalloc.stop()
+
+    results = {
+        "requests": len(latencies),
+        "failures": failures,
+        "wall_time": round(wall_time, 4),
+        "rps": round(len(latencies) / wall_time, 3) if wall_time else 0.0,
+        "latency": _distribution(latencies),
+        "stages": {name: _distribution(values) for name, values in stages.items()},
+    }
+    if memory:
+        results["memory"] = {
+            name: _distribution(values) for name, values in memory.items()
+        }
+    return results
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    return {
+        "mean": round(sum(values) / len(values), 4) if values else 0.0,
+        "p50": round(percentile(values, 0.5), 4),
+        "p95": round(percentile(values, 0.95), 4),
+        "p99": round(percentile(values, 0.99), 4),
+        "max": round(max(values, default=0.0), 4),
+    }
+
+
+def _flatten(results: Dict[str, Any]) -> Dict[str, float]:
+    """Return the metrics compared against a baseline."""
+    metrics = {"rps": results["rps"]}
+    for key in ("p50", "p95", "p99"):
+        metrics[f"latency_{key}"] = results["latency"][key]
+    for name, stage in results["stages"].items():
+        metrics[f"stage.{name}.p95"] = stage["p95"]
+    for name, distribution in results.get("memory", {}).items():
+        metrics[f"memory.{name}.p95"] = distribution["p95"]
+    return metrics
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    latency = results["latency"]
+    print(
+        f"{results['requests']} requests, {results['failures']} failed, "
+        f"{results['wall_time']:.2f}s wall, {results['rps']:.2f} req/s"
+    )
+    print(
+        f"latency  p50 {latency['p50'] * 1000:>9.1f} ms  "
+        f"p95 {latency['p95'] * 1000:>9.1f} ms  p99 {latency['p99'] * 1000:>9.1f} ms"
+    )
+    for name, distribution in results.get("memory", {}).items():
+        print(
+            f"{name:<12} p50 {distribution['p50']:>9.1f} KiB  "
+            f"p95 {distribution['p95']:>9.1f} KiB  max {distribution['max']:>9.1f} KiB"
+        )
+    print(f"{'stage':<44} {'mean ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for name, stage in results["stages"].items():
+        print(
+            f"{name:<44} {stage['mean'] * 1000:>10.1f} "
+            f"{stage['p95'] * 1000:>10.1f} {stage['p99'] * 1000:>10.1f}"
+        )
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser, default: Path) -> None:
+    parser.add_argument(
+        "--save-baseline",
+        type=Path,
+        nargs="?",
+        const=default,
+        help=f"Write the results as a baseline (default {default})",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=default,
+        help="Compare against a baseline and exit non-zero on regressions",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative regression when comparing (default 0.1)",
+    )
+
+
+def finish(results: Dict[str, Any], args: argparse.Namespace) -> None:
+    """Print the results, then save or compare them as the arguments request."""
+    print_report(results)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"Saved baseline to {args.save_baseline}")
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        regressions = compare_metrics(
+            _flatten(results),
+            _flatten(baseline),
+            args.tolerance,
+            higher_is_better=("rps",),
+            # Stages that take well under a millisecond are pure noise
+            min_delta=0.005,
+        )
+        report_regressions(regressions)
+        if regressions:
+            sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=100, help="Total requests")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--topic", default="renewable energy storage")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--search-latency", default="lognormal:0.8:0.5")
+    parser.add_argument("--scrape-latency", default="lognormal:0.6:0.8")
+    parser.add_argument("--llm-latency", default="lognormal:2.0:0.4")
+    parser.add_argument("--search-failure-rate", type=float, default=0.0)
+    parser.add_argument("--scrape-failure-rate", type=float, default=0.05)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--results", type=int, default=8, help="Results per search")
+    parser.add_argument("--snippet-words", type=int, default=40)
+    parser.add_argument("--page-chars", type=int, default=40_000)
+    parser.add_argument("--summary-chars", type=int, default=1_500)
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report the peak and retained memory of each request (slower)",
+    )
+    add_baseline_arguments(parser, DEFAULT_BASELINE)
+    args = parser.parse_args()
+
+    # Per-request INFO logs would dominate the output and the measured time
+    logging.disable(logging.INFO)
+    results = asyncio.run(
+        run_load(
+            _mock_overrides(args),
+            lambda index: f"{args.topic} {index}",
+            args.clients,
+            args.requests,
+            args.warmup,
+            args.memory,
+        )
+    )
+    results["scenario"] = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("save_baseline", "compare", "tolerance")
+    }
+    finish(results, args)
+
+
+if __name__ == "__main__":
+    main()
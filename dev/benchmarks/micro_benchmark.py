@@ -0,0 +1,354 @@
+"""Micro-benchmarks for the text processing and extraction hot paths.
+
+Runs every per-request text operation over the bundled corpus of HTML pages and
+LLM outputs in ``dev/benchmarks/corpus``, reporting ops/sec and the peak memory
+allocated by a single call (measured with tracemalloc). Large inputs are built
+by repeating the body of each page, so no network access is needed.
+
+Results can be saved as a JSON baseline and compared against it; the comparison
+exits non-zero when a benchmark is slower or allocates more than the tolerance
+allows. Baselines are machine-specific, so compare runs from the same machine.
+
+With ``--legacy``, the previous per-call token truncation (which loaded the
+encoding and encoded the full text on every call) is measured as well, and the
+speedup of the current implementation over it is reported.
+"""
+
+import argparse
+import re
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import httpx
+import tiktoken
+
+from dev.benchmarks.baseline import (
+    BASELINE_DIR,
+    compare_metrics,
+    environment,
+    load_baseline,
+    report_regressions,
+    save_baseline,
+)
+from starprobe.config import ScrapingSettings, WorkflowSettings
+from starprobe.services import ScrapingService, TextProcessingService
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+DEFAULT_BASELINE = BASELINE_DIR / "micro_benchmark.json"
+# Number of times the page body is repeated for the large variant of each page
+LARGE_PAGE_REPEATS = 40
+# Prefix of the benchmarks that measure the previous implementations
+LEGACY_PREFIX = "legacy_"
+# A public IP literal passes URL validation without a DNS lookup
+OFFLINE_URL = "http://93.184.216.34/article"
+
+_BODY_PATTERN = re.compile(r"(<body[^>]*>)(.*)(</body>)", re.DOTALL | re.IGNORECASE)
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[], Any]
+
+
+def legacy_truncate_text_by_tokens(text: str, max_tokens: int) -> str:
+    """Previous implementation: loads the encoding and encodes the full text per call."""
+    if not text:
+        return ""
+    encoding = tiktoken.get_encoding(TextProcessingService.DEFAULT_ENCODING)
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def legacy_deduplicate_and_format_sources(
+    search_results: Dict[str, List[Dict[str, Any]]], settings: WorkflowSettings
+) -> str:
+    """Previous implementation: truncates each source one at a time."""
+    all_content = []
+    seen_urls = set()
+    for r in search_results.get("results", []):
+        url = r.get("url")
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
+        content = r.get("raw_content", r.get("content", ""))
+        if content:
+            truncated = legacy_truncate_text_by_tokens(
+                content, settings.max_tokens_per_source
+            )
+            all_content.append(f"Source: {url}\nContent: {truncated}\n---")
+    return "\n".join(all_content)
+
+
+def load_corpus() -> Dict[str, Dict[str, str]]:
+    """Load the bundled HTML pages, with a large variant of each, and LLM outputs."""
+    pages = {}
+    for path in sorted((CORPUS_DIR / "html").glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        pages[path.stem] = html
+        pages[f"{path.stem}_x{LARGE_PAGE_REPEATS}"] = _BODY_PATTERN.sub(
+            lambda match: match.group(1)
+            + match.group(2) * LARGE_PAGE_REPEATS
+            + match.group(3),
+            html,
+        )
+    outputs = {
+        path.stem: path.read_text(encoding="utf-8")
+        for path in sorted((CORPUS_DIR / "llm").glob("*.txt"))
+    }
+    return {"html": pages, "llm": outputs}
+
+
+def build_benchmarks(
+    corpus: Dict[str, Dict[str, str]], legacy: bool = False
+) -> List[Benchmark]:
+    settings = WorkflowSettings()
+    texts = {
+        name: ScrapingService.extract_text(html)
+        for name, html in corpus["html"].items()
+    }
+    search_results = {
+        "results": [
+            {
+                "title": name.replace("_", " "),
+                "url": f"https://{name.replace('_', '-')}.example.com/page",
+                "content": text[:300],
+                "raw_content": text,
+            }
+            for name, text in texts.items()
+        ]
+    }
+    query = "grid battery storage curtailment"
+
+    benchmarks = []
+    for name, html in corpus["html"].items():
+        encoded = html.encode("utf-8")
+        benchmarks.append(
+            Benchmark(
+                f"extract_text[{name}]",
+                lambda encoded=encoded: ScrapingService.extract_text(encoded),
+            )
+        )
+    for name, text in texts.items():
+        benchmarks.append(
+            Benchmark(
+                f"truncate_text_by_tokens[{name}]",
+                lambda text=text: TextProcessingService.truncate_text_by_tokens(
+                    text, settings.max_tokens_per_source
+                ),
+            )
+        )
+    for name, output in corpus["llm"].items():
+        benchmarks.append(
+            Benchmark(
+                f"strip_thinking_tokens[{name}]",
+                lambda output=output: TextProcessingService.strip_thinking_tokens(
+                    output
+                ),
+            )
+        )
+    benchmarks.append(
+        Benchmark(
+            "deduplicate_and_format_sources[corpus]",
+            lambda: TextProcessingService.deduplicate_and_format_sources(
+                search_results, settings, query=query
+            ),
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            "format_sources[corpus]",
+            lambda: TextProcessingService.format_sources(search_results),
+        )
+    )
+
+    # The full scrape path, with responses served from memory
+    article = corpus["html"]["news_article"].encode("utf-8")
+    scraper = ScrapingService(
+        ScrapingSettings(),
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, content=article, headers={"Content-Type": "text/html"}
+                )
+            )
+        ),
+    )
+    benchmarks.append(
+        Benchmark("scrape[news_article]", lambda: scraper.scrape(OFFLINE_URL))
+    )
+    if legacy:
+        benchmarks.extend(_legacy_benchmarks(texts, search_results, settings))
+    return benchmarks
+
+
+def _legacy_benchmarks(
+    texts: Dict[str, str],
+    search_results: Dict[str, List[Dict[str, Any]]],
+    settings: WorkflowSettings,
+) -> List[Benchmark]:
+    benchmarks = [
+        Benchmark(
+            f"{LEGACY_PREFIX}truncate_text_by_tokens[{name}]",
+            lambda text=text: legacy_truncate_text_by_tokens(
+                text, settings.max_tokens_per_source
+            ),
+        )
+        for name, text in texts.items()
+    ]
+    # The legacy formatter has no passage selection, so compare it against the
+    # current one without a query
+    benchmarks.append(
+        Benchmark(
+            "deduplicate_and_format_sources[corpus_no_query]",
+            lambda: TextProcessingService.deduplicate_and_format_sources(
+                search_results, settings
+            ),
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            f"{LEGACY_PREFIX}deduplicate_and_format_sources[corpus_no_query]",
+            lambda: legacy_deduplicate_and_format_sources(search_results, settings),
+        )
+    )
+    return benchmarks
+
+
+def measure(benchmark: Benchmark, repeat: int, min_time: float) -> Dict[str, float]:
+    """Return the best ops/sec over ``repeat`` runs and the peak KiB of one call."""
+    timer = timeit.Timer(benchmark.func)
+    number, elapsed = timer.autorange()
+    number = max(int(number * min_time / max(elapsed, 1e-9)), 1)
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        benchmark.func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(1 / best, 2),
+        "us_per_op": round(best * 1e6, 2),
+        "peak_kib": round((peak - start) / 1024, 1),
+    }
+
+
+def _flatten(results: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    metrics = {}
+    for name, result in results.items():
+        metrics[f"{name}.ops_per_sec"] = result["ops_per_sec"]
+        metrics[f"{name}.peak_kib"] = result["peak_kib"]
+    return metrics
+
+
+def report_speedups(results: Dict[str, Dict[str, float]]) -> None:
+    """Print how much faster each benchmark is than its legacy counterpart."""
+    pairs = [
+        (name[len(LEGACY_PREFIX) :], name)
+        for name in results
+        if name.startswith(LEGACY_PREFIX) and name[len(LEGACY_PREFIX) :] in results
+    ]
+    if not pairs:
+        return
+    print(f"\n{'speedup over legacy':<56} {'x':>12}")
+    for current, legacy in pairs:
+        speedup = results[current]["ops_per_sec"] / results[legacy]["ops_per_sec"]
+        print(f"{current:<56} {speedup:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--filter", default="", help="Only run benchmarks matching")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Also measure the previous implementations and report the speedup",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Seconds per timing run"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        help=f"Write the results as a baseline (default {DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        help="Compare against a baseline and exit non-zero on regressions",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative regression when comparing (default 0.25)",
+    )
+    args = parser.parse_args()
+
+    # Load the tokenizer before measuring so that its load time is not counted
+    TextProcessingService.get_encoding()
+    benchmarks = [
+        benchmark
+        for benchmark in build_benchmarks(load_corpus(), legacy=args.legacy)
+        if args.filter in benchmark.name
+    ]
+
+    results = {}
+    print(f"{'benchmark':<56} {'ops/s':>12} {'us/op':>12} {'peak KiB':>10}")
+    for benchmark in benchmarks:
+        result = measure(benchmark, args.repeat, args.min_time)
+        results[benchmark.name] = result
+        print(
+            f"{benchmark.name:<56} {result['ops_per_sec']:>12.1f} "
+            f"{result['us_per_op']:>12.1f} {result['peak_kib']:>10.1f}"
+        )
+    report_speedups(results)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, {"benchmarks": results})
+        print(f"Saved baseline to {args.save_baseline}")
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        if baseline.get("environment") != environment():
+            print("Warning: the baseline was recorded in a different environment")
+        current = _flatten(results)
+        previous = _flatten(baseline["benchmarks"])
+        speed = [name for name in current if name.endswith("ops_per_sec")]
+        memory = [name for name in current if name.endswith("peak_kib")]
+        regressions = compare_metrics(
+            {name: current[name] for name in speed},
+            previous,
+            args.tolerance,
+            higher_is_better=speed,
+        ) + compare_metrics(
+            {name: current[name] for name in memory},
+            previous,
+            args.tolerance,
+            # Ignore allocation changes smaller than 16 KiB
+            min_delta=16,
+        )
+        report_regressions(regressions)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Record real research traffic once, then benchmark against it offline.
+
+``record`` runs each topic through the app with the real search client, scraper
+and LLM, storing every response and its timing in a replay archive. ``replay``
+runs the load benchmark with clients that serve the archive instead, so runs
+are offline and repeatable while keeping real page sizes, model outputs and
+latencies. ``--speed`` scales the recorded delays (0 replays without delays).
+
+Replayed requests cycle through the recorded topics; prompts that were not
+recorded fail, so record again after changing prompts or workflow settings.
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from dev.benchmarks.baseline import BASELINE_DIR
+from dev.benchmarks.load_benchmark import add_baseline_arguments, finish, run_load
+from dev.mocks.replay import (
+    RecordingLLMClient,
+    RecordingSearchClient,
+    ReplayArchive,
+    ReplayLLMClient,
+    ReplayScrapingService,
+    ReplaySearchClient,
+    recording_scraping_service,
+)
+from starprobe.dependencies import (
+    _create_llm_client,
+    get_llm_client,
+    get_nexus_settings,
+    get_scraping_service,
+    get_scraping_settings,
+    get_search_client,
+)
+
+DEFAULT_ARCHIVE = Path(__file__).parent / "replays" / "research.json.gz"
+DEFAULT_BASELINE = BASELINE_DIR / "replay_benchmark.json"
+DEFAULT_TOPICS = [
+    "grid-scale battery storage and solar curtailment",
+    "health effects of intermittent fasting",
+    "history of the transistor",
+]
+
+
+def record(args: argparse.Namespace) -> None:
+    archive = ReplayArchive(args.topics)
+    search = RecordingSearchClient(get_search_client(), archive)
+    scraper = recording_scraping_service(archive, get_scraping_settings())
+    llm = RecordingLLMClient(_create_llm_client(get_nexus_settings()), archive)
+    try:
+        results = asyncio.run(
+            run_load(
+                {
+                    get_search_client: lambda: search,
+                    get_scraping_service: lambda: scraper,
+                    get_llm_client: lambda: llm,
+                },
+                lambda index: args.topics[index],
+                clients=1,
+                requests=len(args.topics),
+            )
+        )
+    finally:
+        scraper.close()
+
+    archive.save(args.archive)
+    print(
+        f"Recorded {len(archive.search)} searches, {len(archive.pages)} pages and "
+        f"{len(archive.llm)} LLM responses for {len(args.topics)} topics "
+        f"({results['failures']} failed) to {args.archive}"
+    )
+
+
+def replay(args: argparse.Namespace) -> None:
+    archive = ReplayArchive.load(args.archive)
+    search = ReplaySearchClient(archive, args.speed)
+    scraper = ReplayScrapingService(archive, args.speed, get_scraping_settings())
+    llm = ReplayLLMClient(archive, args.speed)
+    topics = archive.topics
+    try:
+        results = asyncio.run(
+            run_load(
+                {
+                    get_search_client: lambda: search,
+                    get_scraping_service: lambda: scraper,
+                    get_llm_client: lambda: llm,
+                },
+                lambda index: topics[index % len(topics)],
+                args.clients,
+                args.requests,
+                args.warmup,
+                args.memory,
+            )
+        )
+    finally:
+        scraper.close()
+
+    results["scenario"] = {
+        "archive": str(args.archive),
+        "topics": topics,
+        "clients": args.clients,
+        "requests": args.requests,
+        "speed": args.speed,
+        "memory": args.memory,
+    }
+    finish(results, args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="Record real traffic")
+    record_parser.add_argument("--topics", nargs="+", default=DEFAULT_TOPICS)
+    record_parser.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE)
+    record_parser.set_defaults(func=record)
+
+    replay_parser = commands.add_parser("replay", help="Benchmark recorded traffic")
+    replay_parser.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE)
+    replay_parser.add_argument("--clients", type=int, default=8)
+    replay_parser.add_argument("--requests", type=int, default=48)
+    replay_parser.add_argument("--warmup", type=int, default=0)
+    replay_parser.add_argument(
+        "--speed", type=float, default=1.0, help="Multiplier for recorded delays"
+    )
+    replay_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report the peak and retained memory of each request (slower)",
+    )
+    add_baseline_arguments(replay_parser, DEFAULT_BASELINE)
+    replay_parser.set_defaults(func=replay)
+
+    args = parser.parse_args()
+    # Per-request INFO logs would dominate the output and the measured time
+    logging.disable(logging.INFO)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
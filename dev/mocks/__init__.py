@@ -1,7 +1,11 @@
+from .latency_profile import LatencyProfile
+from .mock_llm_client import MockLLMClient
 from .mock_scraping_service import MockScrapingService
 from .mock_search_client import MockSearchClient
 
 __all__ = [
+    "LatencyProfile",
+    "MockLLMClient",
     "MockSearchClient",
     "MockScrapingService",
 ]
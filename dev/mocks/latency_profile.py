@@ -0,0 +1,60 @@
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+
+Distribution = Literal["constant", "uniform", "lognormal"]
+
+
+@dataclass
+class LatencyProfile:
+    """Delay and failure injection for mocks used in load benchmarks.
+
+    ``mean`` is the average delay in seconds. For ``uniform`` delays are drawn
+    from ``mean ± spread``; for ``lognormal`` ``spread`` is the sigma of the
+    underlying normal distribution, which produces a long tail like real network
+    and LLM latencies.
+    """
+
+    distribution: Distribution = "constant"
+    mean: float = 0.0
+    spread: float = 0.0
+    failure_rate: float = 0.0
+    seed: Optional[int] = None
+    _random: random.Random = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.distribution not in ("constant", "uniform", "lognormal"):
+            raise ValueError(f"Unsupported latency distribution '{self.distribution}'")
+        self._random = random.Random(self.seed)
+
+    @classmethod
+    def parse(
+        cls, spec: str, failure_rate: float = 0.0, seed: Optional[int] = None
+    ) -> "LatencyProfile":
+        """
+        Build a profile from ``distribution:mean[:spread]``, e.g. ``lognormal:0.8:0.5``.
+
+        A bare number is a constant delay in seconds.
+        """
+        parts = spec.split(":")
+        if len(parts) == 1:
+            return cls("constant", float(parts[0]), 0.0, failure_rate, seed)
+        spread = float(parts[2]) if len(parts) > 2 else 0.0
+        return cls(parts[0], float(parts[1]), spread, failure_rate, seed)
+
+    def sample_delay(self) -> float:
+        """Draw one delay in seconds."""
+        if self.mean <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            return max(self._random.uniform(-self.spread, self.spread) + self.mean, 0.0)
+        if self.distribution == "lognormal":
+            # Choose mu so that the distribution's mean equals ``mean``
+            mu = math.log(self.mean) - self.spread**2 / 2
+            return self._random.lognormvariate(mu, self.spread)
+        return self.mean
+
+    def should_fail(self) -> bool:
+        """Return True for the share of calls that should fail."""
+        return self.failure_rate > 0 and self._random.random() < self.failure_rate
@@ -0,0 +1,55 @@
+import asyncio
+import json
+from typing import Any, Optional
+
+from langchain_core.messages import AIMessage
+
+from starprobe.protocols.llm_client_protocol import LLMClientProtocol
+
+from .latency_profile import LatencyProfile
+
+
+class MockLLMClient(LLMClientProtocol):
+    """Mock LLM client that answers the research prompts without a model.
+
+    Summarize prompts (recognised by their ``Context`` block) get a fixed summary;
+    every other prompt gets a search query, as a tool call when tools are bound
+    and as JSON otherwise.
+    """
+
+    def __init__(
+        self,
+        query: str = "mock search query",
+        summary_chars: int = 1200,
+        latency: Optional[LatencyProfile] = None,
+    ):
+        self.query = query
+        sentence = "The sources agree on the main findings about this topic. "
+        self.summary = (sentence * (summary_chars // len(sentence) + 1))[:summary_chars]
+        self.latency = latency
+        self.tools: list[Any] = []
+        self.calls = 0
+
+    def bind_tools(self, tools: list[Any]) -> "MockLLMClient":
+        bound = MockLLMClient(self.query, len(self.summary), self.latency)
+        bound.tools = list(tools)
+        return bound
+
+    async def invoke(self, messages: Any, **kwargs: Any) -> AIMessage:
+        self.calls += 1
+        if self.latency is not None:
+            await asyncio.sleep(self.latency.sample_delay())
+            if self.latency.should_fail():
+                raise RuntimeError("Injected LLM failure")
+
+        last_content = str(getattr(messages[-1], "content", messages[-1]))
+        if "Context>" in last_content:
+            return AIMessage(content=self.summary)
+
+        args = {"query": self.query, "rationale": "Mock rationale"}
+        if self.tools:
+            return AIMessage(
+                content="",
+                tool_calls=[{"name": "Query", "args": args, "id": "mock-call"}],
+            )
+        return AIMessage(content=json.dumps(args))
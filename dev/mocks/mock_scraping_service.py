@@ -1,11 +1,21 @@
+import time
+from typing import Optional
+
 from starprobe.protocols.scraping_service_protocol import (
     ScrapingServiceProtocol,
 )
 
+from .latency_profile import LatencyProfile
+
 
 class MockScrapingService(ScrapingServiceProtocol):
-    def __init__(self, mock_content: str = "Mock scraped content"):
+    def __init__(
+        self,
+        mock_content: str = "Mock scraped content",
+        latency: Optional[LatencyProfile] = None,
+    ):
         self.mock_content = mock_content
+        self.latency = latency
         self.scraped_urls: list[str] = []
 
     def validate_url(self, url: str) -> None:
@@ -17,4 +27,12 @@ class MockScrapingService(ScrapingServiceProtocol):
         """Mock scraping - returns predefined content."""
         self.validate_url(url)
         self.scraped_urls.append(url)
+        if self.latency is not None:
+            # Blocking like a real HTTP request, since scrapes run in worker threads
+            time.sleep(self.latency.sample_delay())
+            if self.latency.should_fail():
+                raise ValueError(f"Injected scrape failure for {url}")
         return self.mock_content
+
+    def close(self) -> None:
+        pass
@@ -1,14 +1,22 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from starprobe.protocols.ddgs_client_protocol import (
     DDGSClientProtocol,
 )
 
+from .latency_profile import LatencyProfile
+
 
 class MockSearchClient(DDGSClientProtocol):
     """Mock implementation of the search client for testing purposes."""
 
-    def __init__(self, mock_results: Optional[List[Dict[str, Any]]] = None):
+    def __init__(
+        self,
+        mock_results: Optional[List[Dict[str, Any]]] = None,
+        latency: Optional[LatencyProfile] = None,
+    ):
+        self.latency = latency
         if mock_results is None:
             self.mock_results = [
                 {
@@ -36,6 +44,11 @@ class MockSearchClient(DDGSClientProtocol):
     async def search(
         self, query: str, max_results: int = 3
     ) -> Dict[str, List[Dict[str, Any]]]:
+        if self.latency is not None:
+            await asyncio.sleep(self.latency.sample_delay())
+            # Like the real client, failed searches return no results
+            if self.latency.should_fail():
+                return {"results": []}
         return {"results": self.mock_results[:max_results]}
 
     async def close(self) -> None:
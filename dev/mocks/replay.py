@@ -0,0 +1,341 @@
+"""Record real search, scrape and LLM traffic and replay it offline.
+
+Recording clients wrap the real clients and store every response, together with
+how long it took, in a ``ReplayArchive``. Replay clients implement the same
+protocols and serve the archived responses after the recorded delay, so that
+benchmarks run offline against realistic content and timings.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    messages_from_dict,
+    messages_to_dict,
+)
+
+from starprobe.config import ScrapingSettings
+from starprobe.protocols.ddgs_client_protocol import DDGSClientProtocol
+from starprobe.protocols.llm_client_protocol import LLMClientProtocol
+from starprobe.services import PromptService, ScrapingService
+from starprobe.services.scraping_service import create_http_client
+
+ARCHIVE_VERSION = 1
+# Headers that no longer describe the body once it has been decoded
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class ReplayArchive:
+    """Thread-safe store of recorded responses, saved as gzipped JSON.
+
+    Responses are keyed by request, and the first recording of a key wins, so a
+    replay serves the same response however often the request is repeated.
+    """
+
+    def __init__(self, topics: Optional[List[str]] = None):
+        self.topics: List[str] = list(topics or [])
+        self.search: Dict[str, Dict[str, Any]] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.llm: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> "ReplayArchive":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported replay archive version in {path}")
+        archive = cls(data["topics"])
+        archive.search = data["search"]
+        archive.pages = data["pages"]
+        archive.llm = data["llm"]
+        return archive
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {
+                "version": ARCHIVE_VERSION,
+                "topics": self.topics,
+                "search": self.search,
+                "pages": self.pages,
+                "llm": self.llm,
+            }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def add(self, kind: str, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            getattr(self, kind).setdefault(key, entry)
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return getattr(self, kind).get(key)
+
+
+def search_key(query: str, max_results: int) -> str:
+    return f"{max_results}:{query}"
+
+
+def llm_key(messages: Any, tools: List[Any]) -> str:
+    """Hash the prompt and bound tools, ignoring the date rendered into prompts."""
+    today = PromptService.get_current_date()
+    parts = [
+        f"{getattr(message, 'type', '')}:{getattr(message, 'content', message)}"
+        for message in messages
+    ]
+    parts += [f"tool:{getattr(tool, 'name', tool)}" for tool in tools]
+    normalized = "\n".join(parts).replace(today, "<date>")
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _as_message(response: Any) -> BaseMessage:
+    """Convert a client response to a serializable message."""
+    if isinstance(response, BaseMessage):
+        return response
+    return AIMessage(
+        content=getattr(response, "content", str(response)),
+        tool_calls=getattr(response, "tool_calls", None) or [],
+    )
+
+
+async def _sleep_for(entry: Dict[str, Any], speed: float) -> None:
+    if speed > 0:
+        await asyncio.sleep(entry["elapsed"] * speed)
+
+
+class RecordingSearchClient(DDGSClientProtocol):
+    """Search client that records the results of another search client."""
+
+    def __init__(self, inner: DDGSClientProtocol, archive: ReplayArchive):
+        self.inner = inner
+        self.archive = archive
+
+    async def search(
+        self, query: str, max_results: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        started = time.perf_counter()
+        response = await self.inner.search(query, max_results)
+        self.archive.add(
+            "search",
+            search_key(query, max_results),
+            {"elapsed": time.perf_counter() - started, "response": response},
+        )
+        return response
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+
+class ReplaySearchClient(DDGSClientProtocol):
+    """Search client that serves recorded results.
+
+    Unrecorded queries return no results, like a failed search.
+    """
+
+    def __init__(self, archive: ReplayArchive, speed: float = 1.0):
+        self.archive = archive
+        self.speed = speed
+
+    async def search(
+        self, query: str, max_results: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        entry = self.archive.get("search", search_key(query, max_results))
+        if entry is None:
+            return {"results": []}
+        await _sleep_for(entry, self.speed)
+        return entry["response"]
+
+    async def close(self) -> None:
+        pass
+
+
+class RecordingLLMClient(LLMClientProtocol):
+    """LLM client that records the responses of another LLM client.
+
+    Only ``invoke`` is recorded, so structured output and summaries are
+    generated without streaming while recording.
+    """
+
+    def __init__(
+        self,
+        inner: LLMClientProtocol,
+        archive: ReplayArchive,
+        tools: Optional[List[Any]] = None,
+    ):
+        self.inner = inner
+        self.archive = archive
+        self.tools = list(tools or [])
+
+    def bind_tools(self, tools: list[Any]) -> "RecordingLLMClient":
+        return RecordingLLMClient(self.inner.bind_tools(tools), self.archive, tools)
+
+    async def invoke(self, messages: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        response = await self.inner.invoke(messages, **kwargs)
+        self.archive.add(
+            "llm",
+            llm_key(messages, self.tools),
+            {
+                "elapsed": time.perf_counter() - started,
+                "message": messages_to_dict([_as_message(response)])[0],
+            },
+        )
+        return response
+
+
+class ReplayLLMClient(LLMClientProtocol):
+    """LLM client that serves recorded responses.
+
+    Raises:
+        LookupError: When a prompt was not recorded
+    """
+
+    def __init__(
+        self,
+        archive: ReplayArchive,
+        speed: float = 1.0,
+        tools: Optional[List[Any]] = None,
+    ):
+        self.archive = archive
+        self.speed = speed
+        self.tools = list(tools or [])
+
+    def bind_tools(self, tools: list[Any]) -> "ReplayLLMClient":
+        return ReplayLLMClient(self.archive, self.speed, tools)
+
+    async def invoke(self, messages: Any, **kwargs: Any) -> Any:
+        entry = self.archive.get("llm", llm_key(messages, self.tools))
+        if entry is None:
+            raise LookupError("No recorded LLM response for this prompt")
+        await _sleep_for(entry, self.speed)
+        return messages_from_dict([entry["message"]])[0]
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """HTTP transport that records the responses of another transport."""
+
+    def __init__(self, inner: httpx.BaseTransport, archive: ReplayArchive):
+        self.inner = inner
+        self.archive = archive
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            response = self.inner.handle_request(request)
+            body = response.read()
+        except httpx.TransportError as e:
+            self.archive.add(
+                "pages",
+                str(request.url),
+                {"elapsed": time.perf_counter() - started, "error": str(e)},
+            )
+            raise
+        elapsed = time.perf_counter() - started
+        response.close()
+
+        # The stored body is already decoded, so drop the encoding headers
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        self.archive.add(
+            "pages",
+            str(request.url),
+            {
+                "elapsed": elapsed,
+                "status": response.status_code,
+                "headers": headers,
+                "body": base64.b64encode(body).decode("ascii"),
+            },
+        )
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions={
+                key: value
+                for key, value in response.extensions.items()
+                if key == "http_version"
+            },
+        )
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def recording_scraping_service(
+    archive: ReplayArchive, settings: Optional[ScrapingSettings] = None
+) -> ScrapingService:
+    """Create a scraping service whose real HTTP traffic is recorded."""
+    settings = settings or ScrapingSettings()
+    real_client = create_http_client(settings)
+    return ScrapingService(
+        settings,
+        http_client=httpx.Client(
+            transport=RecordingTransport(real_client._transport, archive),
+            headers=real_client.headers,
+            follow_redirects=False,
+        ),
+    )
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """HTTP transport that serves recorded responses.
+
+    Unrecorded URLs and recorded failures raise ``httpx.ConnectError``.
+    """
+
+    def __init__(self, archive: ReplayArchive, speed: float = 1.0):
+        self.archive = archive
+        self.speed = speed
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.archive.get("pages", str(request.url))
+        if entry is None:
+            raise httpx.ConnectError(f"No recorded response for {request.url}")
+        if self.speed > 0:
+            # Blocking like a real request, since scrapes run in worker threads
+            time.sleep(entry["elapsed"] * self.speed)
+        if "error" in entry:
+            raise httpx.ConnectError(entry["error"], request=request)
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body"]),
+            request=request,
+        )
+
+
+class ReplayScrapingService(ScrapingService):
+    """Scraping service that fetches recorded pages instead of the network.
+
+    Pages still go through the real response handling and text extraction; only
+    the transport and the DNS lookup of URL validation are replaced.
+    """
+
+    def __init__(
+        self,
+        archive: ReplayArchive,
+        speed: float = 1.0,
+        settings: Optional[ScrapingSettings] = None,
+    ):
+        super().__init__(
+            settings or ScrapingSettings(),
+            http_client=httpx.Client(transport=ReplayTransport(archive, speed)),
+        )
+
+    def _is_private_host(self, host: str) -> bool:
+        return False
@@ -0,0 +1,59 @@
+"""Local stand-in for a SearxNG instance's JSON search API.
+
+Serves ``GET /search?q=...&format=json`` with canned results whose title or
+content matches the query, so the SearxNG provider can be exercised without a
+real instance:
+
+    uv run uvicorn dev.mocks.searxng_stand_in:app --port 8888
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Query
+
+DEFAULT_RESULTS: List[Dict[str, Any]] = [
+    {
+        "title": "Python (programming language)",
+        "url": "https://en.wikipedia.org/wiki/Python_(programming_language)",
+        "content": "Python is a high-level, general-purpose programming language.",
+        "engine": "wikipedia",
+    },
+    {
+        "title": "Welcome to Python.org",
+        "url": "https://www.python.org/",
+        "content": "The official home of the Python programming language.",
+        "engine": "duckduckgo",
+    },
+    {
+        "title": "Rust Programming Language",
+        "url": "https://www.rust-lang.org/",
+        "content": "A language empowering everyone to build reliable software.",
+        "engine": "duckduckgo",
+    },
+]
+
+
+def create_app(results: Optional[List[Dict[str, Any]]] = None) -> FastAPI:
+    """Create a stand-in app serving the given results."""
+    corpus = DEFAULT_RESULTS if results is None else results
+    stand_in = FastAPI(title="SearxNG stand-in")
+
+    @stand_in.get("/search")
+    async def search(q: str = Query(...), format: str = Query("html")):
+        if format != "json":
+            raise HTTPException(status_code=403, detail="Only JSON is supported")
+        terms = q.lower().split()
+        matches = [
+            result
+            for result in corpus
+            if any(
+                term in f"{result['title']} {result['content']}".lower()
+                for term in terms
+            )
+        ]
+        return {"query": q, "number_of_results": len(matches), "results": matches}
+
+    return stand_in
+
+
+app = create_app()
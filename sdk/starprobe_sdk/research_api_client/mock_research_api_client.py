@@ -18,6 +18,18 @@ class MockResearchApiClient:
                 "https://example.com/source2",
             ],
             "source_count": 2,
+            "timings": {
+                "refine_query": {
+                    "duration": 0.02,
+                    "calls": {"llm_invoke": {"count": 1, "duration": 0.02}},
+                },
+                "conduct_web_search": {"duration": 0.05, "calls": {}},
+                "summarize_sources": {
+                    "duration": 0.03,
+                    "calls": {"llm_invoke": {"count": 1, "duration": 0.03}},
+                },
+                "finalize_summary": {"duration": 0.0, "calls": {}},
+            },
         }
         return ResearchResponse(
             success=True,
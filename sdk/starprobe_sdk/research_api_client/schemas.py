@@ -23,3 +23,12 @@ class ResearchResponse(BaseModel):
     processing_time: float = Field(
         ..., description="Time taken to process the request in seconds"
     )
+
+    @property
+    def timings(self) -> Dict[str, Any]:
+        """Seconds spent per graph node, with a count and total per call type.
+
+        Taken from ``metadata["timings"]``; empty when the server did not report
+        a breakdown.
+        """
+        return dict((self.metadata or {}).get("timings") or {})
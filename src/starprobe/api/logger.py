@@ -1,24 +1,113 @@
-"""Structured JSON logging configuration."""
+"""Structured JSON logging configuration.
 
+Log calls only put the record on a bounded in-memory queue; a background
+listener thread formats records as JSON and writes them to stdout, so a slow
+stdout never stalls request handling. When the queue is full, records are
+dropped according to the drop policy instead of blocking, and DEBUG records
+can be sampled. Dropped records are counted in
+``starprobe_log_records_dropped_total``.
+"""
+
+import atexit
 import logging
+import queue
+import random
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 from pythonjsonlogger import jsonlogger
 
+from starprobe.config import AppSettings
+from starprobe.observability.metrics import record_log_drop
+
+# The API logger and the package loggers used by services and clients
+APP_LOGGERS = ("ollama_deep_researcher", "starprobe")
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the caller.
+
+    ``drop_policy`` decides which record is lost when the queue is full:
+    ``newest`` drops the incoming record, ``oldest`` makes room for it by
+    dropping the record that has waited longest.
+    """
+
+    def __init__(self, log_queue: queue.Queue, drop_policy: str = "newest"):
+        super().__init__(log_queue)
+        if drop_policy not in ("newest", "oldest"):
+            raise ValueError(f"Unsupported log drop policy '{drop_policy}'")
+        self.drop_policy = drop_policy
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now, since they may change after the call returns;
+        # formatting is left to the listener thread
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.drop_policy == "oldest":
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        record_log_drop("queue_full")
+
 
-def setup_logger():
-    """Configure structured JSON logging."""
-    logger = logging.getLogger("ollama_deep_researcher")
-    logger.setLevel(logging.INFO)
+class DebugSamplingFilter(logging.Filter):
+    """Keeps only ``rate`` of DEBUG records, such as per-URL scrape failures."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or random.random() < self.rate:
+            return True
+        record_log_drop("sampled")
+        return False
+
+
+class _BlockingStopListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The default put_nowait would fail on a full queue; the listener drains it
+        self.queue.put(self._sentinel)
+
+
+def setup_logger(settings: Optional[AppSettings] = None) -> logging.Logger:
+    """Configure structured JSON logging through a background listener thread."""
+    settings = settings or AppSettings()
 
     handler = logging.StreamHandler(sys.stdout)
     formatter = jsonlogger.JsonFormatter(
         "%(asctime)s %(levelname)s %(name)s %(message)s"
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
 
-    return logger
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    queue_handler = DroppingQueueHandler(log_queue, settings.log_drop_policy)
+    if settings.log_debug_sample_rate < 1.0:
+        queue_handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_rate))
+
+    for name in APP_LOGGERS:
+        app_logger = logging.getLogger(name)
+        app_logger.setLevel(settings.log_level.upper())
+        app_logger.addHandler(queue_handler)
+
+    listener = _BlockingStopListener(log_queue, handler)
+    listener.start()
+    # Write out queued records when the process exits
+    atexit.register(listener.stop)
+
+    return logging.getLogger("ollama_deep_researcher")
 
 
 logger = setup_logger()
@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import tracemalloc
 from contextlib import asynccontextmanager
 from importlib import metadata
 
@@ -7,6 +8,20 @@ from fastapi import FastAPI
 
 from starprobe.api.logger import logger
 from starprobe.api.router import router
+from starprobe.dependencies import (
+    get_app_settings,
+    get_domain_policy,
+    get_scraping_service,
+    get_search_client,
+)
+from starprobe.observability import (
+    REGISTRY,
+    TRACER,
+    EventLoopMonitor,
+    configure_tracing,
+)
+from starprobe.observability.collectors import register_app_collectors
+from starprobe.services import TextProcessingService
 
 
 def get_app_version(package_name: str, fallback_version: str = "0.1.0") -> str:
@@ -33,8 +48,41 @@ def get_app_version(package_name: str, fallback_version: str = "0.1.0") -> str:
 async def lifespan(app: FastAPI):
     """Lifecycle manager for FastAPI app."""
     logger.info("Starting olm-d-rch API service")
+    app_settings = get_app_settings()
+    REGISTRY.enabled = app_settings.metrics_enabled
+    if REGISTRY.enabled:
+        register_app_collectors()
+    configure_tracing(app_settings)
+    start_tracing = (
+        app_settings.memory_tracking_enabled and not tracemalloc.is_tracing()
+    )
+    if start_tracing:
+        tracemalloc.start()
+    loop_monitor = None
+    if app_settings.loop_monitor_enabled:
+        loop_monitor = EventLoopMonitor(
+            interval=app_settings.loop_monitor_interval,
+            block_threshold=app_settings.loop_block_threshold,
+            capture_stacks=app_settings.loop_monitor_debug,
+        )
+        loop_monitor.start()
+    try:
+        TextProcessingService.get_encoding()
+    except Exception as exc:
+        logger.warning(f"Failed to warm tokenizer encoding: {exc}")
     yield
     logger.info("Shutting down olm-d-rch API service")
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    if start_tracing:
+        tracemalloc.stop()
+    TRACER.shutdown()
+    if get_search_client.cache_info().currsize:
+        await get_search_client().close()
+    if get_scraping_service.cache_info().currsize:
+        get_scraping_service().close()
+    if get_domain_policy.cache_info().currsize:
+        get_domain_policy().save()
 
 
 app = FastAPI(
@@ -2,22 +2,42 @@
 
 import asyncio
 import time
+from contextlib import nullcontext
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response
 
 from starprobe.api.logger import logger
 from starprobe.api.schemas import (
+    DomainStatsResponse,
     HealthResponse,
     ResearchRequest,
     ResearchResponse,
+    ScrapingMetricsResponse,
 )
+from starprobe.config import AppSettings
 from starprobe.dependencies import (
+    get_app_settings,
+    get_domain_policy,
     get_llm_client,
     get_prompt_service,
     get_research_service,
+    get_scraping_service,
 )
 from starprobe.graph import build_graph
-from starprobe.services import PromptService, ResearchService
+from starprobe.observability import (
+    CONTENT_TYPE,
+    PROFILES,
+    REGISTRY,
+    SamplingProfiler,
+    bind_request_id,
+    measure_request_memory,
+    profile_request,
+    server_timing_header,
+    track_request,
+)
+from starprobe.protocols import ScrapingServiceProtocol
+from starprobe.services import DomainPolicyService, PromptService, ResearchService
 
 router = APIRouter()
 
@@ -28,78 +48,209 @@ async def health_check():
     return HealthResponse(status="ok")
 
 
+@router.get("/metrics", include_in_schema=False)
+async def metrics(app_settings: AppSettings = Depends(get_app_settings)):
+    """Expose in-process metrics in the Prometheus text format."""
+    if not app_settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+def _require_domain_admin(app_settings: AppSettings) -> None:
+    if not app_settings.domain_admin_enabled:
+        raise HTTPException(status_code=404, detail="Domain admin is disabled")
+
+
+@router.get("/admin/domains", response_model=DomainStatsResponse)
+async def list_domain_stats(
+    domain_policy: DomainPolicyService = Depends(get_domain_policy),
+    app_settings: AppSettings = Depends(get_app_settings),
+):
+    """Inspect per-domain scrape stats and the policy decision for each domain."""
+    _require_domain_admin(app_settings)
+    return DomainStatsResponse(domains=domain_policy.all_stats())
+
+
+@router.delete("/admin/domains/{domain}", response_model=DomainStatsResponse)
+async def reset_domain_stats(
+    domain: str,
+    domain_policy: DomainPolicyService = Depends(get_domain_policy),
+    app_settings: AppSettings = Depends(get_app_settings),
+):
+    """Forget a domain's stats so that it is scraped normally again."""
+    _require_domain_admin(app_settings)
+    if not domain_policy.reset(domain):
+        raise HTTPException(status_code=404, detail=f"No stats for domain '{domain}'")
+    return DomainStatsResponse(domains=domain_policy.all_stats())
+
+
+@router.get("/admin/scraping", response_model=ScrapingMetricsResponse)
+async def scraping_metrics(
+    scraping_service: ScrapingServiceProtocol = Depends(get_scraping_service),
+    app_settings: AppSettings = Depends(get_app_settings),
+):
+    """Inspect scraper request counters and connection pool usage."""
+    if not app_settings.scraping_admin_enabled:
+        raise HTTPException(status_code=404, detail="Scraping admin is disabled")
+    metrics = getattr(scraping_service, "metrics", None)
+    return ScrapingMetricsResponse(metrics=metrics() if metrics else {})
+
+
+def _require_profiler(app_settings: AppSettings) -> None:
+    if not app_settings.profiler_enabled:
+        raise HTTPException(status_code=404, detail="The profiler is disabled")
+
+
+@router.get("/admin/profile", include_in_schema=False)
+async def profile_worker(
+    seconds: float = Query(5.0, gt=0, description="How long to sample"),
+    app_settings: AppSettings = Depends(get_app_settings),
+):
+    """Sample every thread of this worker and return collapsed stacks."""
+    _require_profiler(app_settings)
+    if seconds > app_settings.profiler_max_seconds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Profiles are limited to {app_settings.profiler_max_seconds}s",
+        )
+    profiler = SamplingProfiler(app_settings.profiler_interval)
+    profiler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        collapsed = profiler.stop()
+    return Response(content=collapsed, media_type="text/plain")
+
+
+@router.get("/admin/profile/{request_id}", include_in_schema=False)
+async def request_profile(
+    request_id: str,
+    app_settings: AppSettings = Depends(get_app_settings),
+):
+    """Return the collapsed stacks of a /research request sent with X-Profile."""
+    _require_profiler(app_settings)
+    collapsed = PROFILES.get(request_id)
+    if collapsed is None:
+        raise HTTPException(
+            status_code=404, detail=f"No profile for request '{request_id}'"
+        )
+    return Response(content=collapsed, media_type="text/plain")
+
+
+def _attach_memory_report(result: dict, memory: dict) -> None:
+    """Add request memory to the metadata and its allocation sites to diagnostics."""
+    if result.get("metadata") is not None:
+        result["metadata"].setdefault("memory", {}).update(
+            peak_kib=memory["peak_kib"], retained_kib=memory["retained_kib"]
+        )
+    result["diagnostics"] = [
+        *result.get("diagnostics", []),
+        *(f"Top allocation: {site}" for site in memory["top_allocations"]),
+    ]
+
+
 @router.post("/research", response_model=ResearchResponse)
 async def run_research(
     request: ResearchRequest,
+    http_response: Response,
     prompt_service: PromptService = Depends(get_prompt_service),
     research_service: ResearchService = Depends(get_research_service),
     llm_client=Depends(get_llm_client),
+    app_settings: AppSettings = Depends(get_app_settings),
+    x_profile: bool = Header(False, include_in_schema=False),
 ):
     """Execute deep research on a given topic."""
-    start_time = time.time()
-    logger.info(
-        "Research request received",
-        extra={"query": request.query},
-    )
+    profile = x_profile and app_settings.profiler_enabled
+    with (
+        bind_request_id() as request_id,
+        profile_request(app_settings.profiler_interval) if profile else nullcontext(),
+    ):
+        http_response.headers["X-Request-ID"] = request_id
+        start_time = time.time()
+        logger.info(
+            "Research request received",
+            extra={"request_id": request_id, "query": request.query},
+        )
 
-    try:
-        # Build graph with injected services
-        graph = build_graph(prompt_service, research_service, llm_client)
+        try:
+            # Build graph with injected services
+            graph = build_graph(prompt_service, research_service, llm_client)
 
-        # Execute graph with timeout
-        result = await asyncio.wait_for(
-            graph.ainvoke({"research_topic": request.query}),
-            timeout=300.0,  # 5-minute timeout
-        )
+            # Execute graph with timeout
+            with (
+                track_request("research"),
+                measure_request_memory(app_settings.memory_top_allocations) as memory,
+            ):
+                result = await asyncio.wait_for(
+                    graph.ainvoke({"research_topic": request.query}),
+                    timeout=300.0,  # 5-minute timeout
+                )
+            if memory:
+                _attach_memory_report(result, memory)
 
-        # Map graph output to API response
-        response = ResearchResponse(
-            success=result.get("success", False),
-            article=result.get("article"),
-            metadata=result.get("metadata"),
-            error_message=result.get("error_message"),
-            diagnostics=result.get("diagnostics", []),
-            processing_time=time.time() - start_time,
-        )
+            # Map graph output to API response
+            response = ResearchResponse(
+                success=result.get("success", False),
+                article=result.get("article"),
+                metadata=result.get("metadata"),
+                error_message=result.get("error_message"),
+                diagnostics=result.get("diagnostics", []),
+                processing_time=time.time() - start_time,
+            )
+            timings = (response.metadata or {}).get("timings")
+            http_response.headers["Server-Timing"] = server_timing_header(
+                timings, response.processing_time
+            )
 
-        logger.info(
-            "Research completed",
-            extra={
-                "query": request.query,
-                "success": response.success,
-                "article_length": len(response.article) if response.article else 0,
-                "error_message": response.error_message,
-                "diagnostics": response.diagnostics,
-                "processing_time": response.processing_time,
-            },
-        )
+            logger.info(
+                "Research completed",
+                extra={
+                    "request_id": request_id,
+                    "query": request.query,
+                    "success": response.success,
+                    "article_length": len(response.article) if response.article else 0,
+                    "error_message": response.error_message,
+                    "diagnostics": response.diagnostics,
+                    "processing_time": response.processing_time,
+                    "timings": timings,
+                },
+            )
 
-        return response
+            return response
 
-    except asyncio.TimeoutError:
-        logger.error(
-            "Research timeout",
-            extra={"query": request.query},
-        )
-        return ResearchResponse(
-            success=False,
-            article=None,
-            metadata=None,
-            error_message="Research request exceeded 5-minute timeout",
-            processing_time=time.time() - start_time,
-        )
-    except Exception as e:
-        logger.error(
-            "Research failed",
-            extra={
-                "query": request.query,
-                "error": str(e),
-            },
-        )
-        return ResearchResponse(
-            success=False,
-            article=None,
-            metadata=None,
-            error_message=f"Internal error: {str(e)}",
-            processing_time=time.time() - start_time,
-        )
+        except asyncio.TimeoutError:
+            logger.error(
+                "Research timeout",
+                extra={"request_id": request_id, "query": request.query},
+            )
+            processing_time = time.time() - start_time
+            http_response.headers["Server-Timing"] = server_timing_header(
+                None, processing_time
+            )
+            return ResearchResponse(
+                success=False,
+                article=None,
+                metadata=None,
+                error_message="Research request exceeded 5-minute timeout",
+                processing_time=processing_time,
+            )
+        except Exception as e:
+            logger.error(
+                "Research failed",
+                extra={
+                    "request_id": request_id,
+                    "query": request.query,
+                    "error": str(e),
+                },
+            )
+            processing_time = time.time() - start_time
+            http_response.headers["Server-Timing"] = server_timing_header(
+                None, processing_time
+            )
+            return ResearchResponse(
+                success=False,
+                article=None,
+                metadata=None,
+                error_message=f"Internal error: {str(e)}",
+                processing_time=processing_time,
+            )
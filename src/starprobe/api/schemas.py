@@ -31,6 +31,37 @@ class ResearchResponse(BaseModel):
     )
 
 
+class DomainStats(BaseModel):
+    """Scrape stats and current policy decision for one domain."""
+
+    samples: int = Field(..., description="Number of recent scrapes the stats cover")
+    success_rate: float = Field(..., description="Share of scrapes that succeeded")
+    latency_p50: float = Field(..., description="Median scrape latency in seconds")
+    latency_p95: float = Field(..., description="95th percentile latency in seconds")
+    bytes_p50: float = Field(..., description="Median response size of successes")
+    useful_tokens_p50: float = Field(
+        ..., description="Median number of text tokens extracted by successes"
+    )
+    decision: str = Field(..., description="Policy decision: scrape, snippet or skip")
+
+
+class DomainStatsResponse(BaseModel):
+    """Response model for the domain stats admin endpoints."""
+
+    domains: Dict[str, DomainStats] = Field(
+        default_factory=dict, description="Stats keyed by domain"
+    )
+
+
+class ScrapingMetricsResponse(BaseModel):
+    """Response model for the scraping metrics admin endpoint."""
+
+    metrics: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Request counters and connection pool usage of the scraper",
+    )
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
 
@@ -1,5 +1,13 @@
 from .ddgs_client import DdgsClient
+from .federated_search_client import FederatedSearchClient
+from .local_corpus_client import LocalCorpusClient
+from .rate_limiter import AdaptiveTokenBucket
+from .searxng_client import SearxngClient
 
 __all__ = [
+    "AdaptiveTokenBucket",
     "DdgsClient",
+    "FederatedSearchClient",
+    "LocalCorpusClient",
+    "SearxngClient",
 ]
@@ -1,42 +1,141 @@
 import asyncio
 import logging
-from typing import Any, Dict, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from ddgs import DDGS
-from ddgs.exceptions import DDGSException
+from ddgs.exceptions import DDGSException, RatelimitException
 
 from ..config.ddgs_settings import DDGSSettings
+from ..observability.metrics import track_call
+from ..observability.tracing import set_span_attributes
 from ..protocols.ddgs_client_protocol import DDGSClientProtocol
+from .rate_limiter import AdaptiveTokenBucket
 
 logger = logging.getLogger(__name__)
 
 
 class DdgsClient(DDGSClientProtocol):
-    """Client for performing web searches using DuckDuckGo via the ddgs library."""
+    """Client for performing web searches using DuckDuckGo via the ddgs library.
 
-    def __init__(self, settings: DDGSSettings) -> None:
+    The blocking ddgs calls run on a thread pool owned by the client, sized by
+    ``ddgs_max_workers``, so they never queue behind unrelated work on the
+    default executor. Calls beyond ``ddgs_max_queue`` waiting searches are
+    rejected, and each call is bounded by ``ddgs_timeout``.
+
+    Calls are paced by an adaptive token bucket that backs off exponentially on
+    rate-limit errors. Pass a shared limiter to pace every client in the process
+    together; otherwise the client creates its own from the settings.
+    """
+
+    def __init__(
+        self,
+        settings: DDGSSettings,
+        rate_limiter: Optional[AdaptiveTokenBucket] = None,
+    ) -> None:
         self.settings = settings
+        self.rate_limiter = rate_limiter or create_rate_limiter(settings)
         self._ddgs = DDGS()
+        self._max_workers = max(settings.ddgs_max_workers, 1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="ddgs"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._calls = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
 
     async def search(
         self, query: str, max_results: int = 3
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Search the web using DuckDuckGo and return formatted results."""
+        if not await self.rate_limiter.acquire(self.settings.ddgs_rate_limit_max_wait):
+            logger.error(
+                "DuckDuckGo rate limiter had no capacity within %.1fs, skipping '%s'",
+                self.settings.ddgs_rate_limit_max_wait,
+                query,
+            )
+            return {"results": []}
+
+        with self._lock:
+            if self._queued >= self.settings.ddgs_max_queue:
+                self._rejected += 1
+                rejected = True
+            else:
+                self._queued += 1
+                rejected = False
+        if rejected:
+            logger.error(
+                "DuckDuckGo search queue is full (%d waiting), skipping '%s'",
+                self.settings.ddgs_max_queue,
+                query,
+            )
+            return {"results": []}
+
+        started = time.perf_counter()
+        future = None
         try:
-            raw_results = await asyncio.to_thread(
-                self._ddgs.text,
+            # Inside the try so that a failed submit, e.g. after close(),
+            # still releases the queue slot
+            future = self._executor.submit(
+                self._run_text,
                 query,
                 region=self.settings.ddgs_region,
                 safesearch=self.settings.ddgs_safesearch,
                 max_results=max_results,
             )
+            with track_call("ddgs_search"):
+                set_span_attributes(
+                    {
+                        "starprobe.search.query": query,
+                        "starprobe.search.limit": max_results,
+                    }
+                )
+                raw_results = await asyncio.wait_for(
+                    asyncio.wrap_future(future), timeout=self.settings.ddgs_timeout
+                )
+                set_span_attributes(
+                    {"starprobe.search.results": len(raw_results or [])}
+                )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            logger.error(
+                "DuckDuckGo search timed out after %.1fs for '%s'",
+                self.settings.ddgs_timeout,
+                query,
+            )
+            return {"results": []}
+        except RatelimitException as exc:
+            backoff = self.rate_limiter.record_rate_limited()
+            logger.error(
+                "DuckDuckGo rate limit hit, backing off for %.1fs: %s", backoff, exc
+            )
+            return {"results": []}
         except DDGSException as exc:
             logger.error("Error querying DuckDuckGo: %s", exc)
             return {"results": []}
         except Exception as exc:  # pragma: no cover - defensive catch-all
             logger.error("Unexpected error during DuckDuckGo search: %s", exc)
             return {"results": []}
+        finally:
+            # Cancelling the awaiting task also cancels the call if it has not started
+            if future is None or future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            latency = time.perf_counter() - started
+            with self._lock:
+                self._calls += 1
+                self._latency_sum += latency
+                self._latency_max = max(self._latency_max, latency)
 
+        self.rate_limiter.record_success()
         if not raw_results:
             return {"results": []}
 
@@ -62,6 +161,45 @@ class DdgsClient(DDGSClientProtocol):
 
         return {"results": formatted_results}
 
+    def metrics(self) -> Dict[str, float]:
+        """Return a snapshot of the executor, latency and rate limiter metrics."""
+        limiter_state = {
+            f"rate_limiter_{key}": value
+            for key, value in self.rate_limiter.state().items()
+        }
+        with self._lock:
+            return {
+                **limiter_state,
+                "queue_depth": self._queued,
+                "active_threads": self._active,
+                "max_workers": self._max_workers,
+                "calls_total": self._calls,
+                "timeouts_total": self._timeouts,
+                "rejected_total": self._rejected,
+                "latency_seconds_sum": self._latency_sum,
+                "latency_seconds_max": self._latency_max,
+            }
+
     async def close(self) -> None:
-        """Close the client. DDGS does not require explicit cleanup."""
-        pass
+        """Shut down the thread pool, cancelling searches that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_text(self, query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return self._ddgs.text(query, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+def create_rate_limiter(settings: DDGSSettings) -> AdaptiveTokenBucket:
+    """Create the DuckDuckGo rate limiter described by the settings."""
+    return AdaptiveTokenBucket(
+        rate=settings.ddgs_rate_limit_per_second,
+        capacity=settings.ddgs_rate_limit_burst,
+        initial_backoff=settings.ddgs_backoff_initial,
+        max_backoff=settings.ddgs_backoff_max,
+    )
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..config.search_settings import SearchSettings
+from ..protocols.ddgs_client_protocol import DDGSClientProtocol
+from ..services.url_canonicalization_service import UrlCanonicalizationService
+
+logger = logging.getLogger(__name__)
+
+
+class FederatedSearchClient(DDGSClientProtocol):
+    """Search client that fans a query out to several providers.
+
+    Every provider is queried concurrently with its own timeout, so a slow or
+    throttled provider only loses its own results. Results are interleaved by
+    rank across providers and deduplicated by canonical URL.
+    """
+
+    def __init__(
+        self,
+        providers: Dict[str, DDGSClientProtocol],
+        settings: SearchSettings,
+        canonicalizer: Optional[UrlCanonicalizationService] = None,
+    ) -> None:
+        self.providers = providers
+        self.settings = settings
+        self.canonicalizer = canonicalizer or UrlCanonicalizationService.default()
+
+    async def search(
+        self, query: str, max_results: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search all providers and return the merged results."""
+        names = list(self.providers)
+        responses = await asyncio.gather(
+            *(self._search_provider(name, query, max_results) for name in names)
+        )
+
+        merged: List[Dict[str, Any]] = []
+        seen_urls: set[str] = set()
+        for rank in range(max((len(results) for results in responses), default=0)):
+            for results in responses:
+                if rank >= len(results):
+                    continue
+                result = results[rank]
+                key = self.canonicalizer.canonicalize(result.get("url", ""))
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
+                merged.append(result)
+
+        return {"results": merged[:max_results]}
+
+    async def close(self) -> None:
+        """Close every provider client."""
+        await asyncio.gather(
+            *(provider.close() for provider in self.providers.values()),
+            return_exceptions=True,
+        )
+
+    async def _search_provider(
+        self, name: str, query: str, max_results: int
+    ) -> List[Dict[str, Any]]:
+        timeout = self.settings.timeout_for(name)
+        try:
+            response = await asyncio.wait_for(
+                self.providers[name].search(query, max_results=max_results),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Search provider '%s' timed out after %.1fs", name, timeout)
+            return []
+        except Exception as exc:
+            logger.error("Search provider '%s' failed: %s", name, exc)
+            return []
+        return [result for result in response.get("results", []) if result.get("url")]
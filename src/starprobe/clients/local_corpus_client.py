@@ -0,0 +1,99 @@
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config.search_settings import SearchSettings
+from ..protocols.ddgs_client_protocol import DDGSClientProtocol
+from ..services.text_processing_service import Bm25Index
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class LocalCorpusClient(DDGSClientProtocol):
+    """Search client over a local corpus of documents, ranked with BM25.
+
+    The corpus is a JSON Lines file where each line holds ``title``, ``url`` and
+    ``content``. It is loaded and indexed once when the client is created. The
+    full document text is returned as the result content, so these results do
+    not depend on scraping.
+    """
+
+    def __init__(
+        self,
+        settings: SearchSettings,
+        documents: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self.settings = settings
+        if documents is None:
+            documents = self._load_documents(settings.local_corpus_path)
+        self._documents = [
+            document
+            for document in documents
+            if document.get("url") and document.get("title")
+        ]
+        self._index = Bm25Index(
+            [
+                _WORD_PATTERN.findall(
+                    f"{document['title']} {document.get('content', '')}".lower()
+                )
+                for document in self._documents
+            ]
+        )
+
+    async def search(
+        self, query: str, max_results: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the corpus documents that best match the query."""
+        terms = set(_WORD_PATTERN.findall((query or "").lower()))
+        if not terms or not self._documents:
+            return {"results": []}
+
+        scores = self._index.score(terms)
+        ranked = sorted(
+            (index for index, score in enumerate(scores) if score > 0),
+            key=lambda index: (-scores[index], index),
+        )
+
+        results = []
+        for index in ranked[:max_results]:
+            document = self._documents[index]
+            content = document.get("content") or ""
+            results.append(
+                {
+                    "title": document["title"],
+                    "url": document["url"],
+                    "content": content,
+                    "raw_content": content,
+                }
+            )
+        return {"results": results}
+
+    async def close(self) -> None:
+        """Close the client. The in-memory index needs no cleanup."""
+        pass
+
+    @staticmethod
+    def _load_documents(path: str) -> List[Dict[str, Any]]:
+        if not path:
+            return []
+        corpus_path = Path(path)
+        if not corpus_path.is_file():
+            logger.warning("Local corpus file not found: %s", path)
+            return []
+
+        documents = []
+        with corpus_path.open(encoding="utf-8") as corpus_file:
+            for line_number, line in enumerate(corpus_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    documents.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Skipping invalid line %d in local corpus %s", line_number, path
+                    )
+        return documents
@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+
+class AdaptiveTokenBucket:
+    """Token-bucket rate limiter with adaptive exponential backoff.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. Callers reserve the
+    next free slot and sleep until it arrives, so a burst of searches is spread
+    out in arrival order instead of failing. Each reported rate-limit error
+    doubles a backoff window during which no tokens are handed out and halves
+    the refill rate; successful calls clear the backoff and let the rate
+    recover gradually. State is guarded by a thread lock, so one instance can be
+    shared by every request in the process.
+    """
+
+    # Share of the base rate regained after each successful call
+    RECOVERY_STEP = 0.1
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        min_rate_ratio: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.base_rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1)
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.min_rate = self.base_rate * min_rate_ratio
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = self.base_rate
+        # Theoretical arrival time of the next token (GCRA formulation)
+        self._next_token_at = clock()
+        self._blocked_until = 0.0
+        self._backoff = 0.0
+        self._waiting = 0
+        self._acquired = 0
+        self._rate_limited = 0
+        self._wait_seconds_sum = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Return the current refill rate in tokens per second."""
+        return self._rate
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """
+        Reserve the next token.
+
+        Returns:
+            Optional[float]: Seconds to wait before using the token, or None when
+            the wait would exceed ``max_wait`` (nothing is reserved then)
+        """
+        reservation = self._reserve(max_wait)
+        return reservation[0] if reservation is not None else None
+
+    def _reserve(self, max_wait: float) -> Optional[Tuple[float, float]]:
+        # Returns the delay and the interval the reservation took from the bucket
+        with self._lock:
+            now = self._clock()
+            interval = 1 / self._rate
+            tolerance = (self.capacity - 1) * interval
+            earliest = max(now, self._blocked_until)
+            start = max(earliest, self._next_token_at - tolerance)
+            if start - now > max_wait:
+                return None
+            self._next_token_at = max(self._next_token_at, earliest) + interval
+            return start - now, interval
+
+    def _release(self, interval: float) -> None:
+        # Give an unused reservation back so it does not delay later callers
+        with self._lock:
+            self._next_token_at -= interval
+
+    async def acquire(self, max_wait: float) -> bool:
+        """
+        Wait for capacity to perform one call.
+
+        Args:
+            max_wait: Longest time to wait for a token, in seconds
+
+        Returns:
+            bool: True once a token was acquired, False if the wait would exceed
+            ``max_wait``
+        """
+        reservation = self._reserve(max_wait)
+        if reservation is None:
+            return False
+        delay, interval = reservation
+
+        with self._lock:
+            self._waiting += 1
+        try:
+            waited = 0.0
+            while delay > 0:
+                if waited + delay > max_wait:
+                    self._release(interval)
+                    return False
+                await asyncio.sleep(delay)
+                waited += delay
+                # A rate-limit error reported meanwhile pushes the slot back
+                with self._lock:
+                    delay = self._blocked_until - self._clock()
+            with self._lock:
+                self._acquired += 1
+                self._wait_seconds_sum += waited
+            return True
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def record_rate_limited(self) -> float:
+        """Back off after a rate-limit error and return the new backoff in seconds."""
+        with self._lock:
+            self._rate_limited += 1
+            self._backoff = min(
+                self.max_backoff, self._backoff * 2 or self.initial_backoff
+            )
+            self._blocked_until = max(
+                self._blocked_until, self._clock() + self._backoff
+            )
+            self._rate = max(self.min_rate, self._rate / 2)
+            return self._backoff
+
+    def record_success(self) -> None:
+        """Clear the backoff and let the rate recover towards its base value."""
+        with self._lock:
+            self._backoff = 0.0
+            self._rate = min(
+                self.base_rate, self._rate + self.base_rate * self.RECOVERY_STEP
+            )
+
+    def state(self) -> Dict[str, float]:
+        """Return a snapshot of the limiter state."""
+        with self._lock:
+            now = self._clock()
+            interval = 1 / self._rate
+            available = (now - self._next_token_at) / interval + self.capacity
+            return {
+                "rate": self._rate,
+                "base_rate": self.base_rate,
+                "capacity": self.capacity,
+                "available_tokens": max(0.0, min(float(self.capacity), available)),
+                "backoff_seconds": self._backoff,
+                "blocked_for_seconds": max(0.0, self._blocked_until - now),
+                "waiting": self._waiting,
+                "acquired_total": self._acquired,
+                "rate_limited_total": self._rate_limited,
+                "wait_seconds_sum": self._wait_seconds_sum,
+            }
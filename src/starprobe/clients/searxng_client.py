@@ -0,0 +1,74 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from ..config.search_settings import SearchSettings
+from ..observability.metrics import track_call
+from ..observability.tracing import set_span_attributes
+from ..protocols.ddgs_client_protocol import DDGSClientProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class SearxngClient(DDGSClientProtocol):
+    """Client for a SearxNG-compatible search endpoint returning JSON results."""
+
+    def __init__(
+        self,
+        settings: SearchSettings,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        self.settings = settings
+        self._search_url = f"{settings.searxng_base_url.rstrip('/')}/search"
+        self._client = http_client or httpx.AsyncClient(
+            timeout=settings.timeout_for("searxng")
+        )
+
+    async def search(
+        self, query: str, max_results: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search the SearxNG endpoint and return formatted results."""
+        try:
+            with track_call("searxng_search"):
+                set_span_attributes({"starprobe.search.query": query})
+                response = await self._client.get(
+                    self._search_url, params={"q": query, "format": "json"}
+                )
+                set_span_attributes(
+                    {
+                        "http.response.status_code": response.status_code,
+                        "http.response.body.size": len(response.content),
+                    }
+                )
+                response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.error("Error querying SearxNG: %s", exc)
+            return {"results": []}
+
+        formatted_results: List[Dict[str, Any]] = []
+        for raw in payload.get("results", []):
+            title = raw.get("title")
+            url = raw.get("url")
+            if not url or not title:
+                logger.debug("Skipping incomplete SearxNG result: %s", raw)
+                continue
+
+            formatted_results.append(
+                {
+                    "title": title,
+                    "url": url,
+                    "content": raw.get("content") or "",
+                    # Leave raw_content empty so ResearchService will scrape
+                    "raw_content": "",
+                }
+            )
+            if len(formatted_results) >= max_results:
+                break
+
+        return {"results": formatted_results}
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
@@ -2,6 +2,8 @@ from .app_settings import AppSettings
 from .ddgs_settings import DDGSSettings
 from .nexus_settings import NexusSettings
 from .scraping_settings import ScrapingSettings
+from .search_settings import SearchSettings
+from .url_settings import UrlSettings
 from .workflow_settings import WorkflowSettings
 
 # Singleton instances
@@ -9,6 +11,8 @@ app_settings = AppSettings()
 nexus_settings = NexusSettings()
 ddgs_settings = DDGSSettings()
 scraping_settings = ScrapingSettings()
+search_settings = SearchSettings()
+url_settings = UrlSettings()
 workflow_settings = WorkflowSettings()
 
 __all__ = [
@@ -17,6 +21,8 @@ __all__ = [
     "NexusSettings",
     "DDGSSettings",
     "ScrapingSettings",
+    "SearchSettings",
+    "UrlSettings",
     "WorkflowSettings",
     "AppSettings",
     # Singletons
@@ -24,5 +30,7 @@ __all__ = [
     "nexus_settings",
     "ddgs_settings",
     "scraping_settings",
+    "search_settings",
+    "url_settings",
     "workflow_settings",
 ]
@@ -1,3 +1,6 @@
+from typing import Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,3 +13,132 @@ class AppSettings(BaseSettings):
         extra="ignore",
         populate_by_name=True,
     )
+
+    metrics_enabled: bool = Field(
+        default=True,
+        title="Metrics Enabled",
+        description="Record in-process metrics and serve them at /metrics",
+        alias="STARPROBE_METRICS_ENABLED",
+    )
+    loop_monitor_enabled: bool = Field(
+        default=True,
+        title="Event Loop Monitor Enabled",
+        description="Sample event-loop lag and export it as a metric",
+        alias="STARPROBE_LOOP_MONITOR_ENABLED",
+    )
+    loop_monitor_interval: float = Field(
+        default=0.1,
+        gt=0,
+        title="Event Loop Monitor Interval",
+        description="Seconds between event-loop lag samples",
+        alias="STARPROBE_LOOP_MONITOR_INTERVAL",
+    )
+    loop_monitor_debug: bool = Field(
+        default=False,
+        title="Event Loop Monitor Debug",
+        description="Log the stack and request id of callbacks that block the loop",
+        alias="STARPROBE_LOOP_MONITOR_DEBUG",
+    )
+    loop_block_threshold: float = Field(
+        default=0.25,
+        gt=0,
+        title="Event Loop Block Threshold",
+        description="Seconds the loop may be blocked before it is reported",
+        alias="STARPROBE_LOOP_BLOCK_THRESHOLD",
+    )
+    domain_admin_enabled: bool = Field(
+        default=False,
+        title="Domain Admin Enabled",
+        description="Serve the domain scrape stats at /admin/domains, including resets",
+        alias="STARPROBE_DOMAIN_ADMIN_ENABLED",
+    )
+    scraping_admin_enabled: bool = Field(
+        default=False,
+        title="Scraping Admin Enabled",
+        description="Serve scraper request counters and pool usage at /admin/scraping",
+        alias="STARPROBE_SCRAPING_ADMIN_ENABLED",
+    )
+    profiler_enabled: bool = Field(
+        default=False,
+        title="Profiler Enabled",
+        description="Serve the sampling profiler at /admin/profile",
+        alias="STARPROBE_PROFILER_ENABLED",
+    )
+    profiler_interval: float = Field(
+        default=0.005,
+        gt=0,
+        title="Profiler Interval",
+        description="Seconds between profiler samples",
+        alias="STARPROBE_PROFILER_INTERVAL",
+    )
+    profiler_max_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        title="Profiler Max Seconds",
+        description="Longest profile that /admin/profile will record",
+        alias="STARPROBE_PROFILER_MAX_SECONDS",
+    )
+    memory_tracking_enabled: bool = Field(
+        default=False,
+        title="Memory Tracking Enabled",
+        description="Trace allocations with tracemalloc and report memory per request",
+        alias="STARPROBE_MEMORY_TRACKING_ENABLED",
+    )
+    memory_top_allocations: int = Field(
+        default=5,
+        ge=0,
+        title="Memory Top Allocations",
+        description="Allocation sites listed in the diagnostics of each request",
+        alias="STARPROBE_MEMORY_TOP_ALLOCATIONS",
+    )
+    log_level: str = Field(
+        default="INFO",
+        title="Log Level",
+        description="Level of the API and starprobe package loggers",
+        alias="STARPROBE_LOG_LEVEL",
+    )
+    log_queue_size: int = Field(
+        default=10000,
+        gt=0,
+        title="Log Queue Size",
+        description="Records waiting to be written before new records are dropped",
+        alias="STARPROBE_LOG_QUEUE_SIZE",
+    )
+    log_drop_policy: Literal["newest", "oldest"] = Field(
+        default="newest",
+        title="Log Drop Policy",
+        description="Record dropped when the log queue is full",
+        alias="STARPROBE_LOG_DROP_POLICY",
+    )
+    log_debug_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        title="Log Debug Sample Rate",
+        description="Share of DEBUG records that are kept",
+        alias="STARPROBE_LOG_DEBUG_SAMPLE_RATE",
+    )
+    tracing_exporter: Literal["none", "jsonl", "otlp"] = Field(
+        default="none",
+        title="Tracing Exporter",
+        description="Where spans are exported: nowhere, a JSONL file or an OTLP collector",
+        alias="STARPROBE_TRACING_EXPORTER",
+    )
+    tracing_jsonl_path: str = Field(
+        default=".starprobe/traces.jsonl",
+        title="Tracing JSONL Path",
+        description="File that the jsonl exporter appends OTLP/JSON batches to",
+        alias="STARPROBE_TRACING_JSONL_PATH",
+    )
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318/v1/traces",
+        title="Tracing OTLP Endpoint",
+        description="OTLP/HTTP traces endpoint of the collector",
+        alias="STARPROBE_TRACING_OTLP_ENDPOINT",
+    )
+    tracing_service_name: str = Field(
+        default="starprobe",
+        title="Tracing Service Name",
+        description="service.name resource attribute of exported spans",
+        alias="STARPROBE_TRACING_SERVICE_NAME",
+    )
@@ -30,6 +30,54 @@ class DDGSSettings(BaseSettings):
         description="Maximum number of results to fetch from DuckDuckGo per query",
         alias="DDGS_MAX_RESULTS",
     )
+    ddgs_max_workers: int = Field(
+        default=4,
+        title="DDGS Max Workers",
+        description="Number of threads dedicated to blocking DuckDuckGo calls",
+        alias="DDGS_MAX_WORKERS",
+    )
+    ddgs_max_queue: int = Field(
+        default=32,
+        title="DDGS Max Queue",
+        description="Maximum number of searches waiting for a DDGS thread before new ones are rejected",
+        alias="DDGS_MAX_QUEUE",
+    )
+    ddgs_timeout: float = Field(
+        default=15.0,
+        title="DDGS Timeout",
+        description="Timeout in seconds for a single DuckDuckGo search call",
+        alias="DDGS_TIMEOUT",
+    )
+    ddgs_rate_limit_per_second: float = Field(
+        default=1.0,
+        title="DDGS Rate Limit Per Second",
+        description="Sustained number of DuckDuckGo calls per second allowed across the process",
+        alias="DDGS_RATE_LIMIT_PER_SECOND",
+    )
+    ddgs_rate_limit_burst: int = Field(
+        default=3,
+        title="DDGS Rate Limit Burst",
+        description="Number of DuckDuckGo calls that may be made back to back before pacing starts",
+        alias="DDGS_RATE_LIMIT_BURST",
+    )
+    ddgs_rate_limit_max_wait: float = Field(
+        default=30.0,
+        title="DDGS Rate Limit Max Wait",
+        description="Longest time in seconds a search waits for rate limiter capacity before giving up",
+        alias="DDGS_RATE_LIMIT_MAX_WAIT",
+    )
+    ddgs_backoff_initial: float = Field(
+        default=2.0,
+        title="DDGS Backoff Initial",
+        description="Backoff in seconds after the first rate-limit error; doubles on each further error",
+        alias="DDGS_BACKOFF_INITIAL",
+    )
+    ddgs_backoff_max: float = Field(
+        default=60.0,
+        title="DDGS Backoff Max",
+        description="Upper bound in seconds for the rate-limit backoff",
+        alias="DDGS_BACKOFF_MAX",
+    )
     use_mock_search: bool = Field(
         default=False,
         title="Use Mock Search Client",
@@ -22,6 +22,76 @@ class ScrapingSettings(BaseSettings):
         title="Scraping Read Timeout",
         description="Timeout in seconds for reading response during scraping",
     )
+    scraping_max_connections: int = Field(
+        default=100,
+        title="Scraping Max Connections",
+        description="Maximum number of concurrent connections in the scraping connection pool",
+    )
+    scraping_max_keepalive_connections: int = Field(
+        default=20,
+        title="Scraping Max Keep-Alive Connections",
+        description="Maximum number of idle connections kept alive for reuse",
+    )
+    scraping_keepalive_expiry: float = Field(
+        default=30.0,
+        title="Scraping Keep-Alive Expiry",
+        description="Seconds an idle connection is kept alive before it is closed",
+    )
+    scraping_http2: bool = Field(
+        default=True,
+        title="Scraping HTTP/2",
+        description="Use HTTP/2 multiplexing where the server supports it (requires the h2 package)",
+    )
+    scraping_domain_policy_enabled: bool = Field(
+        default=True,
+        title="Domain Policy Enabled",
+        description="Use per-domain scrape stats to decide whether to scrape, use the snippet, or skip a result",
+    )
+    scraping_domain_stats_path: str = Field(
+        default="",
+        title="Domain Stats Path",
+        description="File where per-domain scrape stats are persisted across restarts (empty keeps them in memory only)",
+    )
+    scraping_domain_stats_window: int = Field(
+        default=50,
+        title="Domain Stats Window",
+        description="Number of most recent scrapes per domain the stats are computed from",
+    )
+    scraping_domain_stats_save_interval: int = Field(
+        default=20,
+        title="Domain Stats Save Interval",
+        description="Save the stats file after this many new samples (0 saves only on shutdown)",
+    )
+    scraping_policy_min_samples: int = Field(
+        default=5,
+        title="Policy Min Samples",
+        description="Scrapes needed before the policy acts on a domain's stats",
+    )
+    scraping_policy_skip_success_rate: float = Field(
+        default=0.1,
+        title="Policy Skip Success Rate",
+        description="Results from domains with a lower success rate are skipped",
+    )
+    scraping_policy_min_success_rate: float = Field(
+        default=0.5,
+        title="Policy Min Success Rate",
+        description="Results from domains with a lower success rate use the search snippet",
+    )
+    scraping_policy_max_latency_p95: float = Field(
+        default=10.0,
+        title="Policy Max Latency p95",
+        description="Results from domains with a slower p95 latency in seconds use the search snippet",
+    )
+    scraping_policy_min_useful_tokens: int = Field(
+        default=50,
+        title="Policy Min Useful Tokens",
+        description="Results from domains whose median successful scrape extracts fewer tokens use the search snippet",
+    )
+    scraping_policy_explore_rate: float = Field(
+        default=0.1,
+        title="Policy Explore Rate",
+        description="Share of snippet or skip decisions that scrape anyway so domain stats stay current",
+    )
     use_mock_scraping: bool = Field(
         default=False,
         title="Use Mock Scraping Service",
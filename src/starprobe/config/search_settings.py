@@ -0,0 +1,60 @@
+from typing import Dict
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SearchSettings(BaseSettings):
+    """Settings for the search providers used by the federated search client."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        populate_by_name=True,
+    )
+
+    search_providers: str = Field(
+        default="ddgs",
+        title="Search Providers",
+        description="Comma-separated search providers to query: ddgs, searxng, local",
+        alias="SEARCH_PROVIDERS",
+    )
+    search_provider_timeout: float = Field(
+        default=10.0,
+        title="Search Provider Timeout",
+        description="Default timeout in seconds for each provider in a federated search",
+        alias="SEARCH_PROVIDER_TIMEOUT",
+    )
+    search_provider_timeouts: Dict[str, float] = Field(
+        default_factory=dict,
+        title="Search Provider Timeouts",
+        description='Per-provider timeout overrides in seconds, e.g. {"searxng": 5}',
+        alias="SEARCH_PROVIDER_TIMEOUTS",
+    )
+    searxng_base_url: str = Field(
+        default="http://localhost:8888",
+        title="SearxNG Base URL",
+        description="Base URL of a SearxNG-compatible instance with the JSON format enabled",
+        alias="SEARXNG_BASE_URL",
+    )
+    local_corpus_path: str = Field(
+        default="",
+        title="Local Corpus Path",
+        description="Path to a JSON Lines file of documents with title, url and content",
+        alias="LOCAL_CORPUS_PATH",
+    )
+
+    @property
+    def provider_names(self) -> list[str]:
+        """Return the configured provider names in order, without duplicates."""
+        names = [
+            name.strip().lower()
+            for name in self.search_providers.split(",")
+            if name.strip()
+        ]
+        return list(dict.fromkeys(names))
+
+    def timeout_for(self, provider: str) -> float:
+        """Return the timeout for a provider, falling back to the default."""
+        return self.search_provider_timeouts.get(provider, self.search_provider_timeout)
@@ -0,0 +1,76 @@
+from typing import List
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class UrlSettings(BaseSettings):
+    """Settings for the URL canonicalization rules."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        populate_by_name=True,
+    )
+
+    url_force_https: bool = Field(
+        default=True,
+        title="Force HTTPS",
+        description="Treat http and https URLs as the same source and canonicalize to https",
+        alias="URL_FORCE_HTTPS",
+    )
+    url_strip_www: bool = Field(
+        default=True,
+        title="Strip www",
+        description="Remove a leading 'www.' from hostnames",
+        alias="URL_STRIP_WWW",
+    )
+    url_strip_mobile_subdomain: bool = Field(
+        default=True,
+        title="Strip Mobile Subdomain",
+        description="Remove mobile 'm.' host labels, e.g. en.m.wikipedia.org becomes en.wikipedia.org",
+        alias="URL_STRIP_MOBILE_SUBDOMAIN",
+    )
+    url_collapse_amp: bool = Field(
+        default=True,
+        title="Collapse AMP",
+        description="Map AMP variants and AMP cache URLs to the regular page",
+        alias="URL_COLLAPSE_AMP",
+    )
+    url_strip_trailing_slash: bool = Field(
+        default=True,
+        title="Strip Trailing Slash",
+        description="Remove trailing slashes from paths",
+        alias="URL_STRIP_TRAILING_SLASH",
+    )
+    url_strip_fragment: bool = Field(
+        default=True,
+        title="Strip Fragment",
+        description="Remove '#fragment' parts",
+        alias="URL_STRIP_FRAGMENT",
+    )
+    url_sort_query: bool = Field(
+        default=True,
+        title="Sort Query",
+        description="Sort query parameters so that their order does not matter",
+        alias="URL_SORT_QUERY",
+    )
+    url_drop_query_params: List[str] = Field(
+        default_factory=lambda: [
+            "utm_*",
+            "fbclid",
+            "gclid",
+            "dclid",
+            "msclkid",
+            "mc_cid",
+            "mc_eid",
+            "_ga",
+            "ref",
+            "ref_src",
+            "amp",
+        ],
+        title="Drop Query Params",
+        description="Query parameter names to remove; shell-style wildcards are supported",
+        alias="URL_DROP_QUERY_PARAMS",
+    )
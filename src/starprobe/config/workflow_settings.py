@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
 
 from langchain_core.runnables import RunnableConfig
 from pydantic import Field
@@ -33,11 +33,107 @@ class WorkflowSettings(BaseSettings):
         title="Use Tool Calling",
         description="Use tool calling instead of JSON mode for structured output",
     )
+    search_fallback_mode: Literal["sequential", "race", "merge"] = Field(
+        default="sequential",
+        title="Search Fallback Mode",
+        description="How the fallback query is used: 'sequential' retries after an empty primary search, 'race' runs both and takes the first non-empty result set, 'merge' runs both and combines the results",
+    )
+    search_fallback_delay_seconds: float = Field(
+        default=0.0,
+        title="Search Fallback Delay Seconds",
+        description="Hedge delay before the fallback query starts in 'race' and 'merge' modes",
+    )
+    scrape_top_k: int = Field(
+        default=3,
+        title="Scrape Top K",
+        description="Number of best-ranked search results kept as sources per loop; only these are scraped",
+    )
+    hedged_scraping: bool = Field(
+        default=False,
+        title="Hedged Scraping",
+        description="Scrape scrape_top_k + scrape_hedge_extra candidates concurrently and keep the first scrape_top_k documents to arrive",
+    )
+    scrape_hedge_extra: int = Field(
+        default=2,
+        title="Scrape Hedge Extra",
+        description="Number of extra candidates fetched in hedged scraping mode to absorb slow or failing hosts",
+    )
+    scrape_deadline_seconds: float = Field(
+        default=15.0,
+        title="Scrape Deadline Seconds",
+        description="Time after which hedged scraping stops waiting and falls back to search snippets for unfinished fetches",
+    )
+    snippet_coverage_threshold: float = Field(
+        default=1.0,
+        title="Snippet Coverage Threshold",
+        description="Share of query terms a long search snippet must contain to be used instead of scraping the page (above 1 always scrapes)",
+    )
+    domain_priors: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "wikipedia.org": 0.3,
+            "arxiv.org": 0.2,
+            "gov": 0.2,
+            "edu": 0.2,
+            "pinterest.com": -0.5,
+        },
+        title="Domain Priors",
+        description="Score adjustments by domain or domain suffix used when ranking search results",
+    )
     max_tokens_per_source: int = Field(
         default=1000,
         title="Max Tokens Per Source",
         description="Maximum number of tokens to include for each source's content",
     )
+    select_relevant_passages: bool = Field(
+        default=True,
+        title="Select Relevant Passages",
+        description="Fill each source's token budget with the passages most relevant to the research topic and query (BM25) instead of the leading text",
+    )
+    passage_max_words: int = Field(
+        default=120,
+        title="Passage Max Words",
+        description="Maximum number of words per passage when splitting sources for relevance ranking",
+    )
+    remove_near_duplicates: bool = Field(
+        default=True,
+        title="Remove Near Duplicates",
+        description="Drop sources whose content nearly duplicates a source already used in this research run",
+    )
+    near_duplicate_max_distance: int = Field(
+        default=3,
+        title="Near Duplicate Max Distance",
+        description="Maximum Hamming distance between 64-bit SimHash fingerprints for two sources to count as near-duplicates",
+    )
+    skip_seen_urls: bool = Field(
+        default=True,
+        title="Skip Seen URLs",
+        description="Skip search results whose URL was already used by an earlier loop of the same research run",
+    )
+    seen_url_extra_results: int = Field(
+        default=5,
+        title="Seen URL Extra Results",
+        description="Maximum number of extra search results requested to make up for URLs already used in the run",
+    )
+    max_context_tokens: int = Field(
+        default=8192,
+        title="Max Context Tokens",
+        description="Total context window budget for each LLM call, including the reserved completion tokens (0 disables budgeting)",
+    )
+    summary_context_ratio: float = Field(
+        default=0.3,
+        title="Summary Context Ratio",
+        description="Share of the context budget the existing summary may use when the prompt must be trimmed",
+    )
+    max_query_generation_tokens: int = Field(
+        default=256,
+        title="Max Query Generation Tokens",
+        description="Maximum number of tokens the LLM may generate when refining the search query (0 disables the cap)",
+    )
+    max_summary_generation_tokens: int = Field(
+        default=2048,
+        title="Max Summary Generation Tokens",
+        description="Maximum number of tokens the LLM may generate when summarizing sources (0 disables the cap)",
+    )
 
     @classmethod
     def from_runnable_config(
@@ -1,18 +1,32 @@
 from functools import lru_cache
+from typing import Optional
 
 from fastapi import Depends
 from nexus_sdk import MockNexusClient, NexusMLXClient, NexusOllamaClient
 
-from .clients import DdgsClient
+from .clients import (
+    AdaptiveTokenBucket,
+    DdgsClient,
+    FederatedSearchClient,
+    LocalCorpusClient,
+    SearxngClient,
+)
+from .clients.ddgs_client import create_rate_limiter
 from .config import (
     AppSettings,
     DDGSSettings,
     NexusSettings,
     ScrapingSettings,
+    SearchSettings,
     WorkflowSettings,
 )
 from .protocols import DDGSClientProtocol, LLMClientProtocol, ScrapingServiceProtocol
-from .services import PromptService, ResearchService, ScrapingService
+from .services import (
+    DomainPolicyService,
+    PromptService,
+    ResearchService,
+    ScrapingService,
+)
 
 
 @lru_cache()
@@ -35,6 +49,11 @@ def get_scraping_settings() -> ScrapingSettings:
     return ScrapingSettings()
 
 
+@lru_cache()
+def get_search_settings() -> SearchSettings:
+    return SearchSettings()
+
+
 @lru_cache()
 def get_workflow_settings() -> WorkflowSettings:
     return WorkflowSettings()
@@ -69,34 +88,70 @@ def get_llm_client(
     return _create_llm_client(nexus_settings)
 
 
-def _create_search_client(ddgs_settings: DDGSSettings) -> DDGSClientProtocol:
+@lru_cache()
+def get_ddgs_rate_limiter() -> AdaptiveTokenBucket:
+    # Process-wide so that every request is paced against the same budget
+    return create_rate_limiter(get_ddgs_settings())
+
+
+def _create_search_client(
+    ddgs_settings: DDGSSettings,
+    search_settings: Optional[SearchSettings] = None,
+    rate_limiter: Optional[AdaptiveTokenBucket] = None,
+) -> DDGSClientProtocol:
     if ddgs_settings.use_mock_search:
         from dev.mocks.mock_search_client import MockSearchClient
 
         return MockSearchClient()
-    return DdgsClient(ddgs_settings)
 
+    search_settings = search_settings or SearchSettings()
+    providers: dict[str, DDGSClientProtocol] = {}
+    for name in search_settings.provider_names:
+        if name == "ddgs":
+            providers[name] = DdgsClient(ddgs_settings, rate_limiter)
+        elif name == "searxng":
+            providers[name] = SearxngClient(search_settings)
+        elif name == "local":
+            providers[name] = LocalCorpusClient(search_settings)
+        else:
+            raise ValueError(f"Unsupported search provider '{name}'")
+
+    if not providers:
+        raise ValueError("At least one search provider must be configured")
+    if len(providers) == 1:
+        return next(iter(providers.values()))
+    return FederatedSearchClient(providers, search_settings)
 
-def get_search_client(
-    ddgs_settings: DDGSSettings = Depends(get_ddgs_settings),
-) -> DDGSClientProtocol:
-    return _create_search_client(ddgs_settings)
+
+@lru_cache()
+def get_search_client() -> DDGSClientProtocol:
+    # Shared across requests so that searches use one bounded thread pool
+    return _create_search_client(
+        get_ddgs_settings(), get_search_settings(), get_ddgs_rate_limiter()
+    )
+
+
+@lru_cache()
+def get_domain_policy() -> DomainPolicyService:
+    # Process-wide so that every scrape feeds the same per-domain stats
+    return DomainPolicyService(get_scraping_settings())
 
 
 def _create_scraping_service(
     scraping_settings: ScrapingSettings,
+    domain_policy: Optional[DomainPolicyService] = None,
 ) -> ScrapingServiceProtocol:
     if scraping_settings.use_mock_scraping:
         from dev.mocks.mock_scraping_service import MockScrapingService
 
         return MockScrapingService()
-    return ScrapingService(scraping_settings)
+    return ScrapingService(scraping_settings, domain_policy)
 
 
-def get_scraping_service(
-    scraping_settings: ScrapingSettings = Depends(get_scraping_settings),
-) -> ScrapingServiceProtocol:
-    return _create_scraping_service(scraping_settings)
+@lru_cache()
+def get_scraping_service() -> ScrapingServiceProtocol:
+    # Shared across requests so that scrapes reuse one connection pool
+    return _create_scraping_service(get_scraping_settings(), get_domain_policy())
 
 
 def _create_prompt_service(workflow_settings: WorkflowSettings) -> PromptService:
@@ -113,13 +168,25 @@ def _create_research_service(
     workflow_settings: WorkflowSettings,
     search_client: DDGSClientProtocol,
     scraping_service: ScrapingServiceProtocol,
+    ddgs_settings: Optional[DDGSSettings] = None,
+    domain_policy: Optional[DomainPolicyService] = None,
 ) -> ResearchService:
-    return ResearchService(workflow_settings, search_client, scraping_service)
+    return ResearchService(
+        workflow_settings,
+        search_client,
+        scraping_service,
+        ddgs_settings,
+        domain_policy=domain_policy,
+    )
 
 
 def get_research_service(
     workflow_settings: WorkflowSettings = Depends(get_workflow_settings),
     search_client: DDGSClientProtocol = Depends(get_search_client),
     scraping_service: ScrapingServiceProtocol = Depends(get_scraping_service),
+    ddgs_settings: DDGSSettings = Depends(get_ddgs_settings),
+    domain_policy: DomainPolicyService = Depends(get_domain_policy),
 ) -> ResearchService:
-    return _create_research_service(workflow_settings, search_client, scraping_service)
+    return _create_research_service(
+        workflow_settings, search_client, scraping_service, ddgs_settings, domain_policy
+    )
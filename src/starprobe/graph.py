@@ -7,6 +7,13 @@ from starprobe.nodes import (
     refine_query,
     summarize_sources,
 )
+from starprobe.observability import (
+    collect_timings,
+    measure_memory,
+    summarize_memory,
+    summarize_timings,
+    track_node,
+)
 from starprobe.protocols import LLMClientProtocol
 from starprobe.services import PromptService, ResearchService
 from starprobe.state import (
@@ -29,30 +36,63 @@ class ResearchGraph:
         self.llm_client = llm_client
 
     async def refine_query(self, state: SummaryState, config: RunnableConfig):
-        return await refine_query(
-            state.research_topic, self.prompt_service, self.llm_client
-        )
+        with (
+            collect_timings("refine_query") as timings,
+            measure_memory("refine_query") as memory,
+            track_node("refine_query"),
+        ):
+            update = await refine_query(
+                state.research_topic, self.prompt_service, self.llm_client
+            )
+        return {**update, "timings": timings, "memory": memory}
 
     async def conduct_web_search(self, state: SummaryState, config: RunnableConfig):
-        return await conduct_web_search(
-            state.search_query,
-            state.research_loop_count,
-            state.web_research_results,
-            state.sources_gathered,
-            self.research_service,
-        )
+        with (
+            collect_timings("conduct_web_search") as timings,
+            measure_memory("conduct_web_search") as memory,
+            track_node("conduct_web_search"),
+        ):
+            update = await conduct_web_search(
+                state.search_query,
+                state.research_loop_count,
+                state.web_research_results,
+                state.sources_gathered,
+                self.research_service,
+                state.content_fingerprints,
+                state.research_topic,
+                state.seen_urls,
+            )
+        return {**update, "timings": timings, "memory": memory}
 
     async def summarize_sources(self, state: SummaryState, config: RunnableConfig):
-        return await summarize_sources(
-            state.research_topic,
-            state.running_summary,
-            state.web_research_results,
-            self.prompt_service,
-            self.llm_client,
-        )
+        with (
+            collect_timings("summarize_sources") as timings,
+            measure_memory("summarize_sources") as memory,
+            track_node("summarize_sources"),
+        ):
+            update = await summarize_sources(
+                state.research_topic,
+                state.running_summary,
+                state.web_research_results,
+                self.prompt_service,
+                self.llm_client,
+            )
+        return {**update, "timings": timings, "memory": memory}
 
     def finalize_summary(self, state: SummaryState, config: RunnableConfig):
-        return finalize_summary(state)
+        with (
+            collect_timings("finalize_summary") as timings,
+            measure_memory("finalize_summary") as memory,
+            track_node("finalize_summary"),
+        ):
+            update = finalize_summary(state)
+        # Attached here so that the breakdown includes this node as well
+        update["metadata"]["timings"] = summarize_timings([*state.timings, *timings])
+        if state.memory or memory:
+            update["metadata"]["memory"] = {
+                "nodes": summarize_memory([*state.memory, *memory])
+            }
+        return update
 
     def build(self):
         # Add nodes and edges
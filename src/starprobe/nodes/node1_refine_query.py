@@ -1,12 +1,17 @@
-import json
 import logging
 from typing import List, Optional
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
+from starprobe.observability.metrics import track_call
+from starprobe.observability.tracing import record_llm_usage
 from starprobe.protocols.llm_client_protocol import LLMClientProtocol
+from starprobe.services.prompt_budget_service import PromptBudgetService
 from starprobe.services.prompt_service import PromptService
+from starprobe.services.structured_output_service import (
+    StructuredOutputService,
+)
 
 
 async def refine_query(
@@ -27,7 +32,7 @@ async def refine_query(
     Returns:
         Dictionary with state update, including search_query key containing the generated query
     """
-    messages = prompt_service.generate_query_prompt(research_topic)
+    max_tokens = prompt_service.configurable.max_query_generation_tokens
 
     @tool
     class Query(BaseModel):
@@ -47,9 +52,16 @@ async def refine_query(
     error_messages: Optional[List[str]] = None
 
     try:
+        messages = PromptBudgetService.build_query_prompt(
+            prompt_service, research_topic, reserved_tokens=max_tokens
+        )
         if prompt_service.configurable.use_tool_calling:
             llm = llm_client.bind_tools([Query])
-            result = await llm.invoke(messages)
+            with track_call("llm_invoke"):
+                result = await llm.invoke(
+                    messages, **StructuredOutputService.generation_kwargs(max_tokens)
+                )
+                record_llm_usage(messages, result)
 
             if not result.tool_calls:
                 search_query = fallback_query
@@ -60,17 +72,17 @@ async def refine_query(
                 except (IndexError, KeyError):
                     search_query = fallback_query
         else:
-            # Use JSON mode
-            result = await llm_client.invoke(messages)
-            content = result.content
-
-            try:
-                parsed_json = json.loads(content)
-                search_query = parsed_json.get("query")
-                if not search_query:
-                    search_query = fallback_query
-            except (json.JSONDecodeError, KeyError):
+            # Use JSON mode, stopping generation once the query object is complete
+            parsed_json = await StructuredOutputService.generate_json(
+                llm_client,
+                messages,
+                required_key="query",
+                max_tokens=max_tokens,
+            )
+            if parsed_json is None:
                 search_query = fallback_query
+            else:
+                search_query = parsed_json["query"]
     except Exception as exc:  # pragma: no cover - defensive guard
         search_query = fallback_query
         error_messages = [f"Generate query fallback triggered: {exc}"]
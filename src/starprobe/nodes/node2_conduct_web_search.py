@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from starprobe.services.research_service import ResearchService
 
@@ -9,6 +10,9 @@ async def conduct_web_search(
     web_research_results: list[str],
     sources_gathered: list[str],
     research_service: ResearchService,
+    content_fingerprints: Optional[list[int]] = None,
+    research_topic: str = "",
+    seen_urls: Optional[list[str]] = None,
 ):
     """LangGraph node that conducts web search using the generated search query.
 
@@ -23,15 +27,29 @@ async def conduct_web_search(
         web_research_results: List of previous research results
         sources_gathered: List of previous sources
         research_service: Injected research service instance
+        content_fingerprints: Fingerprints of sources used by earlier loops
+        research_topic: The research topic, used to rank passages of long sources
+        seen_urls: Canonical URLs of sources used by earlier loops
 
     Returns:
-        Dictionary with state update, including sources_gathered, research_loop_count, and web_research_results
+        Dictionary with state update, including sources_gathered, research_loop_count, web_research_results, and non-fatal notes
     """
     logger = logging.getLogger(__name__)
 
+    seen_fingerprints = list(content_fingerprints or [])
+    previous_count = len(seen_fingerprints)
+    run_urls = list(seen_urls or [])
+    previous_url_count = len(run_urls)
+    notes: list[str] = []
+
     try:
         results, sources, errors = await research_service.search_and_scrape(
-            query=search_query, loop_count=research_loop_count
+            query=search_query,
+            loop_count=research_loop_count,
+            seen_fingerprints=seen_fingerprints,
+            research_topic=research_topic,
+            notes=notes,
+            seen_urls=run_urls,
         )
     except Exception as exc:  # pragma: no cover - defensive guard
         diagnostic = f"Web research node failed: {exc}"
@@ -47,5 +65,8 @@ async def conduct_web_search(
         "web_research_results": [results],
         "sources_gathered": [sources],
         "research_loop_count": research_loop_count + 1,
+        "content_fingerprints": seen_fingerprints[previous_count:],
+        "seen_urls": run_urls[previous_url_count:],
         "errors": errors,
+        "notes": notes,
     }
@@ -1,7 +1,13 @@
 import logging
 
+from starprobe.observability.metrics import track_call
+from starprobe.observability.tracing import record_llm_usage
 from starprobe.protocols.llm_client_protocol import LLMClientProtocol
+from starprobe.services.prompt_budget_service import PromptBudgetService
 from starprobe.services.prompt_service import PromptService
+from starprobe.services.structured_output_service import (
+    StructuredOutputService,
+)
 from starprobe.services.text_processing_service import (
     TextProcessingService,
 )
@@ -31,13 +37,20 @@ async def summarize_sources(
         Dictionary with state update, including running_summary key containing the updated summary
     """
     logger = logging.getLogger(__name__)
+    max_tokens = prompt_service.configurable.max_summary_generation_tokens
     try:
-        messages = prompt_service.generate_summarize_prompt(
+        messages = PromptBudgetService.build_summarize_prompt(
+            prompt_service,
             research_topic=research_topic,
             existing_summary=running_summary,
-            new_context="\n".join(web_research_results),
+            web_research_results=web_research_results,
+            reserved_tokens=max_tokens,
         )
-        result = await llm_client.invoke(messages)
+        with track_call("llm_invoke"):
+            result = await llm_client.invoke(
+                messages, **StructuredOutputService.generation_kwargs(max_tokens)
+            )
+            record_llm_usage(messages, result)
 
         # Strip thinking tokens if configured
         running_summary = result.content
@@ -1,5 +1,8 @@
 import logging
 
+from starprobe.services.url_canonicalization_service import (
+    UrlCanonicalizationService,
+)
 from starprobe.state import SummaryState
 
 logger = logging.getLogger(__name__)
@@ -12,15 +15,20 @@ def finalize_summary(state: SummaryState):
     metadata for API consumers.
     """
 
-    # Deduplicate sources while preserving order
+    # Deduplicate sources by canonical URL while preserving order
+    canonicalizer = UrlCanonicalizationService.default()
     seen_sources = set()
     unique_sources: list[str] = []
 
     for source in state.sources_gathered:
         for line in source.split("\n"):
             cleaned = line.strip()
-            if cleaned and cleaned not in seen_sources:
-                seen_sources.add(cleaned)
+            if not cleaned:
+                continue
+            url, _, _ = cleaned.partition(" ")
+            key = canonicalizer.canonicalize(url) if url.startswith("http") else cleaned
+            if key not in seen_sources:
+                seen_sources.add(key)
                 unique_sources.append(cleaned)
 
     source_urls = [line for line in unique_sources if line.startswith("http")]
@@ -58,9 +66,11 @@ def finalize_summary(state: SummaryState):
         elif has_errors:
             error_message = "Errors occurred during research"
 
-    diagnostics = list(dict.fromkeys(state.errors))
+    error_diagnostics = list(dict.fromkeys(state.errors))
+    # Notes are informational and do not affect success
+    diagnostics = list(dict.fromkeys([*state.errors, *state.notes]))
     if state.errors:
-        joined = "; ".join(diagnostics)
+        joined = "; ".join(error_diagnostics)
         if not error_message:
             error_message = joined
         else:
@@ -0,0 +1,56 @@
+from .loop_monitor import EventLoopMonitor
+from .memory import measure_memory, measure_request_memory, summarize_memory
+from .metrics import (
+    CONTENT_TYPE,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    record_cache,
+    record_error,
+    track_call,
+    track_node,
+    track_request,
+)
+from .profiler import PROFILES, SamplingProfiler, profile_request
+from .request_context import bind_request_id, current_request_id
+from .timings import collect_timings, server_timing_header, summarize_timings
+from .tracing import (
+    TRACER,
+    configure_tracing,
+    record_llm_usage,
+    set_span_attributes,
+    start_span,
+)
+
+__all__ = [
+    "CONTENT_TYPE",
+    "PROFILES",
+    "REGISTRY",
+    "TRACER",
+    "Counter",
+    "EventLoopMonitor",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "SamplingProfiler",
+    "bind_request_id",
+    "collect_timings",
+    "configure_tracing",
+    "current_request_id",
+    "measure_memory",
+    "measure_request_memory",
+    "profile_request",
+    "record_cache",
+    "record_error",
+    "record_llm_usage",
+    "server_timing_header",
+    "set_span_attributes",
+    "start_span",
+    "summarize_memory",
+    "summarize_timings",
+    "track_call",
+    "track_node",
+    "track_request",
+]
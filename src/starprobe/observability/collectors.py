@@ -0,0 +1,69 @@
+"""Collectors that expose component state on each ``/metrics`` scrape."""
+
+import re
+from typing import Iterable
+
+from starprobe.dependencies import get_scraping_service, get_search_client
+from starprobe.observability.metrics import (
+    REGISTRY,
+    MetricsRegistry,
+    Sample,
+    cache_hit_ratios,
+)
+from starprobe.services.text_processing_service import TextProcessingService
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _component_samples(prefix: str, metrics: dict) -> Iterable[Sample]:
+    for key, value in metrics.items():
+        if isinstance(value, bool):
+            value = float(value)
+        if isinstance(value, (int, float)):
+            # Running sums only grow, so they are exported as counters
+            if key.endswith("_sum"):
+                key = key[: -len("_sum")] + "_total"
+            name = _INVALID_NAME_CHARS.sub("_", f"{prefix}_{key}")
+            yield (name, {}, float(value))
+
+
+def _search_client_samples() -> Iterable[Sample]:
+    # Only report clients that exist; scraping must not create them
+    if not get_search_client.cache_info().currsize:
+        return
+    metrics = getattr(get_search_client(), "metrics", None)
+    if metrics is not None:
+        yield from _component_samples("starprobe_search", metrics())
+
+
+def _scraper_samples() -> Iterable[Sample]:
+    if not get_scraping_service.cache_info().currsize:
+        return
+    metrics = getattr(get_scraping_service(), "metrics", None)
+    if metrics is not None:
+        yield from _component_samples("starprobe_scraper", metrics())
+
+
+def _cache_samples() -> Iterable[Sample]:
+    yield from cache_hit_ratios()
+    info = TextProcessingService.encoding_cache_info()
+    lookups = info.hits + info.misses
+    if lookups:
+        yield (
+            "starprobe_cache_hit_ratio",
+            {"cache": "tokenizer_encoding"},
+            info.hits / lookups,
+        )
+
+
+def register_app_collectors(registry: MetricsRegistry = REGISTRY) -> None:
+    """Register the search client, scraper and cache collectors."""
+    registry.clear_collectors()
+    registry.add_collector(
+        "Search client executor, latency and rate limiter state.",
+        _search_client_samples,
+    )
+    registry.add_collector(
+        "Scraper request counters and connection pool usage.", _scraper_samples
+    )
+    registry.add_collector("Hit ratio of each cache.", _cache_samples)
@@ -0,0 +1,112 @@
+"""Event-loop lag monitoring and blocking-call detection.
+
+A background task sleeps for a fixed interval and measures how late it wakes up;
+the delay is the time other callbacks held the loop, and is exported as a
+histogram. In debug mode a watchdog thread also checks that the task keeps
+waking up. When the loop has been blocked for longer than the threshold, it
+captures the stack of the loop thread and the request id of the running task,
+and logs them once per stall.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from starprobe.observability.metrics import LOOP_BLOCKED, LOOP_LAG, REGISTRY
+from starprobe.observability.request_context import task_request_id
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopMonitor:
+    """Samples event-loop lag and, in debug mode, reports blocking callbacks.
+
+    Args:
+        interval: Seconds between lag samples
+        block_threshold: Seconds the loop may be blocked before it is reported
+        capture_stacks: Start the watchdog thread that reports blocking callbacks
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        block_threshold: float = 0.25,
+        capture_stacks: bool = False,
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.capture_stacks = capture_stacks
+        self.max_lag = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._heartbeat = time.monotonic()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._heartbeat = time.monotonic()
+        self._task = self._loop.create_task(self._sample())
+        if self.capture_stacks:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="starprobe-loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the sampling task and the watchdog thread."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval * 2)
+            self._watchdog = None
+
+    async def _sample(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            lag = max(now - started - self.interval, 0.0)
+            self.max_lag = max(self.max_lag, lag)
+            if REGISTRY.enabled:
+                LOOP_LAG.observe(lag)
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+        while not self._stopped.wait(min(self.interval, self.block_threshold) / 2):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            if blocked_for < self.block_threshold or heartbeat == reported_heartbeat:
+                continue
+            # Report each stall once, while the blocking callback is still running
+            reported_heartbeat = heartbeat
+            self._report_blocked(blocked_for)
+
+    def _report_blocked(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        if REGISTRY.enabled:
+            LOOP_BLOCKED.inc()
+        logger.warning(
+            "Event loop blocked",
+            extra={
+                "blocked_for": round(blocked_for, 3),
+                "request_id": task_request_id(self._loop) if self._loop else None,
+                "stack": stack,
+            },
+        )
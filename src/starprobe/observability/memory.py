@@ -0,0 +1,117 @@
+"""Opt-in per-request and per-node memory accounting with tracemalloc.
+
+When tracemalloc is tracing, each graph node and each request records the
+memory it retained (traced memory at the end minus at the start) and its peak
+(highest traced memory while it ran, minus the start). A request also compares
+tracemalloc snapshots taken before and after it ran to find the source lines
+that allocated the most memory it kept.
+
+tracemalloc counts the whole process. With concurrent requests, figures include
+allocations made by other requests at the same time, so peaks are upper bounds.
+The peak is only reset while nothing is being measured.
+"""
+
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List
+
+_lock = threading.Lock()
+_active = 0
+
+# Allocations made by tracemalloc and frozen stdlib modules are not the request's
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen *>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _kib(size: int) -> float:
+    return round(size / 1024, 1)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def _begin() -> int:
+    global _active
+    with _lock:
+        if _active == 0:
+            tracemalloc.reset_peak()
+        _active += 1
+        current, _ = tracemalloc.get_traced_memory()
+    return current
+
+
+def _end(start: int) -> Dict[str, float]:
+    global _active
+    with _lock:
+        current, peak = tracemalloc.get_traced_memory()
+        _active -= 1
+    return {
+        "peak_kib": _kib(max(peak - start, current - start, 0)),
+        "retained_kib": _kib(current - start),
+    }
+
+
+@contextmanager
+def measure_memory(node: str) -> Iterator[List[Dict[str, Any]]]:
+    """Measure a graph node; the yielded list gets an entry if tracemalloc traces."""
+    entries: List[Dict[str, Any]] = []
+    if not tracemalloc.is_tracing():
+        yield entries
+        return
+    start = _begin()
+    try:
+        yield entries
+    finally:
+        entries.append({"node": node, **_end(start)})
+
+
+@contextmanager
+def measure_request_memory(top: int = 5) -> Iterator[Dict[str, Any]]:
+    """
+    Measure a request and find the lines that allocated the memory it retained.
+
+    The yielded dict is filled in when the block exits, and stays empty unless
+    tracemalloc is tracing. Snapshots walk every traced allocation, so they are
+    skipped when ``top`` is 0.
+
+    Args:
+        top: Number of allocation sites to report
+
+    Yields:
+        Dict[str, Any]: ``peak_kib``, ``retained_kib`` and ``top_allocations``
+    """
+    report: Dict[str, Any] = {}
+    if not tracemalloc.is_tracing():
+        yield report
+        return
+    before = _snapshot() if top else None
+    start = _begin()
+    try:
+        yield report
+    finally:
+        report.update(_end(start))
+        report["top_allocations"] = []
+        if before is not None:
+            grown = [
+                s for s in _snapshot().compare_to(before, "lineno") if s.size_diff > 0
+            ]
+            report["top_allocations"] = [
+                f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} "
+                f"+{_kib(stat.size_diff)} KiB ({stat.count_diff:+d} blocks)"
+                for stat in grown[:top]
+            ]
+
+
+def summarize_memory(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the largest peak and the total retained memory of each node."""
+    summary: Dict[str, Dict[str, float]] = {}
+    for entry in entries:
+        node = summary.setdefault(entry["node"], {"peak_kib": 0.0, "retained_kib": 0.0})
+        node["peak_kib"] = max(node["peak_kib"], entry["peak_kib"])
+        node["retained_kib"] = round(node["retained_kib"] + entry["retained_kib"], 1)
+    return summary
@@ -0,0 +1,385 @@
+"""In-process metrics with Prometheus text exposition.
+
+Metrics are plain Python objects guarded by a lock per metric, so recording a
+sample costs a dictionary lookup and a few additions. Nothing is pushed to an
+external service; the ``/metrics`` endpoint renders the current values.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from starprobe.observability.request_context import attribute_thread
+from starprobe.observability.timings import record_timing
+from starprobe.observability.tracing import (
+    SPAN_KIND_CLIENT,
+    SPAN_KIND_INTERNAL,
+    SPAN_KIND_SERVER,
+    increment_span_attribute,
+    start_span,
+)
+
+# Bucket bounds in seconds, covering sub-millisecond parsing up to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_SPAN_KINDS = {
+    "request": SPAN_KIND_SERVER,
+    "node": SPAN_KIND_INTERNAL,
+    "call": SPAN_KIND_CLIENT,
+}
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in labels]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> List[Tuple[str, str]]:
+        return list(zip(self.labelnames, key))
+
+    def samples(self) -> List[Sample]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, e.g. of errors."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        return [(self.name, dict(self._labels(key)), value) for key, value in items]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """Value that goes up and down, e.g. the number of in-flight calls."""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Per label set: [count per bucket..., sum, count]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def count(self, **labels: str) -> float:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-1] if state else 0.0
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        samples: List[Sample] = []
+        for key, state in items:
+            labels = self._labels(key)
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets, state):
+                cumulative += bucket_count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        dict(labels + [("le", _format_value(bound))]),
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", dict(labels), state[-2]))
+            samples.append((f"{self.name}_count", dict(labels), state[-1]))
+        return samples
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """Holds metrics and collector callbacks and renders them as Prometheus text."""
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Tuple[str, Callable[[], Iterable[Sample]]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(
+        self, documentation: str, collect: Callable[[], Iterable[Sample]]
+    ) -> None:
+        """Register a callback whose samples are rendered on each scrape.
+
+        Samples named ``*_total`` are typed as counters and all others as gauges.
+        """
+        with self._lock:
+            self._collectors.append((documentation, collect))
+
+    def clear_collectors(self) -> None:
+        with self._lock:
+            self._collectors.clear()
+
+    def reset(self) -> None:
+        """Zero every metric, keeping registrations."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labels, value in metric.samples():
+                lines.append(
+                    f"{name}{_format_labels(labels.items())} {_format_value(value)}"
+                )
+
+        for documentation, collect in collectors:
+            grouped: Dict[str, List[str]] = {}
+            for name, labels, value in collect():
+                grouped.setdefault(name, []).append(
+                    f"{name}{_format_labels(labels.items())} {_format_value(value)}"
+                )
+            for name, samples in grouped.items():
+                type_name = "counter" if name.endswith("_total") else "gauge"
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {type_name}")
+                lines.extend(samples)
+
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric '{metric.name}' is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+
+REGISTRY = MetricsRegistry()
+
+NODE_DURATION = REGISTRY.histogram(
+    "starprobe_node_duration_seconds",
+    "Wall time of each research graph node.",
+    ("node",),
+)
+EXTERNAL_CALL_DURATION = REGISTRY.histogram(
+    "starprobe_external_call_duration_seconds",
+    "Wall time of calls to search engines, web pages, the HTML parser and the LLM.",
+    ("call",),
+)
+IN_FLIGHT = REGISTRY.gauge(
+    "starprobe_in_flight",
+    "Requests, nodes and external calls currently running.",
+    ("kind", "name"),
+)
+ERRORS = REGISTRY.counter(
+    "starprobe_errors_total",
+    "Errors raised or reported by requests, nodes and external calls.",
+    ("kind", "name"),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "starprobe_cache_requests_total",
+    "Cache lookups by cache and result (hit or miss).",
+    ("cache", "result"),
+)
+
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "starprobe_log_records_dropped_total",
+    "Log records dropped because the log queue was full or by sampling.",
+    ("reason",),
+)
+LOOP_LAG = REGISTRY.histogram(
+    "starprobe_event_loop_lag_seconds",
+    "Delay between when the event loop should have woken a task and when it did.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+LOOP_BLOCKED = REGISTRY.counter(
+    "starprobe_event_loop_blocked_total",
+    "Times a callback blocked the event loop for longer than the threshold.",
+)
+
+
+@contextmanager
+def _track(kind: str, name: str, histogram: Optional[Histogram]) -> Iterator[None]:
+    enabled = REGISTRY.enabled
+    if enabled:
+        IN_FLIGHT.inc(kind=kind, name=name)
+    started = time.perf_counter()
+    try:
+        with start_span(name, _SPAN_KINDS[kind]), attribute_thread():
+            yield
+    except Exception:
+        if enabled:
+            ERRORS.inc(kind=kind, name=name)
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        # Stage timings are reported per request even with metrics disabled
+        record_timing(kind, name, duration)
+        if enabled:
+            IN_FLIGHT.dec(kind=kind, name=name)
+            if histogram is not None:
+                histogram.observe(duration, **{histogram.labelnames[0]: name})
+
+
+def track_request(name: str):
+    """Count a request as in flight and its exceptions as errors."""
+    return _track("request", name, None)
+
+
+def track_node(node: str):
+    """Time a graph node and count it as in flight while it runs."""
+    return _track("node", node, NODE_DURATION)
+
+
+def track_call(call: str):
+    """Time an external call and count it as in flight while it runs."""
+    return _track("call", call, EXTERNAL_CALL_DURATION)
+
+
+def record_error(kind: str, name: str) -> None:
+    """Count an error that was handled without raising."""
+    if REGISTRY.enabled:
+        ERRORS.inc(kind=kind, name=name)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup."""
+    increment_span_attribute(f"starprobe.cache.{cache}.{'hits' if hit else 'misses'}")
+    if REGISTRY.enabled:
+        CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_log_drop(reason: str) -> None:
+    """Count a log record that was dropped instead of written."""
+    if REGISTRY.enabled:
+        LOG_RECORDS_DROPPED.inc(reason=reason)
+
+
+def cache_hit_ratios() -> Iterable[Sample]:
+    """Yield the hit ratio of every cache with recorded lookups."""
+    totals: Dict[str, List[float]] = {}
+    for _, labels, value in CACHE_REQUESTS.samples():
+        hits_and_total = totals.setdefault(labels["cache"], [0.0, 0.0])
+        if labels["result"] == "hit":
+            hits_and_total[0] += value
+        hits_and_total[1] += value
+    for cache, (hits, total) in sorted(totals.items()):
+        if total:
+            yield ("starprobe_cache_hit_ratio", {"cache": cache}, hits / total)
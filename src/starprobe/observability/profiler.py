@@ -0,0 +1,141 @@
+"""Low-overhead sampling profiler producing collapsed stacks.
+
+A daemon thread reads the stack of every other thread with
+``sys._current_frames`` at a fixed interval and counts identical stacks. The
+result is in the collapsed format (``root;caller;callee count`` per line) read
+by flame graph tools such as ``flamegraph.pl`` and speedscope. Sampling never
+interrupts the profiled code, so the overhead is the cost of walking the stacks.
+
+A profiler can be limited to one request: the event-loop thread is sampled only
+while a task of that request runs, and worker threads only while they run a
+tracked call for it.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from starprobe.observability.request_context import (
+    current_request_id,
+    task_request_id,
+    thread_request_id,
+)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame, root: str = "") -> str:
+    """Render a frame and its callers as a root-first, semicolon-separated stack."""
+    labels: List[str] = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    if root:
+        labels.append(root)
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads, or of the threads serving one request.
+
+    Args:
+        interval: Seconds between samples
+        request_id: Only sample work done for this request; the profiler must
+            then be started from the event loop that serves the request
+    """
+
+    def __init__(self, interval: float = 0.005, request_id: Optional[str] = None):
+        self.interval = interval
+        self.request_id = request_id
+        self.samples = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.request_id is not None:
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="starprobe-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> str:
+        """Stop sampling and return the collapsed stacks."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        """Return one ``stack count`` line per distinct stack, most frequent first."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self._stacks.most_common()
+        )
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident != own_id and self._includes(ident):
+                    root = names.get(ident, f"thread-{ident}")
+                    self._stacks[collapse_stack(frame, root)] += 1
+
+    def _includes(self, ident: int) -> bool:
+        if self.request_id is None:
+            return True
+        if ident == self._loop_thread_id:
+            return task_request_id(self._loop) == self.request_id
+        return thread_request_id(ident) == self.request_id
+
+
+class ProfileStore:
+    """Keeps the collapsed stacks of the most recent profiled requests."""
+
+    def __init__(self, max_profiles: int = 32):
+        self.max_profiles = max_profiles
+        self._profiles: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, request_id: str, collapsed: str) -> None:
+        with self._lock:
+            self._profiles[request_id] = collapsed
+            self._profiles.move_to_end(request_id)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, request_id: str) -> Optional[str]:
+        with self._lock:
+            return self._profiles.get(request_id)
+
+
+PROFILES = ProfileStore()
+
+
+@contextmanager
+def profile_request(interval: float = 0.005) -> Iterator[None]:
+    """Profile the bound request and keep its collapsed stacks in ``PROFILES``."""
+    request_id = current_request_id()
+    if request_id is None:
+        raise RuntimeError("profile_request needs a bound request id")
+    profiler = SamplingProfiler(interval, request_id)
+    profiler.start()
+    try:
+        yield
+    finally:
+        PROFILES.add(request_id, profiler.stop())
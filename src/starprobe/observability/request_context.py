@@ -0,0 +1,85 @@
+"""Request ids carried in a context variable.
+
+The id is bound for the duration of a request, so that logs, diagnostics and
+reports produced while it runs can name the request that caused them. Tasks and
+``asyncio.to_thread`` workers inherit the context and therefore the id.
+
+Context variables cannot be read from another thread, so monitors that inspect
+running threads use ``task_request_id`` for the event loop and
+``thread_request_id`` for worker threads running a tracked call.
+"""
+
+import asyncio
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+_request_id: ContextVar[Optional[str]] = ContextVar(
+    "starprobe_request_id", default=None
+)
+# Request served by each thread that is inside ``attribute_thread``
+_thread_requests: Dict[int, str] = {}
+
+
+@contextmanager
+def bind_request_id(request_id: Optional[str] = None) -> Iterator[str]:
+    """Bind a request id, generating one when none is given."""
+    request_id = request_id or uuid.uuid4().hex
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+def current_request_id() -> Optional[str]:
+    """Return the id of the request being handled, if any."""
+    return _request_id.get()
+
+
+@contextmanager
+def attribute_thread() -> Iterator[None]:
+    """Record the current worker thread as working for the bound request, if any.
+
+    Event-loop threads are skipped: they interleave requests, so monitors read
+    the request id of the running task instead.
+    """
+    request_id = _request_id.get()
+    if request_id is None or _in_event_loop():
+        yield
+        return
+    ident = threading.get_ident()
+    previous = _thread_requests.get(ident)
+    _thread_requests[ident] = request_id
+    try:
+        yield
+    finally:
+        if previous is None:
+            _thread_requests.pop(ident, None)
+        else:
+            _thread_requests[ident] = previous
+
+
+def thread_request_id(ident: int) -> Optional[str]:
+    """Return the request a thread is running a tracked call for, if any."""
+    return _thread_requests.get(ident)
+
+
+def task_request_id(loop: asyncio.AbstractEventLoop) -> Optional[str]:
+    """Return the request id of the task running on ``loop``, from any thread."""
+    task = asyncio.current_task(loop)
+    # Task.get_context() is available from Python 3.12
+    get_context = getattr(task, "get_context", None)
+    if get_context is None:
+        return None
+    return get_context().get(_request_id)
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
@@ -0,0 +1,83 @@
+"""Per-request breakdown of where the research graph spends its time.
+
+While a graph node runs, every tracked node and external call appends its wall
+time to a collector held in a context variable. Tasks and ``asyncio.to_thread``
+workers inherit the context, so calls made concurrently on behalf of the node
+land in the same collector.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_collector: ContextVar[Optional[Tuple[str, List[Dict[str, Any]]]]] = ContextVar(
+    "starprobe_stage_timings", default=None
+)
+
+
+@contextmanager
+def collect_timings(node: str) -> Iterator[List[Dict[str, Any]]]:
+    """Collect the timings recorded while a graph node runs."""
+    entries: List[Dict[str, Any]] = []
+    token = _collector.set((node, entries))
+    try:
+        yield entries
+    finally:
+        _collector.reset(token)
+
+
+def record_timing(kind: str, name: str, duration: float) -> None:
+    """Add a node or call duration to the active collector, if any."""
+    active = _collector.get()
+    if active is None or kind not in ("node", "call"):
+        return
+    node, entries = active
+    entries.append({"node": node, "kind": kind, "name": name, "duration": duration})
+
+
+def summarize_timings(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate recorded timings per node.
+
+    Call durations are summed, so they can exceed the node's wall time when
+    calls ran concurrently.
+
+    Args:
+        entries: Timings recorded by ``collect_timings``
+
+    Returns:
+        Dict[str, Any]: Seconds per node, with a count and total per call type
+    """
+    summary: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        node = summary.setdefault(entry["node"], {"duration": 0.0, "calls": {}})
+        if entry["kind"] == "node":
+            node["duration"] += entry["duration"]
+            continue
+        call = node["calls"].setdefault(entry["name"], {"count": 0, "duration": 0.0})
+        call["count"] += 1
+        call["duration"] += entry["duration"]
+
+    for node in summary.values():
+        node["duration"] = round(node["duration"], 4)
+        for call in node["calls"].values():
+            call["duration"] = round(call["duration"], 4)
+    return summary
+
+
+def server_timing_header(
+    timings: Optional[Dict[str, Any]], total: Optional[float] = None
+) -> str:
+    """Render summarized timings as an HTTP ``Server-Timing`` header value."""
+    metrics: List[str] = []
+    for node, node_timing in (timings or {}).items():
+        metrics.append(f"{node};dur={node_timing['duration'] * 1000:.1f}")
+        for call, call_timing in node_timing.get("calls", {}).items():
+            count = call_timing["count"]
+            metrics.append(
+                f"{node}.{call};dur={call_timing['duration'] * 1000:.1f}"
+                f';desc="{count} call{"" if count == 1 else "s"}"'
+            )
+    if total is not None:
+        metrics.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(metrics)
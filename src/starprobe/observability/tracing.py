@@ -0,0 +1,309 @@
+"""Spans for requests, graph nodes and outbound calls, exported as OTLP JSON.
+
+Every tracked request, node and call opens a span whose parent is the span
+active in the current context, so spans of work done concurrently or in
+``asyncio.to_thread`` workers nest under the node that started it. Code can
+annotate the active span with ``set_span_attributes``. The root span of a
+request uses the request id as its trace id, so a log line leads to its trace.
+
+Finished spans are batched by a background thread and written in the OTLP/JSON
+format, either as one ``ExportTraceServiceRequest`` per line to a JSONL file or
+posted to an OTLP/HTTP collector (``/v1/traces``). Tracing is off until an
+exporter is configured, and then costs a context variable lookup per span.
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from starprobe.observability.request_context import current_request_id
+
+logger = logging.getLogger(__name__)
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class Span:
+    """A timed operation with attributes, linked to its parent by ids."""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status_code",
+        "status_message",
+    )
+
+    def __init__(self, name: str, kind: int, parent: Optional["Span"]):
+        self.name = name
+        self.kind = kind
+        if parent is not None:
+            self.trace_id = parent.trace_id
+        else:
+            request_id = current_request_id()
+            valid = request_id is not None and _TRACE_ID.match(request_id)
+            self.trace_id = request_id if valid else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent is not None else ""
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.status_code = STATUS_OK
+        self.status_message = ""
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class JsonlSpanExporter:
+    """Appends one OTLP/JSON export request per line to a file."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        pass
+
+
+class OtlpHttpSpanExporter:
+    """Posts OTLP/JSON export requests to a collector's ``/v1/traces`` endpoint."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self._client = httpx.Client(timeout=timeout)
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        response = self._client.post(self.endpoint, json=payload)
+        response.raise_for_status()
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class Tracer:
+    """Creates spans and exports finished spans in batches from a daemon thread.
+
+    Spans that finish while the export queue is full are dropped rather than
+    slowing down the traced code.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.service_name = "starprobe"
+        self.dropped = 0
+        self._exporter = None
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._batch_size = 512
+        self._flush_interval = 1.0
+
+    def configure(
+        self,
+        exporter,
+        service_name: str = "starprobe",
+        max_queue_size: int = 10000,
+        batch_size: int = 512,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Start exporting spans; replaces any previous configuration."""
+        self.shutdown()
+        self.service_name = service_name
+        self._exporter = exporter
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._thread = threading.Thread(
+            target=self._run, name="starprobe-span-exporter", daemon=True
+        )
+        self._thread.start()
+        self.enabled = True
+
+    def shutdown(self) -> None:
+        """Export the queued spans and stop the export thread."""
+        self.enabled = False
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._exporter is not None:
+            self._exporter.close()
+            self._exporter = None
+
+    def finish(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Span] = []
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                try:
+                    span = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0.001)
+                    )
+                except queue.Empty:
+                    break
+                if span is None:
+                    stopping = True
+                    break
+                batch.append(span)
+            if batch:
+                self._export(batch)
+
+    def _export(self, batch: List[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": self.service_name}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "starprobe"},
+                            "spans": [span.to_otlp() for span in batch],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            self._exporter.export(payload)
+        except Exception as exc:
+            logger.warning("Failed to export %d spans: %s", len(batch), exc)
+
+
+TRACER = Tracer()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "starprobe_current_span", default=None
+)
+
+
+@contextmanager
+def start_span(
+    name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any
+) -> Iterator[Optional[Span]]:
+    """Open a child of the active span; yields None while tracing is disabled."""
+    if not TRACER.enabled:
+        yield None
+        return
+    span = Span(name, kind, _current_span.get())
+    span.attributes.update(attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.status_code = STATUS_ERROR
+        span.status_message = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _current_span.reset(token)
+        TRACER.finish(span)
+
+
+def set_span_attributes(attributes: Dict[str, Any]) -> None:
+    """Add attributes to the active span, if tracing is enabled."""
+    span = _current_span.get()
+    if span is not None and TRACER.enabled:
+        span.attributes.update(attributes)
+
+
+def increment_span_attribute(key: str, amount: int = 1) -> None:
+    """Add to a counter attribute of the active span, if tracing is enabled."""
+    span = _current_span.get()
+    if span is not None and TRACER.enabled:
+        span.attributes[key] = span.attributes.get(key, 0) + amount
+
+
+def record_llm_usage(messages: Any, response: Any = None) -> None:
+    """Annotate the active LLM span with the prompt size and reported token usage."""
+    span = _current_span.get()
+    if span is None or not TRACER.enabled:
+        return
+    span.attributes["gen_ai.request.messages"] = len(messages)
+    span.attributes["starprobe.prompt.chars"] = sum(
+        len(str(getattr(message, "content", message))) for message in messages
+    )
+    usage = getattr(response, "usage_metadata", None) or {}
+    for key in ("input_tokens", "output_tokens"):
+        if usage.get(key) is not None:
+            span.attributes[f"gen_ai.usage.{key}"] = usage[key]
+
+
+def configure_tracing(settings) -> None:
+    """Start exporting spans as configured by ``AppSettings``."""
+    if settings.tracing_exporter == "jsonl":
+        exporter = JsonlSpanExporter(settings.tracing_jsonl_path)
+    elif settings.tracing_exporter == "otlp":
+        exporter = OtlpHttpSpanExporter(settings.tracing_otlp_endpoint)
+    else:
+        return
+    TRACER.configure(exporter, service_name=settings.tracing_service_name)
@@ -1,9 +1,10 @@
 from .ddgs_client_protocol import DDGSClientProtocol
-from .llm_client_protocol import LLMClientProtocol
+from .llm_client_protocol import LLMClientProtocol, StreamingLLMClientProtocol
 from .scraping_service_protocol import ScrapingServiceProtocol
 
 __all__ = [
     "DDGSClientProtocol",
     "LLMClientProtocol",
     "ScrapingServiceProtocol",
+    "StreamingLLMClientProtocol",
 ]
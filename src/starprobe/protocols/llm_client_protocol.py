@@ -1,6 +1,6 @@
 """Protocol definition for language model client interface."""
 
-from typing import Any, Protocol
+from typing import Any, AsyncIterator, Protocol, runtime_checkable
 
 
 class LLMClientProtocol(Protocol):
@@ -34,3 +34,25 @@ class LLMClientProtocol(Protocol):
             A new client instance with the tools bound
         """
         ...
+
+
+@runtime_checkable
+class StreamingLLMClientProtocol(LLMClientProtocol, Protocol):
+    """Protocol for LLM clients that can stream partial responses.
+
+    Streaming is optional: callers should check for this protocol and fall back to
+    ``invoke`` for clients that only return complete responses.
+    """
+
+    def astream(self, messages: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """Stream response chunks from the LLM.
+
+        Args:
+            messages: The input messages to send to the LLM
+            **kwargs: Additional keyword arguments for generation control
+
+        Returns:
+            An async iterator of chunks exposing a ``content`` attribute. Closing the
+            iterator early must cancel the remaining generation.
+        """
+        ...
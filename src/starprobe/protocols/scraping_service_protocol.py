@@ -27,3 +27,7 @@ class ScrapingServiceProtocol(Protocol):
             ValueError: If scraping fails
         """
         ...
+
+    def close(self) -> None:
+        """Release connections and other resources held by the service."""
+        ...
@@ -1,13 +1,27 @@
+from .domain_policy_service import DomainPolicyService
+from .prompt_budget_service import PromptBudgetService
 from .prompt_service import PromptService
 from .research_service import ResearchService
+from .result_ranking_service import ResultRankingService
 from .scraping_service import ScrapingService
 from .search_service import SearchService
+from .structured_output_service import (
+    IncrementalJsonParser,
+    StructuredOutputService,
+)
 from .text_processing_service import TextProcessingService
+from .url_canonicalization_service import UrlCanonicalizationService
 
 __all__ = [
+    "DomainPolicyService",
+    "IncrementalJsonParser",
+    "PromptBudgetService",
     "PromptService",
     "ResearchService",
+    "ResultRankingService",
     "ScrapingService",
     "SearchService",
+    "StructuredOutputService",
     "TextProcessingService",
+    "UrlCanonicalizationService",
 ]
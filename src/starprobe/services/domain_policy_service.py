@@ -0,0 +1,234 @@
+import json
+import logging
+import math
+import os
+import random
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+from urllib.parse import urlsplit
+
+from starprobe.config.scraping_settings import ScrapingSettings
+from starprobe.services.url_canonicalization_service import (
+    UrlCanonicalizationService,
+)
+
+ScrapeDecision = Literal["scrape", "snippet", "skip"]
+
+
+class DomainPolicyService:
+    """Service that learns how each domain responds to scraping.
+
+    Every scrape records whether it succeeded, how long it took, how many bytes
+    were downloaded and how many tokens of text were extracted. Only the most
+    recent samples per domain are kept, so a domain that starts working again
+    recovers. From these stats the policy decides whether a URL is worth
+    scraping, should use its search snippet, or should be skipped entirely.
+
+    Dependencies:
+    - ScrapingSettings: For the policy thresholds and the stats file
+    - UrlCanonicalizationService: For mapping URLs to domains
+    """
+
+    _FILE_VERSION = 1
+
+    def __init__(
+        self,
+        settings: ScrapingSettings,
+        canonicalizer: Optional[UrlCanonicalizationService] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.settings = settings
+        self.canonicalizer = canonicalizer or UrlCanonicalizationService.default()
+        self._random = rng or random.Random()
+        self._samples: Dict[str, List[Dict[str, Any]]] = {}
+        self._unsaved = 0
+        # Scrapes run in worker threads, so updates must be serialized
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+        self.load()
+
+    def domain(self, url: str) -> str:
+        """Return the domain a URL's stats are recorded under."""
+        return (urlsplit(self.canonicalizer.canonicalize(url)).hostname or "").lower()
+
+    def record(
+        self,
+        url: str,
+        success: bool,
+        latency: float,
+        bytes_downloaded: int = 0,
+        useful_tokens: int = 0,
+    ) -> None:
+        """
+        Record the outcome of one scrape.
+
+        Args:
+            url: The scraped URL
+            success: Whether the page was retrieved
+            latency: Seconds spent on the scrape
+            bytes_downloaded: Size of the response body
+            useful_tokens: Number of text tokens extracted from the page
+        """
+        domain = self.domain(url)
+        if not domain:
+            return
+
+        sample = {
+            "ok": bool(success),
+            "latency": round(max(latency, 0.0), 4),
+            "bytes": max(int(bytes_downloaded), 0),
+            "tokens": max(int(useful_tokens), 0),
+        }
+        window = max(self.settings.scraping_domain_stats_window, 1)
+        interval = self.settings.scraping_domain_stats_save_interval
+        with self._lock:
+            samples = self._samples.setdefault(domain, [])
+            samples.append(sample)
+            del samples[:-window]
+            self._unsaved += 1
+            should_save = interval > 0 and self._unsaved >= interval
+
+        if should_save:
+            self.save()
+
+    def stats(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Return the summarized stats of a domain, or None if it was never scraped."""
+        with self._lock:
+            samples = list(self._samples.get(domain.lower(), []))
+        if not samples:
+            return None
+        summary = self._summarize(samples)
+        summary["decision"] = self._decision(summary)
+        return summary
+
+    def all_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the stats of every known domain, sorted by domain."""
+        with self._lock:
+            domains = sorted(self._samples)
+        return {
+            domain: stats
+            for domain in domains
+            if (stats := self.stats(domain)) is not None
+        }
+
+    def decide(self, url: str) -> ScrapeDecision:
+        """
+        Decide how a search result from this URL's domain should be used.
+
+        Domains with too few samples are always scraped. A small share of
+        non-scrape decisions is turned into scrapes so that stats stay current.
+
+        Args:
+            url: The candidate URL
+
+        Returns:
+            ScrapeDecision: ``scrape``, ``snippet`` or ``skip``
+        """
+        if not self.settings.scraping_domain_policy_enabled:
+            return "scrape"
+        stats = self.stats(self.domain(url))
+        if stats is None:
+            return "scrape"
+        decision = stats["decision"]
+        if (
+            decision != "scrape"
+            and self._random.random() < self.settings.scraping_policy_explore_rate
+        ):
+            return "scrape"
+        return decision
+
+    def reset(self, domain: Optional[str] = None) -> bool:
+        """Forget the stats of one domain, or of all domains when none is given."""
+        with self._lock:
+            if domain is None:
+                found = bool(self._samples)
+                self._samples.clear()
+            else:
+                found = self._samples.pop(domain.lower(), None) is not None
+            self._unsaved += 1
+        return found
+
+    def load(self) -> None:
+        """Load stats saved by a previous process, if the stats file exists."""
+        path = self._path()
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            domains = data.get("domains", {})
+        except (OSError, ValueError, AttributeError) as exc:
+            self.logger.warning(f"Ignoring unreadable domain stats file {path}: {exc}")
+            return
+
+        window = max(self.settings.scraping_domain_stats_window, 1)
+        with self._lock:
+            self._samples = {
+                domain: list(samples)[-window:]
+                for domain, samples in domains.items()
+                if isinstance(samples, list)
+            }
+
+    def save(self) -> None:
+        """Write the stats file atomically."""
+        path = self._path()
+        if path is None:
+            return
+        with self._lock:
+            data = {"version": self._FILE_VERSION, "domains": self._samples}
+            payload = json.dumps(data, separators=(",", ":"), sort_keys=True)
+            self._unsaved = 0
+
+        try:
+            with self._save_lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(path.suffix + ".tmp")
+                tmp_path.write_text(payload, encoding="utf-8")
+                os.replace(tmp_path, path)
+        except OSError as exc:
+            self.logger.warning(f"Failed to save domain stats to {path}: {exc}")
+
+    def _path(self) -> Optional[Path]:
+        path = self.settings.scraping_domain_stats_path
+        return Path(path).expanduser() if path else None
+
+    def _decision(self, stats: Dict[str, Any]) -> ScrapeDecision:
+        settings = self.settings
+        if stats["samples"] < settings.scraping_policy_min_samples:
+            return "scrape"
+        if stats["success_rate"] < settings.scraping_policy_skip_success_rate:
+            return "skip"
+        if (
+            stats["success_rate"] < settings.scraping_policy_min_success_rate
+            or stats["latency_p95"] > settings.scraping_policy_max_latency_p95
+            or stats["useful_tokens_p50"] < settings.scraping_policy_min_useful_tokens
+        ):
+            return "snippet"
+        return "scrape"
+
+    @staticmethod
+    def _summarize(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        successes = [sample for sample in samples if sample.get("ok")]
+        latencies = [sample.get("latency", 0.0) for sample in samples]
+        return {
+            "samples": len(samples),
+            "success_rate": len(successes) / len(samples),
+            "latency_p50": DomainPolicyService._percentile(latencies, 0.5),
+            "latency_p95": DomainPolicyService._percentile(latencies, 0.95),
+            "bytes_p50": DomainPolicyService._percentile(
+                [sample.get("bytes", 0) for sample in successes], 0.5
+            ),
+            "useful_tokens_p50": DomainPolicyService._percentile(
+                [sample.get("tokens", 0) for sample in successes], 0.5
+            ),
+        }
+
+    @staticmethod
+    def _percentile(values: List[float], fraction: float) -> float:
+        """Return the nearest-rank percentile, or 0 for no values."""
+        if not values:
+            return 0
+        ordered = sorted(values)
+        rank = max(math.ceil(fraction * len(ordered)), 1)
+        return ordered[rank - 1]
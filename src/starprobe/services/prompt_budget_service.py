@@ -0,0 +1,251 @@
+import logging
+import re
+from typing import Any
+
+from starprobe.services.prompt_service import PromptService
+from starprobe.services.text_processing_service import (
+    TextProcessingService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PromptBudgetService:
+    """Service for fitting LLM prompts into the configured context window.
+
+    Dependencies:
+    - PromptService: For rendering the prompts being budgeted
+    - TextProcessingService: For token counting and truncation
+    """
+
+    # Approximate per-message token overhead added by chat templates
+    MESSAGE_OVERHEAD_TOKENS = 4
+    # Minimum weight so that low-relevance sources still receive some budget
+    MIN_SOURCE_WEIGHT = 0.1
+
+    _BLOCK_SEPARATOR = "\n---"
+    _SOURCE_SEPARATOR = re.compile(r"\n---(?:\n|$)")
+    _WORD_PATTERN = re.compile(r"\w+")
+
+    @staticmethod
+    def count_message_tokens(messages: list[Any]) -> int:
+        """Count the tokens of a whole message list, including per-message overhead."""
+        total = 0
+        for message in messages:
+            content = getattr(message, "content", message)
+            if not isinstance(content, str):
+                content = str(content)
+            total += (
+                TextProcessingService.count_tokens(content)
+                + PromptBudgetService.MESSAGE_OVERHEAD_TOKENS
+            )
+        return total
+
+    @staticmethod
+    def available_tokens(prompt_service: PromptService, reserved_tokens: int) -> int:
+        """Return the context budget left after reserving room for the completion."""
+        return prompt_service.configurable.max_context_tokens - max(reserved_tokens, 0)
+
+    @staticmethod
+    def allocate_budget(
+        sizes: list[int], weights: list[float], budget: int
+    ) -> list[int]:
+        """
+        Split a token budget across items proportionally to their weights.
+
+        Items that need less than their proportional share keep their full size and
+        the remainder is redistributed among the others (water-filling).
+
+        Args:
+            sizes: Token count of each item
+            weights: Relative weight of each item
+            budget: Total tokens available
+
+        Returns:
+            list[int]: Allocated tokens per item, never exceeding its size
+        """
+        allocation = [0] * len(sizes)
+        remaining = {index for index, size in enumerate(sizes) if size > 0}
+        budget_left = max(budget, 0)
+
+        while remaining and budget_left > 0:
+            total_weight = sum(weights[index] for index in remaining)
+            shares = {
+                index: budget_left * weights[index] / total_weight
+                for index in remaining
+            }
+            satisfied = [index for index in remaining if sizes[index] <= shares[index]]
+            if not satisfied:
+                for index in remaining:
+                    allocation[index] = int(shares[index])
+                break
+            for index in satisfied:
+                allocation[index] = sizes[index]
+                budget_left -= sizes[index]
+                remaining.discard(index)
+
+        return allocation
+
+    @staticmethod
+    def relevance_weight(text: str, research_topic: str) -> float:
+        """Score how many topic terms appear in text, floored at MIN_SOURCE_WEIGHT."""
+        topic_terms = set(
+            PromptBudgetService._WORD_PATTERN.findall(research_topic.lower())
+        )
+        if not topic_terms:
+            return 1.0
+        text_terms = set(PromptBudgetService._WORD_PATTERN.findall(text.lower()))
+        coverage = len(topic_terms & text_terms) / len(topic_terms)
+        return PromptBudgetService.MIN_SOURCE_WEIGHT + coverage
+
+    @staticmethod
+    def split_sources(web_research_results: list[str]) -> list[str]:
+        """Split formatted research results into individual source blocks."""
+        blocks: list[str] = []
+        for result in web_research_results:
+            for block in PromptBudgetService._SOURCE_SEPARATOR.split(result or ""):
+                if block.strip():
+                    blocks.append(block)
+        return blocks
+
+    @staticmethod
+    def build_query_prompt(
+        prompt_service: PromptService, research_topic: str, reserved_tokens: int = 0
+    ) -> list:
+        """Generate the query prompt, trimming the topic if it exceeds the budget."""
+        messages = prompt_service.generate_query_prompt(research_topic)
+        if prompt_service.configurable.max_context_tokens <= 0:
+            return messages
+
+        available = PromptBudgetService.available_tokens(
+            prompt_service, reserved_tokens
+        )
+        used = PromptBudgetService.count_message_tokens(messages)
+        if used <= available:
+            return messages
+
+        topic_tokens = TextProcessingService.count_tokens(research_topic)
+        topic_budget = max(topic_tokens - (used - available), 0)
+        logger.warning(
+            "Query prompt exceeds context budget, trimming research topic",
+            extra={"prompt_tokens": used, "available_tokens": available},
+        )
+        trimmed_topic = TextProcessingService.truncate_text_by_tokens(
+            research_topic, topic_budget
+        )
+        return prompt_service.generate_query_prompt(trimmed_topic)
+
+    @staticmethod
+    def build_summarize_prompt(
+        prompt_service: PromptService,
+        research_topic: str,
+        existing_summary: str,
+        web_research_results: list[str],
+        reserved_tokens: int = 0,
+    ) -> list:
+        """
+        Generate the summarize prompt trimmed to the configured context budget.
+
+        The budget left after the fixed prompt and the reserved completion tokens is
+        shared between the existing summary and the new sources. The summary gets at
+        most ``summary_context_ratio`` of it unless the sources need less, and the
+        sources split the rest weighted by their relevance to the research topic.
+
+        Args:
+            prompt_service: Service used to render the prompt
+            research_topic: The topic being researched
+            existing_summary: The current running summary, if any
+            web_research_results: Formatted research results to summarize
+            reserved_tokens: Tokens to keep free for the model's response
+
+        Returns:
+            list: Messages that fit within the context budget
+        """
+        new_context = "\n".join(web_research_results)
+        messages = prompt_service.generate_summarize_prompt(
+            research_topic=research_topic,
+            existing_summary=existing_summary,
+            new_context=new_context,
+        )
+        settings = prompt_service.configurable
+        if settings.max_context_tokens <= 0:
+            return messages
+
+        available = PromptBudgetService.available_tokens(
+            prompt_service, reserved_tokens
+        )
+        used = PromptBudgetService.count_message_tokens(messages)
+        if used <= available:
+            return messages
+
+        # Measure the fixed part of the prompt by rendering it without variable content
+        fixed_messages = prompt_service.generate_summarize_prompt(
+            research_topic=research_topic,
+            existing_summary=" " if existing_summary else "",
+            new_context="",
+        )
+        variable_budget = available - PromptBudgetService.count_message_tokens(
+            fixed_messages
+        )
+
+        summary_tokens = TextProcessingService.count_tokens(existing_summary or "")
+        sources = PromptBudgetService.split_sources(web_research_results)
+        source_tokens = [TextProcessingService.count_tokens(block) for block in sources]
+        # Reserve room for the separators re-added after each block, plus one token
+        # of slack per block because tokenization is not strictly additive
+        variable_budget -= len(sources) * (
+            TextProcessingService.count_tokens(PromptBudgetService._BLOCK_SEPARATOR) + 1
+        )
+        # The fixed prompt alone can exceed a tiny context window
+        variable_budget = max(variable_budget, 0)
+
+        summary_budget = min(
+            summary_tokens,
+            max(
+                int(variable_budget * settings.summary_context_ratio),
+                variable_budget - sum(source_tokens),
+            ),
+        )
+        source_budgets = PromptBudgetService.allocate_budget(
+            source_tokens,
+            [
+                PromptBudgetService.relevance_weight(block, research_topic)
+                for block in sources
+            ],
+            variable_budget - summary_budget,
+        )
+
+        logger.info(
+            "Summarize prompt exceeds context budget, trimming inputs",
+            extra={
+                "prompt_tokens": used,
+                "available_tokens": available,
+                "summary_budget": summary_budget,
+                "source_budgets": source_budgets,
+            },
+        )
+
+        trimmed_summary = existing_summary
+        if existing_summary and summary_budget < summary_tokens:
+            trimmed_summary = TextProcessingService.truncate_text_by_tokens(
+                existing_summary, summary_budget
+            )
+
+        trimmed_sources = [
+            (
+                block
+                if budget >= size
+                else TextProcessingService.truncate_text_by_tokens(block, budget)
+            )
+            for block, size, budget in zip(sources, source_tokens, source_budgets)
+        ]
+
+        return prompt_service.generate_summarize_prompt(
+            research_topic=research_topic,
+            existing_summary=trimmed_summary,
+            new_context="\n".join(
+                f"{block}{PromptBudgetService._BLOCK_SEPARATOR}"
+                for block in trimmed_sources
+                if block
+            ),
+        )
@@ -1,16 +1,24 @@
+import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from starprobe.config.ddgs_settings import DDGSSettings
 from starprobe.config.workflow_settings import WorkflowSettings
+from starprobe.observability.metrics import record_cache
 from starprobe.protocols.ddgs_client_protocol import (
     DDGSClientProtocol,
 )
 from starprobe.protocols.scraping_service_protocol import (
     ScrapingServiceProtocol,
 )
+from starprobe.services.domain_policy_service import DomainPolicyService
+from starprobe.services.result_ranking_service import ResultRankingService
 from starprobe.services.text_processing_service import (
     TextProcessingService,
 )
+from starprobe.services.url_canonicalization_service import (
+    UrlCanonicalizationService,
+)
 
 
 class ResearchService:
@@ -18,9 +26,13 @@ class ResearchService:
 
     Dependencies:
     - TextProcessingService: For formatting and deduplicating search results
+    - ResultRankingService: For choosing which search results to scrape
     - DDGSClientProtocol: For web search functionality
     - ScrapingServiceProtocol: For web scraping functionality
     - WorkflowSettings: For configuration
+    - DDGSSettings: For the number of search candidates to fetch
+    - UrlCanonicalizationService: For fetching equivalent URLs only once
+    - DomainPolicyService: Optional, for skipping or not scraping poor domains
     """
 
     def __init__(
@@ -28,40 +40,60 @@ class ResearchService:
         settings: WorkflowSettings,
         search_client: DDGSClientProtocol,
         scraper: ScrapingServiceProtocol,
+        ddgs_settings: Optional[DDGSSettings] = None,
+        url_canonicalizer: Optional[UrlCanonicalizationService] = None,
+        domain_policy: Optional[DomainPolicyService] = None,
     ):
         self.settings = settings
+        self.ddgs_settings = ddgs_settings or DDGSSettings()
+        self.url_canonicalizer = (
+            url_canonicalizer or UrlCanonicalizationService.default()
+        )
+        self.domain_policy = domain_policy
         self.search_client = search_client
         self.scraper = scraper
         self.logger = logging.getLogger(__name__)
 
     async def search_and_scrape(
-        self, query: str, loop_count: int
+        self,
+        query: str,
+        loop_count: int,
+        seen_fingerprints: Optional[list[int]] = None,
+        research_topic: str = "",
+        notes: Optional[list[str]] = None,
+        seen_urls: Optional[list[str]] = None,
     ) -> tuple[str, str, list[str]]:
-        """Perform web search and scraping, return formatted results, sources, and errors."""
+        """Perform web search and scraping, return formatted results, sources, and errors.
+
+        ``seen_fingerprints`` holds content fingerprints of sources used by earlier
+        loops; near-duplicates of them are dropped and the fingerprints of newly
+        kept sources are appended to it. ``research_topic`` is combined with the
+        query to select the most relevant passages of long sources. Non-fatal
+        diagnostics, such as cancelled scrapes, are appended to ``notes``.
+        ``seen_urls`` holds canonical URLs of sources used by earlier loops; they
+        are skipped before scraping and the URLs kept by this loop are appended.
+        """
         errors: list[str] = []
+        if notes is None:
+            notes = []
+        if seen_urls is None:
+            seen_urls = []
+        skip_urls = set(seen_urls) if self.settings.skip_seen_urls else set()
 
-        try:
-            # Step 1: Search the web
-            search_results = await self._perform_search(query, loop_count)
-        except Exception as exc:
-            message = f"Primary search failed for '{query}': {exc}"
-            self.logger.exception(message)
-            errors.append(message)
-            search_results = {"results": []}
+        # Ask for extra candidates to make up for results already used
+        max_results = self.ddgs_settings.ddgs_max_results + min(
+            len(skip_urls), max(self.settings.seen_url_extra_results, 0)
+        )
 
-        if not search_results.get("results"):
-            fallback_query = self._build_fallback_query(query)
-            errors.append(
-                f"No results returned for '{query}'. Retrying with '{fallback_query}'."
+        # Step 1: Search the web, falling back to a broader query
+        if self.settings.search_fallback_mode == "sequential":
+            search_results = await self._search_sequential(
+                query, loop_count, errors, max_results
+            )
+        else:
+            search_results = await self._search_concurrent(
+                query, loop_count, errors, max_results
             )
-            self.logger.warning(errors[-1])
-            try:
-                search_results = await self._perform_search(fallback_query, loop_count)
-            except Exception as exc:
-                message = f"Fallback search failed for '{fallback_query}': {exc}"
-                self.logger.exception(message)
-                errors.append(message)
-                search_results = {"results": []}
 
         offline_fallback = False
         if not search_results.get("results"):
@@ -76,33 +108,113 @@ class ResearchService:
             # Step 2: Instantiate scraper
             scraper = self.scraper
 
-            # Step 3: Loop through results and scrape each URL
+            ranking_query = f"{research_topic} {query}".strip()
             if "results" in search_results and not offline_fallback:
+                # Keep only the best-ranked candidates so that fewer pages are fetched
+                # Equivalent links share a canonical URL, which is only used as a
+                # key; the URL returned by search is fetched and cited
                 for result in search_results["results"]:
-                    url = result.get("url")
-                    if not url:
-                        continue
-
-                    # Try to scrape full content
-                    try:
-                        scraped_content = scraper.scrape(url)
-                        # Step 4: On success, update raw_content with scraped text
-                        if scraped_content:
-                            result["raw_content"] = scraped_content
-                    except Exception as e:
-                        # On failure, log at debug level and fall back to snippet from search
-                        # This is expected behavior (403, timeouts, etc.) so don't treat as error
-                        self.logger.debug(
-                            f"Scraping failed for {url}, using snippet: {e}"
+                    if result.get("url"):
+                        result["canonical_url"] = self.url_canonicalizer.canonicalize(
+                            result["url"]
+                        )
+                new_results = [
+                    result
+                    for result in search_results["results"]
+                    if result.get("canonical_url") not in skip_urls
+                ]
+                skipped = len(search_results["results"]) - len(new_results)
+                for result in search_results["results"]:
+                    record_cache(
+                        "scraped_url_memory",
+                        result.get("canonical_url") in skip_urls,
+                    )
+                if skipped:
+                    self.logger.info(
+                        "Skipped %d result(s) for '%s' already used in this run",
+                        skipped,
+                        query,
+                    )
+                    if not new_results:
+                        notes.append(
+                            f"All {skipped} results for '{query}' were already used "
+                            "by earlier research loops."
                         )
-                        # Use snippet from search engine as fallback
-                        result["raw_content"] = result.get("content", "")
-                        continue
+                ranked_results = ResultRankingService.rank_results(
+                    new_results,
+                    ranking_query,
+                    self.settings,
+                    self.url_canonicalizer,
+                )
+                ranked_results, snippet_only = self._apply_domain_policy(
+                    ranked_results, query
+                )
+
+                if self.settings.hedged_scraping:
+                    # Step 3: Scrape extra candidates concurrently, keep the first to finish
+                    kept_results = await self._scrape_hedged(
+                        ranked_results, ranking_query, query, notes, snippet_only
+                    )
+                else:
+                    kept_results = ranked_results[: self.settings.scrape_top_k]
+                    # Step 3: Loop through results and scrape each URL
+                    for result in kept_results:
+                        url = result.get("url")
+                        if not url:
+                            continue
+
+                        # Skip the fetch when the snippet already covers the query
+                        # or the domain rarely yields a useful page
+                        if (
+                            url in snippet_only
+                            or ResultRankingService.snippet_covers_query(
+                                result,
+                                ranking_query,
+                                self.settings.snippet_coverage_threshold,
+                            )
+                        ):
+                            result["raw_content"] = result.get(
+                                "raw_content"
+                            ) or result.get("content", "")
+                            continue
+
+                        # Try to scrape full content in a worker thread so that
+                        # the blocking fetch does not stall concurrent requests
+                        try:
+                            scraped_content = await asyncio.to_thread(
+                                scraper.scrape, url
+                            )
+                            # Step 4: On success, update raw_content with scraped text
+                            if scraped_content:
+                                result["raw_content"] = scraped_content
+                        except Exception as e:
+                            # On failure, log at debug level and fall back to snippet from search
+                            # This is expected behavior (403, timeouts, etc.) so don't treat as error
+                            self.logger.debug(
+                                "Scraping failed for %s, using snippet: %s", url, e
+                            )
+                            # Use snippet from search engine as fallback
+                            result["raw_content"] = result.get("content", "")
+                            continue
+
+                search_results = {**search_results, "results": kept_results}
+                seen_urls.extend(
+                    result["canonical_url"]
+                    for result in kept_results
+                    if result.get("canonical_url")
+                    and result["canonical_url"] not in skip_urls
+                )
+
+            # Drop syndicated copies and mirrors of sources already kept in this run
+            search_results = TextProcessingService.remove_near_duplicates(
+                search_results, self.settings, seen_fingerprints
+            )
 
             # Format results with scraped content using the new service
             search_str = TextProcessingService.deduplicate_and_format_sources(
                 search_results,
                 self.settings,
+                query=ranking_query,
             )
 
             sources = TextProcessingService.format_sources(search_results)
@@ -115,9 +227,260 @@ class ResearchService:
             errors.append(message)
             return "", "", errors
 
-    async def _perform_search(self, query: str, loop_count: int):
+    async def _search_sequential(
+        self,
+        query: str,
+        loop_count: int,
+        errors: list[str],
+        max_results: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search with the primary query and retry with the fallback if it is empty."""
+        try:
+            search_results = await self._perform_search(query, loop_count, max_results)
+        except Exception as exc:
+            message = f"Primary search failed for '{query}': {exc}"
+            self.logger.exception(message)
+            errors.append(message)
+            search_results = {"results": []}
+
+        if not search_results.get("results"):
+            fallback_query = self._build_fallback_query(query)
+            errors.append(
+                f"No results returned for '{query}'. Retrying with '{fallback_query}'."
+            )
+            self.logger.warning(errors[-1])
+            try:
+                search_results = await self._perform_search(
+                    fallback_query, loop_count, max_results
+                )
+            except Exception as exc:
+                message = f"Fallback search failed for '{fallback_query}': {exc}"
+                self.logger.exception(message)
+                errors.append(message)
+                search_results = {"results": []}
+
+        return search_results
+
+    async def _search_concurrent(
+        self,
+        query: str,
+        loop_count: int,
+        errors: list[str],
+        max_results: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run the primary and fallback queries concurrently.
+
+        The fallback starts after ``search_fallback_delay_seconds``. In ``race``
+        mode the first non-empty result set wins, preferring the primary query when
+        both are done, and the other search is cancelled, so a primary query that
+        returns results within the delay means the fallback is never sent. In
+        ``merge`` mode both queries always run and their result sets are combined,
+        primary results first.
+        """
+        fallback_query = self._build_fallback_query(query)
+        primary = asyncio.create_task(
+            self._perform_search(query, loop_count, max_results)
+        )
+        fallback = asyncio.create_task(
+            self._perform_delayed_search(
+                fallback_query,
+                loop_count,
+                self.settings.search_fallback_delay_seconds,
+                max_results,
+            )
+        )
+        labels = {
+            primary: f"Primary search failed for '{query}'",
+            fallback: f"Fallback search failed for '{fallback_query}'",
+        }
+        results: dict[asyncio.Task, List[Dict[str, Any]]] = {}
+        failures: dict[asyncio.Task, str] = {}
+        pending = {primary, fallback}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        results[task] = task.result().get("results", [])
+                    except Exception as exc:
+                        failures[task] = f"{labels[task]}: {exc}"
+                        self.logger.warning(failures[task])
+                        results[task] = []
+                if self.settings.search_fallback_mode == "race" and (
+                    results.get(primary) or results.get(fallback)
+                ):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        primary_results = results.get(primary, [])
+        fallback_results = results.get(fallback, [])
+        if self.settings.search_fallback_mode == "race":
+            combined = primary_results or fallback_results
+        else:
+            seen_urls = {result.get("url") for result in primary_results}
+            combined = primary_results + [
+                result
+                for result in fallback_results
+                if result.get("url") not in seen_urls
+            ]
+
+        # Failures only matter when the primary query did not deliver
+        if not primary_results and primary in results:
+            if primary in failures:
+                errors.append(failures[primary])
+            errors.append(
+                f"No results returned for '{query}'. Used fallback '{fallback_query}'."
+            )
+            if fallback in failures:
+                errors.append(failures[fallback])
+        elif pending:
+            self.logger.info(
+                "Cancelled %d search(es) no longer needed for '%s'", len(pending), query
+            )
+
+        return {"results": combined}
+
+    async def _perform_delayed_search(
+        self,
+        query: str,
+        loop_count: int,
+        delay_seconds: float,
+        max_results: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Wait for the hedge delay, then search."""
+        if delay_seconds > 0:
+            await asyncio.sleep(delay_seconds)
+        return await self._perform_search(query, loop_count, max_results)
+
+    def _apply_domain_policy(
+        self, ranked_results: List[Dict[str, Any]], query: str
+    ) -> tuple[List[Dict[str, Any]], set[str]]:
+        """
+        Drop results from skipped domains and find those that should not be scraped.
+
+        Returns:
+            tuple: The remaining results in rank order and the URLs that should use
+            their search snippet instead of being scraped
+        """
+        if self.domain_policy is None:
+            return ranked_results, set()
+
+        kept: List[Dict[str, Any]] = []
+        snippet_only: set[str] = set()
+        for result in ranked_results:
+            decision = self.domain_policy.decide(result["url"])
+            if decision == "skip":
+                continue
+            if decision == "snippet":
+                snippet_only.add(result["url"])
+            kept.append(result)
+
+        skipped = len(ranked_results) - len(kept)
+        if skipped or snippet_only:
+            self.logger.info(
+                "Domain policy for '%s': skipped %d result(s), %d snippet-only",
+                query,
+                skipped,
+                len(snippet_only),
+            )
+        return kept, snippet_only
+
+    async def _scrape_hedged(
+        self,
+        ranked_results: List[Dict[str, Any]],
+        ranking_query: str,
+        query: str,
+        notes: list[str],
+        snippet_only: Optional[set[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape k+m candidates concurrently and stop once k documents have arrived.
+
+        The stage also ends when ``scrape_deadline_seconds`` elapses. Fetches still
+        running at that point are cancelled and their results keep the search
+        snippet. The k kept results prefer scraped documents, in rank order.
+        Candidates in ``snippet_only`` are never fetched.
+        """
+        snippet_only = snippet_only or set()
+        top_k = self.settings.scrape_top_k
+        candidates = ranked_results[: top_k + max(self.settings.scrape_hedge_extra, 0)]
+        usable: set[int] = set()
+        tasks: dict[asyncio.Task, int] = {}
+
+        for index, result in enumerate(candidates):
+            # Fallback content until a scrape replaces it
+            result["raw_content"] = result.get("raw_content") or result.get(
+                "content", ""
+            )
+            if ResultRankingService.snippet_covers_query(
+                result, ranking_query, self.settings.snippet_coverage_threshold
+            ):
+                usable.add(index)
+            elif result["url"] not in snippet_only:
+                task = asyncio.create_task(
+                    asyncio.to_thread(self.scraper.scrape, result["url"])
+                )
+                tasks[task] = index
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.scrape_deadline_seconds
+        pending = set(tasks)
+        while pending and len(usable) < top_k:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                index = tasks[task]
+                try:
+                    scraped_content = task.result()
+                except Exception as e:
+                    self.logger.debug(
+                        "Scraping failed for %s, using snippet: %s",
+                        candidates[index]["url"],
+                        e,
+                    )
+                    continue
+                if scraped_content:
+                    candidates[index]["raw_content"] = scraped_content
+                    usable.add(index)
+
+        if pending:
+            # Threads cannot be interrupted, but their results are no longer awaited
+            for task in pending:
+                task.cancel()
+            reason = (
+                f"{top_k} documents had arrived"
+                if len(usable) >= top_k
+                else f"the {self.settings.scrape_deadline_seconds:g}s scrape deadline"
+            )
+            notes.append(
+                f"Cancelled {len(pending)} of {len(tasks)} scrapes for '{query}' "
+                f"after {reason}; using search snippets instead."
+            )
+            self.logger.info(notes[-1])
+
+        order = sorted(
+            range(len(candidates)), key=lambda index: (index not in usable, index)
+        )
+        return [candidates[index] for index in order[:top_k]]
+
+    async def _perform_search(
+        self, query: str, loop_count: int, max_results: Optional[int] = None
+    ):
         """Perform the actual search using the configured search backend."""
-        return await self.search_client.search(query, max_results=3)
+        return await self.search_client.search(
+            query, max_results=max_results or self.ddgs_settings.ddgs_max_results
+        )
 
     def _build_fallback_query(self, query: str) -> str:
         """Create a deterministic fallback query based on the original one."""
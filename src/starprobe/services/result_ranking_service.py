@@ -0,0 +1,147 @@
+import re
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from starprobe.config.workflow_settings import WorkflowSettings
+from starprobe.services.url_canonicalization_service import (
+    UrlCanonicalizationService,
+)
+
+
+class ResultRankingService:
+    """Service for choosing which search results are worth scraping.
+
+    Results are scored from the search response alone, without fetching any
+    page, so the ranking costs nothing compared to a scrape.
+
+    Dependencies:
+    - WorkflowSettings: For the scrape budget, snippet threshold and domain priors
+    - UrlCanonicalizationService: For detecting duplicate URLs
+    """
+
+    # Relative weight of title and snippet term coverage in the score
+    TITLE_WEIGHT = 0.6
+    SNIPPET_WEIGHT = 0.4
+    # Bonus for the search engine's own ordering, used mainly to break ties
+    POSITION_WEIGHT = 0.1
+    # Snippets shorter than this never replace a scrape
+    MIN_SNIPPET_WORDS = 25
+    # Shorter titles ("Home", "Latest news") only mark duplicates on the same host
+    MIN_CROSS_HOST_TITLE_WORDS = 4
+
+    _WORD_PATTERN = re.compile(r"\w+")
+
+    @staticmethod
+    def query_terms(query: str) -> set[str]:
+        """Return the distinctive lowercase terms of a query."""
+        return {
+            term
+            for term in ResultRankingService._WORD_PATTERN.findall(
+                (query or "").lower()
+            )
+            if len(term) > 2
+        }
+
+    @staticmethod
+    def coverage(text: str, terms: set[str]) -> float:
+        """Return the share of terms that appear in text."""
+        if not terms:
+            return 0.0
+        words = set(ResultRankingService._WORD_PATTERN.findall((text or "").lower()))
+        return len(terms & words) / len(terms)
+
+    @staticmethod
+    def domain_prior(url: str, priors: Dict[str, float]) -> float:
+        """
+        Return the prior for a URL's domain.
+
+        Keys match the host itself or any parent domain, so ``gov`` matches every
+        ``.gov`` host. The most specific matching key wins.
+        """
+        host = ResultRankingService._host(url)
+        matches = [
+            key
+            for key in priors
+            if host == key.lower() or host.endswith("." + key.lower())
+        ]
+        if not matches:
+            return 0.0
+        return priors[max(matches, key=len)]
+
+    @staticmethod
+    def rank_results(
+        results: List[Dict[str, Any]],
+        query: str,
+        settings: WorkflowSettings,
+        canonicalizer: Optional[UrlCanonicalizationService] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank search results by their likely usefulness and drop duplicates.
+
+        Args:
+            results: Results as returned by the search client
+            query: The search query and research topic to rank against
+            settings: Workflow settings with the domain priors
+            canonicalizer: Service used to detect equivalent URLs
+
+        Returns:
+            List[Dict[str, Any]]: Unique results with a URL, best first
+        """
+        canonicalizer = canonicalizer or UrlCanonicalizationService.default()
+        terms = ResultRankingService.query_terms(query)
+        count = len(results)
+        scored = []
+        seen_urls: set[str] = set()
+        seen_titles: set[str] = set()
+
+        for position, result in enumerate(results):
+            url = result.get("url")
+            if not url:
+                continue
+            url_key = canonicalizer.canonicalize(url)
+            title_words = ResultRankingService._WORD_PATTERN.findall(
+                (result.get("title") or "").lower()
+            )
+            title_key = " ".join(title_words)
+            if (
+                title_key
+                and len(title_words) < ResultRankingService.MIN_CROSS_HOST_TITLE_WORDS
+            ):
+                # Generic titles are shared by distinct pages on different sites
+                title_key = f"{urlsplit(url_key).hostname or ''} {title_key}"
+            if url_key in seen_urls or (title_key and title_key in seen_titles):
+                continue
+            seen_urls.add(url_key)
+            if title_key:
+                seen_titles.add(title_key)
+
+            score = (
+                ResultRankingService.TITLE_WEIGHT
+                * ResultRankingService.coverage(result.get("title", ""), terms)
+                + ResultRankingService.SNIPPET_WEIGHT
+                * ResultRankingService.coverage(result.get("content", ""), terms)
+                + ResultRankingService.POSITION_WEIGHT * (1 - position / count)
+                + ResultRankingService.domain_prior(url, settings.domain_priors)
+            )
+            scored.append((score, position, result))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [result for _, _, result in scored]
+
+    @staticmethod
+    def snippet_covers_query(
+        result: Dict[str, Any], query: str, threshold: float
+    ) -> bool:
+        """Return True when the snippet alone is long and relevant enough to use."""
+        snippet = result.get("content") or ""
+        if len(snippet.split()) < ResultRankingService.MIN_SNIPPET_WORDS:
+            return False
+        terms = ResultRankingService.query_terms(query)
+        return (
+            bool(terms) and ResultRankingService.coverage(snippet, terms) >= threshold
+        )
+
+    @staticmethod
+    def _host(url: str) -> str:
+        host = (urlsplit(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
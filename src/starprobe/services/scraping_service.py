@@ -1,22 +1,61 @@
+import importlib.util
 import ipaddress
 import socket
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional
 from urllib.parse import urlparse
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 
 from ..config.scraping_settings import ScrapingSettings
+from ..observability.metrics import track_call
+from ..observability.tracing import set_span_attributes
+from .domain_policy_service import DomainPolicyService
+from .text_processing_service import TextProcessingService
+
+# Useful tokens are only counted up to this many, so that long pages are not
+# fully encoded just to record domain stats
+USEFUL_TOKENS_CAP = 1000
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 
 
 class ScrapingService:
     """Service for web scraping with URL validation and content extraction.
 
+    Pages are fetched through one long-lived pooled HTTP client, so connections
+    to a host are kept alive and reused across scrapes and requests. The client
+    is created on first use and released by ``close``.
+
     Dependencies:
-    - None (standalone service using requests and BeautifulSoup)
+    - DomainPolicyService: Optional, records the outcome of every scrape
     """
 
-    def __init__(self, settings: ScrapingSettings):
+    def __init__(
+        self,
+        settings: ScrapingSettings,
+        domain_policy: Optional[DomainPolicyService] = None,
+        http_client: Optional[httpx.Client] = None,
+    ):
         self.settings = settings
+        self.domain_policy = domain_policy
+        self._http_client = http_client
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._http2_responses = 0
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """The pooled HTTP client, created on first use."""
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = create_http_client(self.settings)
+            return self._http_client
 
     def validate_url(self, url: str) -> None:
         parsed = urlparse(url)
@@ -29,12 +68,16 @@ class ScrapingService:
 
     def _is_private_host(self, host: str) -> bool:
         addrs = set()
-        for family in (socket.AF_INET, socket.AF_INET6):
-            try:
-                for info in socket.getaddrinfo(host, None, family):
-                    addrs.add(info[4][0])
-            except socket.gaierror:
-                continue
+        with track_call("dns_resolve"):
+            for family in (socket.AF_INET, socket.AF_INET6):
+                try:
+                    for info in socket.getaddrinfo(host, None, family):
+                        addrs.add(info[4][0])
+                except socket.gaierror:
+                    continue
+            set_span_attributes(
+                {"server.address": host, "starprobe.dns.addresses": len(addrs)}
+            )
 
         # If DNS resolution fails (fictional host)
         if not addrs:
@@ -56,6 +99,41 @@ class ScrapingService:
         return False
 
     def scrape(self, url: str, timeout=None) -> str:
+        started = time.perf_counter()
+        try:
+            content, size = self._fetch(url, timeout)
+        except Exception:
+            self._record(url, False, started)
+            raise
+        self._record(url, True, started, size, content)
+        return content
+
+    def _record(
+        self,
+        url: str,
+        success: bool,
+        started: float,
+        size: int = 0,
+        content: str = "",
+    ) -> None:
+        if self.domain_policy is not None:
+            elapsed = time.perf_counter() - started
+            self.domain_policy.record(
+                url,
+                success,
+                elapsed,
+                size,
+                TextProcessingService.count_tokens_up_to(
+                    content,
+                    max(
+                        self.settings.scraping_policy_min_useful_tokens,
+                        USEFUL_TOKENS_CAP,
+                    ),
+                ),
+            )
+
+    def _fetch(self, url: str, timeout=None) -> tuple[str, int]:
+        """Fetch a page and return its visible text and the response size."""
         self.validate_url(url)
 
         if timeout is None:
@@ -64,28 +142,125 @@ class ScrapingService:
                 self.settings.scraping_timeout_read,
             )
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+        headers = {"User-Agent": USER_AGENT, "Accept-Encoding": accept_encoding()}
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
         try:
-            response = requests.get(
-                url, headers=headers, timeout=timeout, allow_redirects=False
-            )
-            response.raise_for_status()
-        except requests.RequestException as e:
+            with track_call("scrape_fetch"):
+                set_span_attributes({"url.full": url})
+                response = self.http_client.get(
+                    url,
+                    headers=headers,
+                    timeout=_as_timeout(timeout),
+                    follow_redirects=False,
+                )
+                set_span_attributes(
+                    {
+                        "http.response.status_code": response.status_code,
+                        "http.response.body.size": len(response.content),
+                        "network.protocol.version": response.http_version,
+                    }
+                )
+                response.raise_for_status()
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            with self._lock:
+                self._errors += 1
             raise ValueError(f"Failed to retrieve content: {e}") from e
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        if response.http_version == "HTTP/2":
+            with self._lock:
+                self._http2_responses += 1
 
         # Early return for obviously non-HTML responses
         ctype = (response.headers.get("Content-Type") or "").lower()
         if not ("html" in ctype or ctype.startswith("text/")):
-            return ""
+            return "", len(response.content)
 
-        soup = BeautifulSoup(response.content, "html.parser")
-        for element in soup(["script", "style", "header", "footer", "nav", "aside"]):
-            element.decompose()
-        if soup.body:
-            content = soup.body.get_text(separator=" ", strip=True)
-        else:
-            content = ""
+        return self.extract_text(response.content), len(response.content)
 
-        return content
+    @staticmethod
+    def extract_text(html: bytes | str) -> str:
+        """Return the visible body text of an HTML page, without page chrome."""
+        with track_call("html_parse"):
+            soup = BeautifulSoup(html, "html.parser")
+            for element in soup(
+                ["script", "style", "header", "footer", "nav", "aside"]
+            ):
+                element.decompose()
+            text = soup.body.get_text(separator=" ", strip=True) if soup.body else ""
+            set_span_attributes(
+                {"starprobe.html.bytes": len(html), "starprobe.text.chars": len(text)}
+            )
+            return text
+
+    def metrics(self) -> Dict[str, float]:
+        """Return a snapshot of request and connection pool metrics."""
+        with self._lock:
+            client = self._http_client
+            metrics = {
+                "requests_total": self._requests,
+                "errors_total": self._errors,
+                "in_flight": self._in_flight,
+                "http2_responses_total": self._http2_responses,
+                "pool_max_connections": self.settings.scraping_max_connections,
+                "pool_max_keepalive_connections": self.settings.scraping_max_keepalive_connections,
+            }
+        # httpx does not expose its pool publicly; report it when reachable
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        metrics["pool_connections"] = len(connections)
+        metrics["pool_idle_connections"] = sum(
+            1 for connection in connections if connection.is_idle()
+        )
+        return metrics
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and its connections."""
+        with self._lock:
+            client, self._http_client = self._http_client, None
+        if client is not None:
+            client.close()
+
+
+def create_http_client(settings: ScrapingSettings) -> httpx.Client:
+    """
+    Create the pooled HTTP client used for scraping.
+
+    HTTP/2 is negotiated when enabled and the optional ``h2`` package is installed;
+    otherwise connections use HTTP/1.1 keep-alive.
+    """
+    return httpx.Client(
+        http2=settings.scraping_http2 and _module_available("h2"),
+        limits=httpx.Limits(
+            max_connections=settings.scraping_max_connections,
+            max_keepalive_connections=settings.scraping_max_keepalive_connections,
+            keepalive_expiry=settings.scraping_keepalive_expiry,
+        ),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def accept_encoding() -> str:
+    """Return the content encodings the HTTP client can decode."""
+    encodings = ["gzip", "deflate"]
+    if _module_available("brotli") or _module_available("brotlicffi"):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+def _module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def _as_timeout(timeout) -> httpx.Timeout:
+    """Convert a (connect, read) tuple or a single number to an httpx timeout."""
+    if isinstance(timeout, (tuple, list)):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
@@ -0,0 +1,157 @@
+import json
+from typing import Any, Dict, Optional
+
+from starprobe.observability.metrics import track_call
+from starprobe.observability.tracing import record_llm_usage
+from starprobe.protocols.llm_client_protocol import (
+    LLMClientProtocol,
+    StreamingLLMClientProtocol,
+)
+
+
+class IncrementalJsonParser:
+    """Incrementally scan streamed text for the first complete JSON object.
+
+    Characters are scanned once as they arrive, tracking brace depth and string
+    state, so a finished object is detected as soon as its closing brace is seen.
+    Any prose or code fences around the object are ignored.
+    """
+
+    def __init__(self, required_key: Optional[str] = None):
+        self.required_key = required_key
+        self.result: Optional[Dict[str, Any]] = None
+        self._text = ""
+        self._position = 0
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def text(self) -> str:
+        """Return all text fed to the parser so far."""
+        return self._text
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """Consume a chunk of text and return the object once it is complete."""
+        if self.result is not None:
+            return self.result
+        if not chunk:
+            return None
+
+        self._text += chunk
+        text = self._text
+
+        for index in range(self._position, len(text)):
+            char = text[index]
+
+            if self._start is None:
+                if char == "{":
+                    self._start = index
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    candidate = self._parse(text[self._start : index + 1])
+                    self._start = None
+                    if candidate is not None:
+                        self._position = index + 1
+                        self.result = candidate
+                        return candidate
+
+        self._position = len(text)
+        return None
+
+    def _parse(self, candidate: str) -> Optional[Dict[str, Any]]:
+        try:
+            parsed = json.loads(candidate)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(parsed, dict):
+            return None
+        if self.required_key and not parsed.get(self.required_key):
+            return None
+        return parsed
+
+
+class StructuredOutputService:
+    """Service for generating structured JSON output from an LLM.
+
+    Dependencies:
+    - LLMClientProtocol: For invoking the model
+    - StreamingLLMClientProtocol: Used instead when the client supports streaming
+    """
+
+    @staticmethod
+    def generation_kwargs(max_tokens: Optional[int]) -> Dict[str, Any]:
+        """Build the generation keyword arguments for a per-node token cap."""
+        if max_tokens is None or max_tokens <= 0:
+            return {}
+        return {"max_tokens": max_tokens}
+
+    @staticmethod
+    async def generate_json(
+        llm_client: LLMClientProtocol,
+        messages: list,
+        required_key: str,
+        max_tokens: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate a JSON object containing ``required_key`` from the LLM.
+
+        Streaming clients are read chunk by chunk and the stream is closed as soon
+        as a complete object with the required key has arrived, which cancels any
+        trailing generation. Other clients are invoked once and their full output
+        is parsed.
+
+        Args:
+            llm_client: Client for LLM interactions
+            messages: Prompt messages to send
+            required_key: Key that must be present, e.g. ``query`` or ``follow_up_query``
+            max_tokens: Optional cap on generated tokens
+
+        Returns:
+            The parsed object, or None when no valid object was produced
+        """
+        parser = IncrementalJsonParser(required_key=required_key)
+        kwargs = StructuredOutputService.generation_kwargs(max_tokens)
+
+        if not isinstance(llm_client, StreamingLLMClientProtocol):
+            with track_call("llm_invoke"):
+                result = await llm_client.invoke(messages, **kwargs)
+                record_llm_usage(messages, result)
+            return parser.feed(StructuredOutputService._content(result))
+
+        with track_call("llm_invoke"):
+            record_llm_usage(messages)
+            stream = llm_client.astream(messages, **kwargs)
+            try:
+                async for chunk in stream:
+                    if parser.feed(StructuredOutputService._content(chunk)) is not None:
+                        break
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+        return parser.result
+
+    @staticmethod
+    def _content(message: Any) -> str:
+        content = getattr(message, "content", message)
+        return content if isinstance(content, str) else ""
@@ -1,9 +1,16 @@
+import hashlib
+import math
 import re
-from typing import Any, Dict, List
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 import tiktoken
 
 from starprobe.config.workflow_settings import WorkflowSettings
+from starprobe.services.url_canonicalization_service import (
+    UrlCanonicalizationService,
+)
 
 
 class TextProcessingService:
@@ -33,6 +40,46 @@ class TextProcessingService:
                 source_parts.append(f"{r['url']} ({r['title']})")
         return "\n".join(source_parts)
 
+    @staticmethod
+    def get_encoding() -> tiktoken.Encoding:
+        """Return the process-wide tokenizer, loading it on first use."""
+        return _load_encoding(TextProcessingService.DEFAULT_ENCODING)
+
+    @staticmethod
+    def encoding_cache_info():
+        """Return the hit and miss counts of the tokenizer cache."""
+        return _load_encoding.cache_info()
+
+    @staticmethod
+    def count_tokens(text: str) -> int:
+        """Count the number of tokens in text using the default encoding."""
+        if not text:
+            return 0
+
+        encoding = TextProcessingService.get_encoding()
+        return len(encoding.encode(text, disallowed_special=()))
+
+    @staticmethod
+    def count_tokens_up_to(text: str, limit: int) -> int:
+        """
+        Count the tokens in text, stopping at ``limit``.
+
+        Only a character prefix long enough to hold ``limit`` tokens is encoded, so
+        the cost does not grow with the length of the text.
+
+        Args:
+            text (str): The text to count
+            limit (int): The largest count of interest
+
+        Returns:
+            int: The number of tokens in text, at most ``limit``
+        """
+        if not text or limit <= 0:
+            return 0
+        if _max_possible_tokens(text) > limit:
+            text = text[: limit * _CHARS_PER_TOKEN_UPPER_BOUND]
+        return min(TextProcessingService.count_tokens(text), limit)
+
     @staticmethod
     def truncate_text_by_tokens(text: str, max_tokens: int) -> str:
         """
@@ -48,50 +95,399 @@ class TextProcessingService:
         if not text:
             return ""
 
-        try:
-            # Load the tokenizer with the specified encoding
-            encoding = tiktoken.get_encoding(TextProcessingService.DEFAULT_ENCODING)
-        except Exception:
-            # If loading the encoding fails, fall back to loading by model name
-            encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
+        return TextProcessingService.truncate_texts_by_tokens([text], max_tokens)[0]
+
+    @staticmethod
+    def truncate_texts_by_tokens(texts: List[str], max_tokens: int) -> List[str]:
+        """
+        Truncate a batch of texts to the specified maximum number of tokens.
+
+        Texts that cannot exceed the limit are returned without encoding. Very long
+        texts are first cut to a character prefix that is certain to hold enough
+        tokens, so a large page is never fully encoded. The remaining texts are
+        encoded with ``encode_batch`` and decoded in a single ``decode_batch`` pass.
+
+        Args:
+            texts (List[str]): The texts to truncate
+            max_tokens (int): The maximum number of tokens allowed per text
+
+        Returns:
+            List[str]: The texts, each truncated to not exceed the maximum number of tokens
+        """
+        if max_tokens <= 0:
+            return ["" for _ in texts]
+
+        results = list(texts)
+        pending = [
+            index
+            for index, text in enumerate(texts)
+            if text and _max_possible_tokens(text) > max_tokens
+        ]
+        if not pending:
+            return results
+
+        encoding = TextProcessingService.get_encoding()
+        prefix_chars = max_tokens * _CHARS_PER_TOKEN_UPPER_BOUND
+        candidates = [texts[index][:prefix_chars] for index in pending]
+        encoded = _encode_batch(encoding, candidates)
+
+        # Prefixes that turned out too short to decide on are encoded in full
+        retry = [
+            position
+            for position, tokens in enumerate(encoded)
+            if len(candidates[position]) < len(texts[pending[position]])
+            and len(tokens) <= max_tokens + _PREFIX_TOKEN_MARGIN
+        ]
+        if retry:
+            full = _encode_batch(
+                encoding, [texts[pending[position]] for position in retry]
+            )
+            for position, tokens in zip(retry, full):
+                encoded[position] = tokens
+
+        truncate = [
+            position
+            for position, tokens in enumerate(encoded)
+            if len(tokens) > max_tokens
+        ]
+        decoded = _decode_batch(
+            encoding, [encoded[position][:max_tokens] for position in truncate]
+        )
+        for position, text in zip(truncate, decoded):
+            results[pending[position]] = text
+
+        return results
+
+    @staticmethod
+    def compute_simhash(text: str) -> Optional[int]:
+        """
+        Compute a 64-bit SimHash fingerprint over word 3-gram shingles.
+
+        Args:
+            text (str): The text to fingerprint
+
+        Returns:
+            Optional[int]: The fingerprint, or None when the text is too short to
+            fingerprint reliably
+        """
+        words = _WORD_PATTERN.findall((text or "")[:_FINGERPRINT_CHARS].lower())
+        if len(words) < _MIN_FINGERPRINT_WORDS:
+            return None
+
+        shingles = {
+            " ".join(words[index : index + _SHINGLE_SIZE])
+            for index in range(len(words) - _SHINGLE_SIZE + 1)
+        }
+        bit_rows = [
+            format(
+                int.from_bytes(
+                    hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(),
+                    "big",
+                ),
+                "064b",
+            )
+            for shingle in shingles
+        ]
+        # Count set bits per column and keep the bits set in most shingle hashes
+        half = len(bit_rows) / 2
+        bits = "".join(
+            "1" if column.count("1") > half else "0" for column in zip(*bit_rows)
+        )
+        return int(bits, 2)
+
+    @staticmethod
+    def hamming_distance(first: int, second: int) -> int:
+        """Return the number of differing bits between two fingerprints."""
+        return (first ^ second).bit_count()
+
+    @staticmethod
+    def remove_near_duplicates(
+        search_results: Dict[str, List[Dict[str, Any]]],
+        settings: WorkflowSettings,
+        seen_fingerprints: Optional[List[int]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Drop results whose content nearly duplicates an earlier source.
+
+        Each result's content is fingerprinted with SimHash and compared against the
+        results kept so far and against ``seen_fingerprints`` from earlier research
+        loops. Fingerprints of kept results are appended to ``seen_fingerprints`` so
+        the caller can carry them into the next loop.
+
+        Args:
+            search_results: Search response with scraped ``raw_content``
+            settings: Workflow settings with the near-duplicate threshold
+            seen_fingerprints: Fingerprints of sources already used in this run
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Search response without near-duplicates
+        """
+        if not search_results or "results" not in search_results:
+            return search_results
+        if not settings.remove_near_duplicates:
+            return search_results
 
-        # Encode the text into tokens
-        tokens = encoding.encode(text)
+        if seen_fingerprints is None:
+            seen_fingerprints = []
 
-        # If the number of tokens does not exceed the maximum, return the original text
-        if len(tokens) <= max_tokens:
-            return text
+        kept_results = []
+        for r in search_results.get("results", []):
+            content = r.get("raw_content") or r.get("content", "")
+            fingerprint = TextProcessingService.compute_simhash(content)
+            if fingerprint is not None:
+                if any(
+                    TextProcessingService.hamming_distance(fingerprint, seen)
+                    <= settings.near_duplicate_max_distance
+                    for seen in seen_fingerprints
+                ):
+                    continue
+                seen_fingerprints.append(fingerprint)
+            kept_results.append(r)
+
+        return {**search_results, "results": kept_results}
+
+    @staticmethod
+    def split_passages(text: str, max_words: int) -> List[str]:
+        """
+        Split text into passages of whole sentences with at most ``max_words`` words.
+
+        Sentences longer than ``max_words`` are split into word windows.
+
+        Args:
+            text (str): The text to split
+            max_words (int): The maximum number of words per passage
+
+        Returns:
+            List[str]: The passages in document order
+        """
+        max_words = max(max_words, 1)
+        passages: List[str] = []
+        current: List[str] = []
+        current_words = 0
 
-        # If the number of tokens exceeds the maximum, truncate to the maximum number of tokens
-        truncated_tokens = tokens[:max_tokens]
+        for sentence in _SENTENCE_BOUNDARY.split(text or ""):
+            words = sentence.split()
+            if not words:
+                continue
+            if current and current_words + len(words) > max_words:
+                passages.append(" ".join(current))
+                current, current_words = [], 0
+            for start in range(0, len(words), max_words):
+                window = words[start : start + max_words]
+                if len(window) == max_words:
+                    passages.append(" ".join(window))
+                else:
+                    current.append(" ".join(window))
+                    current_words += len(window)
 
-        # Decode the truncated tokens back to text
-        return encoding.decode(truncated_tokens)
+        if current:
+            passages.append(" ".join(current))
+        return passages
+
+    @staticmethod
+    def select_relevant_passages(
+        texts: List[str], query: str, max_tokens: int, max_words: int
+    ) -> List[str]:
+        """
+        Keep the passages of each text that are most relevant to the query.
+
+        Texts longer than ``max_tokens`` are split into passages, which are ranked
+        with BM25 against the query using one index over all passages of the batch.
+        The best passages of each text are kept in document order until its token
+        budget is full; passages that do not match the query fill any leftover
+        budget in document order. Texts that already fit, and texts with no passage
+        matching the query, are returned unchanged for plain truncation.
+
+        Args:
+            texts (List[str]): The source texts
+            query (str): The research topic and search query to rank against
+            max_tokens (int): The maximum number of tokens to keep per text
+            max_words (int): The maximum number of words per passage
+
+        Returns:
+            List[str]: The texts, long ones reduced to their most relevant passages
+        """
+        query_terms = set(_WORD_PATTERN.findall((query or "").lower()))
+        if not query_terms or max_tokens <= 0:
+            return list(texts)
+
+        long_texts = [
+            index
+            for index, text in enumerate(texts)
+            if text
+            and _max_possible_tokens(text) > max_tokens
+            and (
+                len(text) > max_tokens * _CHARS_PER_TOKEN_UPPER_BOUND
+                or TextProcessingService.count_tokens(text) > max_tokens
+            )
+        ]
+        passages = {
+            index: TextProcessingService.split_passages(texts[index], max_words)
+            for index in long_texts
+        }
+        documents = [
+            _WORD_PATTERN.findall(passage.lower())
+            for index in long_texts
+            for passage in passages[index]
+        ]
+        scores = iter(Bm25Index(documents).score(query_terms))
+
+        results = list(texts)
+        for index in long_texts:
+            ranked = sorted(
+                ((next(scores), position) for position in range(len(passages[index]))),
+                key=lambda item: (-item[0], item[1]),
+            )
+            if not ranked or ranked[0][0] <= 0:
+                continue
+
+            selected: List[int] = []
+            budget = max_tokens
+            misses = 0
+            # Unmatched passages rank last in document order and fill leftover budget
+            for _, position in ranked:
+                if budget <= 0 or misses >= _MAX_PASSAGE_MISSES:
+                    break
+                tokens = TextProcessingService.count_tokens(passages[index][position])
+                if tokens <= budget:
+                    selected.append(position)
+                    budget -= tokens
+                    misses = 0
+                else:
+                    misses += 1
+            if selected:
+                results[index] = "\n".join(
+                    passages[index][position] for position in sorted(selected)
+                )
+
+        return results
 
     @staticmethod
     def deduplicate_and_format_sources(
         search_results: Dict[str, List[Dict[str, Any]]],
         settings: WorkflowSettings,
+        query: str = "",
     ) -> str:
-        """Deduplicate and format search results into a single string."""
+        """
+        Deduplicate and format search results into a single string.
+
+        When ``query`` is given and passage selection is enabled, long sources keep
+        their most relevant passages instead of only their leading text.
+        """
         if not search_results or "results" not in search_results:
             return ""
 
-        all_content = []
+        canonicalizer = UrlCanonicalizationService.default()
+        urls = []
+        contents = []
         seen_urls = set()
 
         for r in search_results.get("results", []):
             url = r.get("url")
-            if url in seen_urls:
+            url_key = canonicalizer.canonicalize(url) if url else url
+            if url_key in seen_urls:
                 continue
-            seen_urls.add(url)
+            seen_urls.add(url_key)
 
             content = r.get("raw_content", r.get("content", ""))
             if content:
-                # Truncate the content to the configured maximum number of tokens
-                truncated_content = TextProcessingService.truncate_text_by_tokens(
-                    content, settings.max_tokens_per_source
-                )
-                all_content.append(f"Source: {url}\nContent: {truncated_content}\n---")
+                urls.append(url)
+                contents.append(content)
+
+        if query and settings.select_relevant_passages:
+            contents = TextProcessingService.select_relevant_passages(
+                contents,
+                query,
+                settings.max_tokens_per_source,
+                settings.passage_max_words,
+            )
+
+        # Truncate all contents to the configured maximum number of tokens at once
+        truncated_contents = TextProcessingService.truncate_texts_by_tokens(
+            contents, settings.max_tokens_per_source
+        )
 
+        all_content = [
+            f"Source: {url}\nContent: {truncated_content}\n---"
+            for url, truncated_content in zip(urls, truncated_contents)
+        ]
         return "\n".join(all_content)
+
+
+_WORD_PATTERN = re.compile(r"\w+")
+# Only the beginning of a page is fingerprinted to keep the cost bounded
+_FINGERPRINT_CHARS = 20_000
+# Texts shorter than this (e.g. search snippets) are never treated as duplicates
+_MIN_FINGERPRINT_WORDS = 50
+_SHINGLE_SIZE = 3
+# Stop filling a source's budget after this many passages in a row do not fit
+_MAX_PASSAGE_MISSES = 3
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+")
+
+# Upper bound on characters per token used to cut long texts before encoding;
+# English prose averages about four characters per token
+_CHARS_PER_TOKEN_UPPER_BOUND = 12
+# Extra tokens a character prefix must hold beyond the limit so that the cut
+# cannot change the kept tokens
+_PREFIX_TOKEN_MARGIN = 32
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(name: str) -> tiktoken.Encoding:
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception:
+        # If loading the encoding fails, fall back to loading by model name
+        return tiktoken.encoding_for_model("gpt-3.5-turbo")
+
+
+def _max_possible_tokens(text: str) -> int:
+    # Every token covers at least one UTF-8 byte
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _encode_batch(encoding: tiktoken.Encoding, texts: List[str]) -> List[List[int]]:
+    # encode_batch dispatches to a thread pool, which only pays off for several texts
+    if len(texts) == 1:
+        return [encoding.encode(texts[0], disallowed_special=())]
+    return encoding.encode_batch(texts, disallowed_special=())
+
+
+def _decode_batch(encoding: tiktoken.Encoding, batch: List[List[int]]) -> List[str]:
+    if len(batch) == 1:
+        return [encoding.decode(batch[0])]
+    return encoding.decode_batch(batch)
+
+
+class Bm25Index:
+    """Okapi BM25 scores for a small in-memory collection of tokenized documents."""
+
+    def __init__(self, documents: List[List[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_frequencies = [Counter(document) for document in documents]
+        self.lengths = [len(document) for document in documents]
+        self.average_length = sum(self.lengths) / len(documents) if documents else 0.0
+        document_frequencies = Counter(
+            term for frequencies in self.term_frequencies for term in frequencies
+        )
+        count = len(documents)
+        self.idf = {
+            term: math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequencies.items()
+        }
+
+    def score(self, query_terms: set[str]) -> List[float]:
+        """Return the BM25 score of every document for the query terms."""
+        scores = []
+        for frequencies, length in zip(self.term_frequencies, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.average_length or 1))
+            score = 0.0
+            for term in query_terms:
+                frequency = frequencies.get(term)
+                if frequency:
+                    score += (
+                        self.idf[term] * frequency * (self.k1 + 1) / (frequency + norm)
+                    )
+            scores.append(score)
+        return scores
@@ -0,0 +1,127 @@
+import re
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+from starprobe.config.url_settings import UrlSettings
+
+
+class UrlCanonicalizationService:
+    """Service that maps equivalent URLs to one canonical form.
+
+    The canonical form is used wherever URLs are compared or used as keys:
+    search result merging, scrape selection, source deduplication and caches.
+    Which differences are ignored is controlled by ``UrlSettings``.
+
+    Dependencies:
+    - UrlSettings: For the canonicalization rules
+    """
+
+    _DEFAULT_PORTS = {"http": 80, "https": 443}
+    # AMP caches that embed the original URL: /amp/s/<host>/<path> and /c/s/<host>/<path>
+    _AMP_CACHE_PATH = re.compile(r"^/(?:amp|c)/(s/)?(?P<rest>[^/]+\.[^/]+(?:/.*)?)$")
+    # AMP markers in paths: /story/amp, /story.amp, /amp/story and /story.amp.html
+    _AMP_PATH_MARKER = re.compile(r"(?:/amp|\.amp)(?=/?$)|/amp(?=/)|\.amp(?=\.html?$)")
+
+    def __init__(self, settings: Optional[UrlSettings] = None):
+        self.settings = settings or UrlSettings()
+
+    @staticmethod
+    def default() -> "UrlCanonicalizationService":
+        """Return a process-wide instance configured from the environment."""
+        return _default_service()
+
+    def canonicalize(self, url: str) -> str:
+        """
+        Return the canonical form of a URL.
+
+        Values that are not absolute http(s) URLs are returned stripped but
+        otherwise unchanged.
+
+        Args:
+            url (str): The URL to canonicalize
+
+        Returns:
+            str: The canonical URL
+        """
+        url = (url or "").strip()
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in self._DEFAULT_PORTS or not parts.hostname:
+            return url
+
+        settings = self.settings
+        host = parts.hostname.lower().rstrip(".")
+        path = parts.path or "/"
+        query = parts.query
+
+        if settings.url_collapse_amp:
+            host, path = self._collapse_amp_cache(host, path)
+
+        if settings.url_strip_www and host.startswith("www."):
+            host = host[4:]
+        if settings.url_strip_mobile_subdomain:
+            labels = host.split(".")
+            if len(labels) > 2 and "m" in labels[:-2]:
+                labels.remove("m")
+                host = ".".join(labels)
+        if settings.url_collapse_amp:
+            if host.startswith("amp.") and host.count(".") > 1:
+                host = host[4:]
+            path = self._AMP_PATH_MARKER.sub("", path) or "/"
+
+        if settings.url_force_https:
+            scheme = "https"
+        if port is not None and port != self._DEFAULT_PORTS.get(parts.scheme.lower()):
+            host = f"{host}:{port}"
+
+        # Normalise percent-encoding so %7E and ~ compare equal
+        path = quote(unquote(path), safe="/:@!$&'()*+,;=-._~%")
+        if settings.url_strip_trailing_slash and len(path) > 1:
+            path = path.rstrip("/") or "/"
+
+        params = [
+            (key, value)
+            for key, value in parse_qsl(query, keep_blank_values=True)
+            if not self._is_dropped_param(key)
+        ]
+        if settings.url_sort_query:
+            params.sort()
+        query = urlencode(params, doseq=True)
+
+        fragment = "" if settings.url_strip_fragment else parts.fragment
+        return urlunsplit((scheme, host, path, query, fragment))
+
+    def same_url(self, first: str, second: str) -> bool:
+        """Return True when two URLs canonicalize to the same value."""
+        return self.canonicalize(first) == self.canonicalize(second)
+
+    def _is_dropped_param(self, key: str) -> bool:
+        key = key.lower()
+        return any(
+            fnmatchcase(key, pattern.lower())
+            for pattern in self.settings.url_drop_query_params
+        )
+
+    def _collapse_amp_cache(self, host: str, path: str) -> tuple[str, str]:
+        is_google_amp = host in ("google.com", "www.google.com") and path.startswith(
+            "/amp/"
+        )
+        is_amp_cdn = host.endswith(".cdn.ampproject.org")
+        if not (is_google_amp or is_amp_cdn):
+            return host, path
+        match = self._AMP_CACHE_PATH.match(path)
+        if not match:
+            return host, path
+        original_host, _, original_path = match.group("rest").partition("/")
+        return original_host.lower(), f"/{original_path}"
+
+
+@lru_cache(maxsize=1)
+def _default_service() -> UrlCanonicalizationService:
+    return UrlCanonicalizationService()
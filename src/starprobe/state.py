@@ -13,7 +13,14 @@ class SummaryState:
     sources_gathered: Annotated[list, operator.add] = field(default_factory=list)
     research_loop_count: int = field(default=0)
     running_summary: str = field(default=None)
+    content_fingerprints: Annotated[list[int], operator.add] = field(
+        default_factory=list
+    )
+    seen_urls: Annotated[list[str], operator.add] = field(default_factory=list)
     errors: Annotated[list[str], operator.add] = field(default_factory=list)
+    notes: Annotated[list[str], operator.add] = field(default_factory=list)
+    timings: Annotated[list[dict], operator.add] = field(default_factory=list)
+    memory: Annotated[list[dict], operator.add] = field(default_factory=list)
 
 
 @dataclass(kw_only=True)
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from dev.mocks import LatencyProfile, MockLLMClient, MockScrapingService
+from starprobe.config import WorkflowSettings
+from starprobe.services import PromptService
+
+
+async def test_mock_llm_answers_query_and_summarize_prompts():
+    client = MockLLMClient(query="battery storage", summary_chars=100)
+    prompt_service = PromptService(WorkflowSettings())
+
+    query = await client.invoke(prompt_service.generate_query_prompt("batteries"))
+    summary = await client.invoke(
+        prompt_service.generate_summarize_prompt("batteries", "", "Source: x")
+    )
+    tool_call = await client.bind_tools(["Query"]).invoke(
+        [SystemMessage(content="Write a query"), HumanMessage(content="batteries")]
+    )
+
+    assert json.loads(query.content)["query"] == "battery storage"
+    assert len(summary.content) == 100
+    assert tool_call.tool_calls[0]["args"]["query"] == "battery storage"
+
+
+async def test_mock_llm_injects_failures():
+    client = MockLLMClient(latency=LatencyProfile(failure_rate=1.0))
+
+    with pytest.raises(RuntimeError):
+        await client.invoke([HumanMessage(content="topic")])
+
+
+def test_latency_profile_parse_and_sample():
+    profile = LatencyProfile.parse("lognormal:0.5:0.4", seed=1)
+    delays = [profile.sample_delay() for _ in range(2000)]
+
+    assert profile.distribution == "lognormal"
+    assert sum(delays) / len(delays) == pytest.approx(0.5, rel=0.1)
+    assert LatencyProfile.parse("0.2").sample_delay() == 0.2
+    with pytest.raises(ValueError):
+        LatencyProfile.parse("gamma:1")
+
+
+def test_mock_scraper_injects_failures():
+    scraper = MockScrapingService(latency=LatencyProfile(failure_rate=1.0))
+
+    with pytest.raises(ValueError):
+        scraper.scrape("https://example.com")
@@ -0,0 +1,61 @@
+import httpx
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from dev.mocks import MockLLMClient, MockSearchClient
+from dev.mocks.replay import (
+    RecordingLLMClient,
+    RecordingSearchClient,
+    RecordingTransport,
+    ReplayArchive,
+    ReplayLLMClient,
+    ReplayScrapingService,
+    ReplaySearchClient,
+)
+from starprobe.services import PromptService
+
+PAGE = b"<html><body><nav>Menu</nav><p>Recorded article text</p></body></html>"
+
+
+async def test_search_and_llm_round_trip_through_archive(tmp_path):
+    archive = ReplayArchive(["batteries"])
+    search = RecordingSearchClient(MockSearchClient(), archive)
+    llm = RecordingLLMClient(MockLLMClient(query="battery storage"), archive)
+    messages = [
+        SystemMessage(content=f"Today is {PromptService.get_current_date()}"),
+        HumanMessage(content="batteries"),
+    ]
+    recorded_results = await search.search("batteries", 2)
+    recorded_call = await llm.bind_tools(["Query"]).invoke(messages)
+    archive.save(tmp_path / "archive.json.gz")
+
+    loaded = ReplayArchive.load(tmp_path / "archive.json.gz")
+    replay_search = ReplaySearchClient(loaded, speed=0)
+    replay_llm = ReplayLLMClient(loaded, speed=0)
+
+    assert loaded.topics == ["batteries"]
+    assert await replay_search.search("batteries", 2) == recorded_results
+    assert await replay_search.search("unrecorded", 2) == {"results": []}
+    replayed_call = await replay_llm.bind_tools(["Query"]).invoke(messages)
+    assert replayed_call.tool_calls == recorded_call.tool_calls
+    with pytest.raises(LookupError):
+        await replay_llm.invoke(messages)
+
+
+def test_scraped_pages_replay_through_text_extraction():
+    archive = ReplayArchive()
+    inner = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, content=PAGE, headers={"Content-Type": "text/html"}
+        )
+    )
+    with httpx.Client(transport=RecordingTransport(inner, archive)) as client:
+        client.get("https://news.example.com/article")
+
+    scraper = ReplayScrapingService(archive, speed=0)
+
+    assert scraper.scrape("https://news.example.com/article") == (
+        "Recorded article text"
+    )
+    with pytest.raises(ValueError):
+        scraper.scrape("https://news.example.com/unrecorded")
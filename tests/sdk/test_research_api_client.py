@@ -62,3 +62,16 @@ def test_mock_research_api_client_returns_static_payload():
     assert result.error_message is None
     assert result.diagnostics == []
     assert result.processing_time == 0.1
+
+
+def test_research_response_exposes_timings():
+    response = ResearchResponse(
+        success=True,
+        metadata={
+            "timings": {"refine_query": {"duration": 0.5, "calls": {}}},
+        },
+        processing_time=1.0,
+    )
+
+    assert response.timings == {"refine_query": {"duration": 0.5, "calls": {}}}
+    assert ResearchResponse(success=False, processing_time=0.1).timings == {}
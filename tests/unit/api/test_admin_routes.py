@@ -0,0 +1,56 @@
+"""Unit tests for the admin routes."""
+
+import random
+
+import pytest
+from fastapi import HTTPException
+
+from starprobe.api.router import (
+    list_domain_stats,
+    reset_domain_stats,
+    scraping_metrics,
+)
+from starprobe.config import AppSettings, ScrapingSettings
+from starprobe.services import DomainPolicyService, ScrapingService
+
+
+@pytest.fixture
+def domain_policy():
+    settings = ScrapingSettings(scraping_domain_stats_path="")
+    policy = DomainPolicyService(settings, rng=random.Random(0))
+    policy.record("https://example.com/a", True, 0.2, 1000, 300)
+    return policy
+
+
+async def test_domain_admin_is_disabled_by_default(domain_policy):
+    settings = AppSettings()
+
+    for route in (
+        list_domain_stats(domain_policy, settings),
+        reset_domain_stats("example.com", domain_policy, settings),
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await route
+        assert exc_info.value.status_code == 404
+    assert list(domain_policy.all_stats()) == ["example.com"]
+
+
+async def test_domain_admin_resets_stats_when_enabled(domain_policy):
+    settings = AppSettings(domain_admin_enabled=True)
+
+    listed = await list_domain_stats(domain_policy, settings)
+    reset = await reset_domain_stats("example.com", domain_policy, settings)
+
+    assert list(listed.domains) == ["example.com"]
+    assert reset.domains == {}
+
+
+async def test_scraping_admin_is_disabled_by_default():
+    service = ScrapingService(ScrapingSettings())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await scraping_metrics(service, AppSettings())
+    response = await scraping_metrics(service, AppSettings(scraping_admin_enabled=True))
+
+    assert exc_info.value.status_code == 404
+    assert response.metrics["requests_total"] == 0
@@ -0,0 +1,52 @@
+import logging
+import queue
+
+import pytest
+
+from starprobe.api.logger import DebugSamplingFilter, DroppingQueueHandler
+from starprobe.observability.metrics import LOG_RECORDS_DROPPED
+
+
+def _record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+@pytest.mark.parametrize(
+    ("drop_policy", "kept"),
+    [("newest", ["first", "second"]), ("oldest", ["second", "third"])],
+)
+def test_full_queue_drops_records_without_blocking(drop_policy, kept):
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue, drop_policy)
+    dropped = LOG_RECORDS_DROPPED.value(reason="queue_full")
+
+    for message in ("first", "second", "third"):
+        handler.handle(_record(message))
+
+    assert [log_queue.get_nowait().msg for _ in range(2)] == kept
+    assert LOG_RECORDS_DROPPED.value(reason="queue_full") == dropped + 1
+
+
+def test_queued_records_are_merged_but_not_formatted():
+    log_queue = queue.Queue()
+    handler = DroppingQueueHandler(log_queue)
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, "scraped %s", ("a.example",), None
+    )
+    record.url = "https://a.example"
+
+    handler.handle(record)
+    queued = log_queue.get_nowait()
+
+    assert queued.msg == "scraped a.example"
+    assert queued.args is None
+    assert queued.url == "https://a.example"
+
+
+def test_sampling_drops_only_debug_records():
+    sampler = DebugSamplingFilter(rate=0.0)
+    sampled = LOG_RECORDS_DROPPED.value(reason="sampled")
+
+    assert not sampler.filter(_record("scrape failed", logging.DEBUG))
+    assert sampler.filter(_record("research completed", logging.INFO))
+    assert LOG_RECORDS_DROPPED.value(reason="sampled") == sampled + 1
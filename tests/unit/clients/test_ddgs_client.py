@@ -1,7 +1,10 @@
 """Unit tests for DdgsClient."""
 
+import asyncio
+import threading
+
 import pytest
-from ddgs.exceptions import DDGSException
+from ddgs.exceptions import DDGSException, RatelimitException
 
 
 def test_ddgs_client_uses_unit_test_settings():
@@ -24,6 +27,7 @@ class TestDdgsClient:
     def client(self, mocker):
         """Create a DdgsClient instance with mocked DDGS."""
         from src.starprobe.clients.ddgs_client import DdgsClient
+        from src.starprobe.clients.rate_limiter import AdaptiveTokenBucket
         from src.starprobe.config.ddgs_settings import DDGSSettings
 
         mock_ddgs_instance = mocker.Mock()
@@ -33,7 +37,10 @@ class TestDdgsClient:
         )
 
         settings = DDGSSettings()
-        client = DdgsClient(settings)
+        # Generous limits keep pacing out of tests that are not about it
+        client = DdgsClient(
+            settings, rate_limiter=AdaptiveTokenBucket(rate=1000, capacity=1000)
+        )
         client._mock_ddgs = mock_ddgs_instance  # Attach mock for test access
         return client
 
@@ -124,3 +131,82 @@ class TestDdgsClient:
     @pytest.mark.asyncio
     async def test_close_does_not_raise(self, client):
         await client.close()  # Should not raise any exception
+
+    @pytest.mark.asyncio
+    async def test_search_runs_on_dedicated_executor(self, client):
+        thread_names = []
+        client._mock_ddgs.text.side_effect = lambda *args, **kwargs: (
+            thread_names.append(threading.current_thread().name) or []
+        )
+
+        await client.search("python")
+
+        assert thread_names[0].startswith("ddgs")
+        metrics = client.metrics()
+        assert metrics["calls_total"] == 1
+        assert metrics["queue_depth"] == 0
+        assert metrics["active_threads"] == 0
+        assert metrics["latency_seconds_sum"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_search_times_out(self, client):
+        release = threading.Event()
+        client.settings = client.settings.model_copy(update={"ddgs_timeout": 0.05})
+        client._mock_ddgs.text.side_effect = lambda *args, **kwargs: release.wait(1)
+
+        result = await client.search("python")
+
+        assert result == {"results": []}
+        assert client.metrics()["timeouts_total"] == 1
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_search_rejects_when_queue_is_full(self, client):
+        release = threading.Event()
+        client.settings = client.settings.model_copy(
+            update={"ddgs_max_queue": 1, "ddgs_timeout": 5.0}
+        )
+        client._mock_ddgs.text.side_effect = lambda *args, **kwargs: (
+            release.wait(1) and []
+        )
+        # Occupy every worker, then fill the queue
+        blockers = [
+            asyncio.create_task(client.search(f"busy {index}"))
+            for index in range(client.metrics()["max_workers"] + 1)
+        ]
+        await asyncio.sleep(0.05)
+
+        result = await client.search("python")
+
+        assert result == {"results": []}
+        assert client.metrics()["rejected_total"] == 1
+        release.set()
+        await asyncio.gather(*blockers)
+        assert client.metrics()["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_search_after_close_releases_queue_slot(self, client):
+        client.settings = client.settings.model_copy(update={"ddgs_max_queue": 1})
+        await client.close()
+
+        for _ in range(3):
+            assert await client.search("python") == {"results": []}
+
+        metrics = client.metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["rejected_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_triggers_backoff(self, client):
+        client._mock_ddgs.text.side_effect = RatelimitException("202 Ratelimit")
+
+        result = await client.search("python")
+
+        assert result == {"results": []}
+        metrics = client.metrics()
+        assert metrics["rate_limiter_rate_limited_total"] == 1
+        assert (
+            metrics["rate_limiter_backoff_seconds"]
+            == client.rate_limiter.initial_backoff
+        )
+        assert metrics["rate_limiter_blocked_for_seconds"] > 0
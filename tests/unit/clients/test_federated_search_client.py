@@ -0,0 +1,171 @@
+"""Unit tests for the federated search client and its providers."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from dev.mocks.searxng_stand_in import create_app
+from src.starprobe.clients.federated_search_client import FederatedSearchClient
+from src.starprobe.clients.local_corpus_client import LocalCorpusClient
+from src.starprobe.clients.searxng_client import SearxngClient
+from src.starprobe.config.search_settings import SearchSettings
+
+
+class StaticSearchClient:
+    """Search client returning fixed results after an optional delay."""
+
+    def __init__(self, urls, delay=0.0):
+        self.urls = urls
+        self.delay = delay
+
+    async def search(self, query, max_results=3):
+        await asyncio.sleep(self.delay)
+        return {
+            "results": [
+                {"title": url, "url": url, "content": "", "raw_content": ""}
+                for url in self.urls[:max_results]
+            ]
+        }
+
+    async def close(self):
+        pass
+
+
+def _searxng_client(settings):
+    transport = httpx.ASGITransport(app=create_app())
+    return SearxngClient(settings, http_client=httpx.AsyncClient(transport=transport))
+
+
+class TestSearxngClient:
+    """Test cases for SearxngClient against the local stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_search_returns_formatted_results(self):
+        client = _searxng_client(SearchSettings())
+
+        result = await client.search("python", max_results=1)
+
+        assert result == {
+            "results": [
+                {
+                    "title": "Python (programming language)",
+                    "url": "https://en.wikipedia.org/wiki/Python_(programming_language)",
+                    "content": "Python is a high-level, general-purpose programming language.",
+                    "raw_content": "",
+                }
+            ]
+        }
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_search_handles_http_error(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        client = SearxngClient(
+            SearchSettings(), http_client=httpx.AsyncClient(transport=transport)
+        )
+
+        assert await client.search("python") == {"results": []}
+
+
+class TestLocalCorpusClient:
+    """Test cases for LocalCorpusClient."""
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_documents(self, tmp_path):
+        corpus = tmp_path / "corpus.jsonl"
+        corpus.write_text(
+            "\n".join(
+                json.dumps(document)
+                for document in [
+                    {
+                        "title": "Gardening",
+                        "url": "https://local/garden",
+                        "content": "Tomatoes need sun.",
+                    },
+                    {
+                        "title": "Fusion energy",
+                        "url": "https://local/fusion",
+                        "content": "Fusion reactors confine plasma.",
+                    },
+                ]
+            )
+            + "\nnot json\n"
+        )
+        client = LocalCorpusClient(SearchSettings(local_corpus_path=str(corpus)))
+
+        result = await client.search("fusion plasma")
+
+        assert [r["url"] for r in result["results"]] == ["https://local/fusion"]
+        assert result["results"][0]["raw_content"] == "Fusion reactors confine plasma."
+
+    @pytest.mark.asyncio
+    async def test_missing_corpus_returns_no_results(self):
+        client = LocalCorpusClient(SearchSettings(local_corpus_path="/no/such/file"))
+        assert await client.search("anything") == {"results": []}
+
+
+class TestFederatedSearchClient:
+    """Test cases for FederatedSearchClient."""
+
+    @pytest.mark.asyncio
+    async def test_search_interleaves_and_dedupes(self):
+        client = FederatedSearchClient(
+            {
+                "first": StaticSearchClient(
+                    ["https://a.com/1", "https://www.b.com/2/?utm_source=x"]
+                ),
+                "second": StaticSearchClient(["https://b.com/2", "https://c.com/3"]),
+            },
+            SearchSettings(),
+        )
+
+        result = await client.search("query", max_results=5)
+
+        assert [r["url"] for r in result["results"]] == [
+            "https://a.com/1",
+            "https://b.com/2",
+            "https://c.com/3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slow_provider_does_not_block_others(self):
+        client = FederatedSearchClient(
+            {
+                "slow": StaticSearchClient(["https://slow.com"], delay=5),
+                "fast": StaticSearchClient(["https://fast.com"]),
+            },
+            SearchSettings(search_provider_timeouts={"slow": 0.05}),
+        )
+
+        result = await asyncio.wait_for(client.search("query"), timeout=1)
+
+        assert [r["url"] for r in result["results"]] == ["https://fast.com"]
+
+    @pytest.mark.asyncio
+    async def test_searxng_provider_through_federation(self):
+        client = FederatedSearchClient(
+            {
+                "searxng": _searxng_client(SearchSettings()),
+                "local": LocalCorpusClient(
+                    SearchSettings(),
+                    documents=[
+                        {
+                            "title": "Rust notes",
+                            "url": "https://local/rust",
+                            "content": "Rust ownership rules.",
+                        }
+                    ],
+                ),
+            },
+            SearchSettings(),
+        )
+
+        result = await client.search("rust", max_results=5)
+
+        assert {r["url"] for r in result["results"]} == {
+            "https://www.rust-lang.org/",
+            "https://local/rust",
+        }
+        await client.close()
@@ -0,0 +1,107 @@
+"""Unit tests for AdaptiveTokenBucket."""
+
+import asyncio
+
+import pytest
+
+from src.starprobe.clients.rate_limiter import AdaptiveTokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveTokenBucket:
+    """Test cases for AdaptiveTokenBucket."""
+
+    def test_burst_then_paced_reservations(self):
+        """Test the burst is free and later calls are spaced by the rate."""
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(rate=2, capacity=3, clock=clock)
+
+        delays = [bucket.reserve(max_wait=10) for _ in range(5)]
+
+        assert delays == [0, 0, 0, 0.5, 1.0]
+        assert bucket.state()["available_tokens"] == 0
+
+    def test_tokens_refill_over_time(self):
+        """Test capacity returns after idle time, capped at the burst size."""
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(rate=1, capacity=2, clock=clock)
+        bucket.reserve(max_wait=10)
+        bucket.reserve(max_wait=10)
+
+        clock.now += 10
+
+        assert bucket.state()["available_tokens"] == 2
+        assert bucket.reserve(max_wait=10) == 0
+
+    def test_reserve_refuses_waits_beyond_limit(self):
+        """Test a reservation that would wait too long is refused and not kept."""
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(rate=1, capacity=1, clock=clock)
+        assert bucket.reserve(max_wait=0) == 0
+
+        assert bucket.reserve(max_wait=0.5) is None
+        assert bucket.reserve(max_wait=1) == 1
+
+    def test_backoff_doubles_and_success_resets(self):
+        """Test rate-limit errors back off exponentially and slow the rate."""
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(
+            rate=4, capacity=1, initial_backoff=1, max_backoff=3, clock=clock
+        )
+
+        assert bucket.record_rate_limited() == 1
+        assert bucket.record_rate_limited() == 2
+        assert bucket.record_rate_limited() == 3
+        assert bucket.rate == 0.5
+        assert bucket.reserve(max_wait=10) == 3
+
+        bucket.record_success()
+        state = bucket.state()
+        assert state["backoff_seconds"] == 0
+        assert state["rate"] == pytest.approx(0.9)
+        assert state["rate_limited_total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_acquire_queues_instead_of_failing(self):
+        """Test concurrent callers wait for capacity in turn."""
+        bucket = AdaptiveTokenBucket(rate=50, capacity=1)
+
+        results = await asyncio.gather(*(bucket.acquire(max_wait=1) for _ in range(4)))
+
+        assert results == [True, True, True, True]
+        state = bucket.state()
+        assert state["acquired_total"] == 4
+        assert state["wait_seconds_sum"] > 0
+        assert state["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_gives_up_during_long_backoff(self):
+        """Test acquire returns False when the backoff exceeds the allowed wait."""
+        bucket = AdaptiveTokenBucket(rate=10, capacity=1, initial_backoff=5)
+        bucket.record_rate_limited()
+
+        assert await bucket.acquire(max_wait=0.1) is False
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout_returns_its_reservation(self):
+        """Test a caller that gives up after reserving does not use up a slot."""
+        bucket = AdaptiveTokenBucket(rate=10, capacity=1, initial_backoff=5)
+        assert await bucket.acquire(max_wait=1) is True
+
+        # The second caller reserves the next slot, then a backoff pushes it
+        # past the caller's limit while it sleeps
+        waiter = asyncio.create_task(bucket.acquire(max_wait=0.3))
+        await asyncio.sleep(0.01)
+        bucket.record_rate_limited()
+
+        assert await waiter is False
+        assert bucket.state()["available_tokens"] == 1
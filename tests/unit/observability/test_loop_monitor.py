@@ -0,0 +1,40 @@
+import asyncio
+import logging
+import time
+
+from starprobe.observability import EventLoopMonitor, bind_request_id
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_monitor_measures_event_loop_lag():
+    monitor = EventLoopMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    _block_the_loop(0.1)
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    assert monitor.max_lag >= 0.05
+
+
+async def test_debug_monitor_logs_blocking_stack_and_request_id(caplog):
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05, capture_stacks=True)
+    monitor.start()
+    await asyncio.sleep(0.02)
+
+    async def handle_request():
+        with bind_request_id("req-123"):
+            _block_the_loop(0.3)
+
+    with caplog.at_level(logging.WARNING, logger="starprobe.observability"):
+        await asyncio.create_task(handle_request())
+        await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    records = [r for r in caplog.records if r.getMessage() == "Event loop blocked"]
+    assert len(records) == 1
+    assert records[0].request_id == "req-123"
+    assert "_block_the_loop" in records[0].stack
@@ -0,0 +1,52 @@
+import tracemalloc
+
+import pytest
+
+from starprobe.observability import (
+    measure_memory,
+    measure_request_memory,
+    summarize_memory,
+)
+
+
+@pytest.fixture
+def tracing():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+def test_memory_is_not_measured_without_tracemalloc():
+    with measure_memory("node") as entries, measure_request_memory() as report:
+        pass
+
+    assert entries == []
+    assert report == {}
+
+
+def test_measures_peak_and_retained_memory_per_node(tracing):
+    kept = []
+    with measure_memory("summarize_sources") as entries:
+        temporary = bytearray(2 * 1024 * 1024)
+        del temporary
+        kept.append(bytearray(512 * 1024))
+
+    entry = entries[0]
+    assert entry["node"] == "summarize_sources"
+    assert entry["peak_kib"] >= 2048
+    assert 512 <= entry["retained_kib"] < 1024
+    assert summarize_memory(entries + entries)["summarize_sources"] == {
+        "peak_kib": entry["peak_kib"],
+        "retained_kib": round(entry["retained_kib"] * 2, 1),
+    }
+
+
+def test_request_report_lists_top_allocation_sites(tracing):
+    kept = []
+    with measure_request_memory(top=3) as report:
+        kept.append(bytearray(1024 * 1024))
+
+    assert report["retained_kib"] >= 1024
+    assert len(report["top_allocations"]) <= 3
+    assert "test_memory.py" in report["top_allocations"][0]
+    assert "+1024" in report["top_allocations"][0]
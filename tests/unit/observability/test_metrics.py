@@ -0,0 +1,110 @@
+"""Unit tests for the in-process metrics registry."""
+
+import pytest
+
+from src.starprobe.observability import metrics
+from src.starprobe.observability.metrics import MetricsRegistry
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Start every test from empty metrics with recording enabled."""
+    metrics.REGISTRY.reset()
+    metrics.REGISTRY.enabled = True
+    yield
+    metrics.REGISTRY.reset()
+    metrics.REGISTRY.enabled = True
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry rendering."""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Test histogram buckets are cumulative and end with +Inf."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "test_seconds", "Test durations.", ("op",), buckets=(0.1, 1.0)
+        )
+        histogram.observe(0.05, op="a")
+        histogram.observe(0.5, op="a")
+        histogram.observe(5.0, op="a")
+
+        lines = registry.render().splitlines()
+
+        assert "# TYPE test_seconds histogram" in lines
+        assert 'test_seconds_bucket{op="a",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{op="a",le="1"} 2' in lines
+        assert 'test_seconds_bucket{op="a",le="+Inf"} 3' in lines
+        assert 'test_seconds_sum{op="a"} 5.55' in lines
+        assert 'test_seconds_count{op="a"} 3' in lines
+
+    def test_duplicate_metric_name_is_rejected(self):
+        """Test registering a metric name twice raises."""
+        registry = MetricsRegistry()
+        registry.counter("test_total", "Test counter.")
+
+        with pytest.raises(ValueError):
+            registry.gauge("test_total", "Test gauge.")
+
+    def test_collectors_render_as_gauges(self):
+        """Test collector samples are rendered with their own type lines."""
+        registry = MetricsRegistry()
+        registry.add_collector(
+            "Pool state.", lambda: [("test_pool_idle", {"pool": 'a"b'}, 2.0)]
+        )
+
+        text = registry.render()
+
+        assert "# TYPE test_pool_idle gauge" in text
+        assert 'test_pool_idle{pool="a\\"b"} 2' in text
+
+    def test_collector_totals_render_as_counters(self):
+        """Test collector samples named *_total get the counter type."""
+        registry = MetricsRegistry()
+        registry.add_collector(
+            "Scraper state.",
+            lambda: [("test_requests_total", {}, 3.0), ("test_in_flight", {}, 1.0)],
+        )
+
+        text = registry.render()
+
+        assert "# TYPE test_requests_total counter" in text
+        assert "# TYPE test_in_flight gauge" in text
+
+
+class TestTracking:
+    """Test cases for the tracking helpers."""
+
+    def test_track_call_times_and_counts_errors(self):
+        """Test failed calls are timed, counted as errors and leave in-flight."""
+        with pytest.raises(RuntimeError):
+            with metrics.track_call("test_call"):
+                assert metrics.IN_FLIGHT.value(kind="call", name="test_call") == 1
+                raise RuntimeError("boom")
+
+        assert metrics.EXTERNAL_CALL_DURATION.count(call="test_call") == 1
+        assert metrics.ERRORS.value(kind="call", name="test_call") == 1
+        assert metrics.IN_FLIGHT.value(kind="call", name="test_call") == 0
+
+    def test_disabled_registry_records_nothing(self):
+        """Test tracking is a no-op while metrics are disabled."""
+        metrics.REGISTRY.enabled = False
+
+        with metrics.track_node("test_node"):
+            pass
+        metrics.record_cache("test_cache", True)
+
+        assert metrics.NODE_DURATION.count(node="test_node") == 0
+        assert list(metrics.cache_hit_ratios()) == []
+
+    def test_cache_hit_ratio(self):
+        """Test hit ratios are computed per cache from recorded lookups."""
+        metrics.record_cache("test_cache", True)
+        metrics.record_cache("test_cache", True)
+        metrics.record_cache("test_cache", False)
+
+        ratios = {
+            labels["cache"]: value for _, labels, value in metrics.cache_hit_ratios()
+        }
+
+        assert ratios["test_cache"] == pytest.approx(2 / 3)
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import time
+
+from starprobe.observability import (
+    PROFILES,
+    SamplingProfiler,
+    bind_request_id,
+    profile_request,
+    track_call,
+)
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _tracked_spin(seconds: float) -> None:
+    with track_call("spin"):
+        _spin(seconds)
+
+
+def test_profiler_returns_collapsed_stacks_of_all_threads():
+    worker = threading.Thread(target=_spin, args=(0.2,), name="busy-worker")
+    profiler = SamplingProfiler(interval=0.002)
+    profiler.start()
+    worker.start()
+    worker.join()
+    collapsed = profiler.stop()
+
+    lines = collapsed.splitlines()
+    assert profiler.samples > 0
+    spinning = [line for line in lines if line.startswith("busy-worker;")]
+    assert spinning and "_spin (test_profiler.py:" in spinning[0]
+    stack, count = spinning[0].rsplit(" ", 1)
+    assert int(count) > 0
+
+
+async def test_request_profile_only_samples_work_for_that_request():
+    async def handle(request_id: str, profiled: bool) -> None:
+        with bind_request_id(request_id):
+            if profiled:
+                with profile_request(interval=0.002):
+                    await asyncio.to_thread(_tracked_spin, 0.2)
+            else:
+                await asyncio.to_thread(_spin, 0.2)
+
+    await asyncio.gather(handle("profiled", True), handle("other", False))
+
+    collapsed = PROFILES.get("profiled")
+    assert "_tracked_spin" in collapsed
+    assert "_spin (test_profiler.py:" in collapsed
+    # The other request's spin runs concurrently, without a tracked call
+    spinning = [line for line in collapsed.splitlines() if "_spin (" in line]
+    assert all("_tracked_spin" in line for line in spinning)
+    assert PROFILES.get("other") is None
@@ -0,0 +1,80 @@
+"""Unit tests for per-request stage timings."""
+
+import asyncio
+
+import pytest
+
+from starprobe.observability import metrics
+from starprobe.observability.timings import (
+    collect_timings,
+    server_timing_header,
+    summarize_timings,
+)
+
+
+@pytest.fixture(autouse=True)
+def metrics_disabled():
+    """Timings must not depend on the metrics registry being enabled."""
+    metrics.REGISTRY.enabled = False
+    yield
+    metrics.REGISTRY.enabled = True
+
+
+class TestStageTimings:
+    """Test cases for collecting and reporting stage timings."""
+
+    @pytest.mark.asyncio
+    async def test_calls_in_worker_threads_are_collected(self):
+        """Test calls made from tasks and worker threads reach the node collector."""
+
+        def scrape():
+            with metrics.track_call("scrape_fetch"):
+                pass
+
+        with collect_timings("conduct_web_search") as timings:
+            with metrics.track_node("conduct_web_search"):
+                await asyncio.gather(
+                    asyncio.to_thread(scrape), asyncio.to_thread(scrape)
+                )
+
+        summary = summarize_timings(timings)
+
+        assert list(summary) == ["conduct_web_search"]
+        assert summary["conduct_web_search"]["calls"]["scrape_fetch"]["count"] == 2
+
+    def test_nothing_is_recorded_outside_a_node(self):
+        """Test tracked calls without an active collector are not kept."""
+        with metrics.track_call("llm_invoke"):
+            pass
+
+        with collect_timings("refine_query") as timings:
+            pass
+
+        assert timings == []
+
+    def test_server_timing_header(self):
+        """Test summarized timings render as Server-Timing metrics in milliseconds."""
+        timings = summarize_timings(
+            [
+                {
+                    "node": "refine_query",
+                    "kind": "call",
+                    "name": "llm_invoke",
+                    "duration": 0.25,
+                },
+                {
+                    "node": "refine_query",
+                    "kind": "node",
+                    "name": "refine_query",
+                    "duration": 0.3,
+                },
+            ]
+        )
+
+        header = server_timing_header(timings, total=0.5)
+
+        assert header == (
+            "refine_query;dur=300.0, "
+            'refine_query.llm_invoke;dur=250.0;desc="1 call", '
+            "total;dur=500.0"
+        )
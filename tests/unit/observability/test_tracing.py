@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import pytest
+
+from starprobe.observability import (
+    TRACER,
+    bind_request_id,
+    record_cache,
+    set_span_attributes,
+    track_call,
+    track_node,
+    track_request,
+)
+from starprobe.observability.tracing import (
+    STATUS_ERROR,
+    JsonlSpanExporter,
+    start_span,
+)
+
+
+class ListExporter:
+    def __init__(self):
+        self.payloads = []
+
+    def export(self, payload):
+        self.payloads.append(payload)
+
+    def close(self):
+        pass
+
+    def spans(self):
+        return {
+            span["name"]: span
+            for payload in self.payloads
+            for resource in payload["resourceSpans"]
+            for scope in resource["scopeSpans"]
+            for span in scope["spans"]
+        }
+
+
+@pytest.fixture
+def exporter():
+    exporter = ListExporter()
+    TRACER.configure(exporter, service_name="starprobe-test", flush_interval=0.01)
+    yield exporter
+    TRACER.shutdown()
+
+
+def _fetch(url: str) -> None:
+    with track_call("scrape_fetch"):
+        set_span_attributes({"url.full": url, "http.response.body.size": 2048})
+
+
+async def test_spans_nest_across_nodes_and_worker_threads(exporter):
+    with bind_request_id("ab" * 16), track_request("research"):
+        with track_node("conduct_web_search"):
+            record_cache("scraped_url_memory", hit=False)
+            await asyncio.to_thread(_fetch, "https://a.example/page")
+    TRACER.shutdown()
+
+    spans = exporter.spans()
+    request, node, fetch = (
+        spans["research"],
+        spans["conduct_web_search"],
+        spans["scrape_fetch"],
+    )
+    assert {span["traceId"] for span in spans.values()} == {"ab" * 16}
+    assert "parentSpanId" not in request
+    assert node["parentSpanId"] == request["spanId"]
+    assert fetch["parentSpanId"] == node["spanId"]
+    assert {"key": "url.full", "value": {"stringValue": "https://a.example/page"}} in (
+        fetch["attributes"]
+    )
+    assert {
+        "key": "starprobe.cache.scraped_url_memory.misses",
+        "value": {"intValue": "1"},
+    } in node["attributes"]
+    resource = exporter.payloads[0]["resourceSpans"][0]["resource"]
+    assert resource["attributes"][0]["value"]["stringValue"] == "starprobe-test"
+
+
+def test_failed_spans_record_the_error(exporter):
+    with pytest.raises(ValueError):
+        with track_call("html_parse"):
+            raise ValueError("bad markup")
+    TRACER.shutdown()
+
+    span = exporter.spans()["html_parse"]
+    assert span["status"] == {"code": STATUS_ERROR, "message": "ValueError: bad markup"}
+
+
+def test_no_spans_while_tracing_is_disabled():
+    with start_span("idle") as span:
+        set_span_attributes({"ignored": True})
+
+    assert span is None
+
+
+def test_jsonl_exporter_writes_one_export_request_per_line(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    TRACER.configure(JsonlSpanExporter(str(path)), flush_interval=0.01)
+    with track_node("refine_query"):
+        pass
+    TRACER.shutdown()
+
+    lines = path.read_text().splitlines()
+    spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(lines) == 1
+    assert spans[0]["name"] == "refine_query"
+    assert int(spans[0]["endTimeUnixNano"]) >= int(spans[0]["startTimeUnixNano"])
@@ -0,0 +1,142 @@
+"""Unit tests for DomainPolicyService."""
+
+import random
+
+import pytest
+
+from src.starprobe.config.scraping_settings import ScrapingSettings
+from src.starprobe.services.domain_policy_service import DomainPolicyService
+from src.starprobe.services.scraping_service import (
+    USEFUL_TOKENS_CAP,
+    ScrapingService,
+)
+from src.starprobe.services.text_processing_service import TextProcessingService
+
+
+def make_policy(tmp_path=None, **overrides) -> DomainPolicyService:
+    """Create a policy with deterministic decisions and an optional stats file."""
+    options = {
+        "scraping_domain_stats_path": str(tmp_path / "stats.json") if tmp_path else "",
+        "scraping_policy_min_samples": 3,
+        "scraping_policy_explore_rate": 0.0,
+        **overrides,
+    }
+    settings = ScrapingSettings(**options)
+    return DomainPolicyService(settings, rng=random.Random(0))
+
+
+class TestDomainPolicyService:
+    """Test cases for DomainPolicyService."""
+
+    def test_unknown_domain_is_scraped(self):
+        """Test domains without enough samples are always scraped."""
+        policy = make_policy()
+        policy.record("https://failing.example/a", False, 0.1)
+        assert policy.decide("https://failing.example/b") == "scrape"
+
+    def test_stats_are_grouped_by_canonical_domain(self):
+        """Test www and mobile variants share one domain's stats."""
+        policy = make_policy()
+        policy.record("https://www.example.com/a", True, 0.2, 1000, 300)
+        policy.record("https://m.example.com/b", True, 0.4, 3000, 500)
+
+        stats = policy.all_stats()
+        assert list(stats) == ["example.com"]
+        assert stats["example.com"]["samples"] == 2
+        assert stats["example.com"]["success_rate"] == 1.0
+        assert stats["example.com"]["latency_p95"] == 0.4
+
+    @pytest.mark.parametrize(
+        "outcomes,expected",
+        [
+            ([(True, 0.5, 400)] * 3, "scrape"),
+            ([(False, 0.5, 0)] * 3, "skip"),
+            ([(True, 0.5, 400), (False, 0.5, 0), (False, 0.5, 0)], "snippet"),
+            ([(True, 20.0, 400)] * 3, "snippet"),
+            ([(True, 0.5, 5)] * 3, "snippet"),
+        ],
+        ids=["healthy", "always-fails", "mostly-fails", "slow", "boilerplate"],
+    )
+    def test_decisions_follow_stats(self, outcomes, expected):
+        """Test failing, slow and boilerplate domains are not scraped."""
+        policy = make_policy()
+        for success, latency, tokens in outcomes:
+            policy.record("https://site.example/page", success, latency, 100, tokens)
+        assert policy.decide("https://site.example/other") == expected
+
+    def test_exploration_scrapes_poor_domains_occasionally(self):
+        """Test the explore rate lets poor domains be retried."""
+        policy = make_policy(scraping_policy_explore_rate=1.0)
+        for _ in range(3):
+            policy.record("https://video.example/watch", False, 0.5)
+        assert policy.decide("https://video.example/watch") == "scrape"
+
+    def test_window_keeps_recent_samples(self):
+        """Test old samples fall out of the window so a domain can recover."""
+        policy = make_policy(scraping_domain_stats_window=3)
+        for _ in range(3):
+            policy.record("https://site.example/", False, 0.5)
+        for _ in range(3):
+            policy.record("https://site.example/", True, 0.5, 100, 400)
+        assert policy.decide("https://site.example/") == "scrape"
+
+    def test_stats_persist_across_instances(self, tmp_path):
+        """Test saved stats are loaded by a new instance."""
+        policy = make_policy(tmp_path)
+        for _ in range(3):
+            policy.record("https://paywall.example/story", True, 0.3, 9000, 10)
+        policy.save()
+
+        restored = make_policy(tmp_path)
+        assert restored.all_stats() == policy.all_stats()
+        assert restored.decide("https://paywall.example/other") == "snippet"
+
+    def test_stats_saved_after_interval(self, tmp_path):
+        """Test the stats file is written after the configured number of samples."""
+        policy = make_policy(tmp_path, scraping_domain_stats_save_interval=2)
+        policy.record("https://site.example/", True, 0.1)
+        assert not (tmp_path / "stats.json").exists()
+        policy.record("https://site.example/", True, 0.1)
+        assert (tmp_path / "stats.json").exists()
+
+    def test_reset_forgets_domain(self):
+        """Test a reset domain is scraped again."""
+        policy = make_policy()
+        for _ in range(3):
+            policy.record("https://site.example/", False, 0.5)
+        assert policy.reset("site.example") is True
+        assert policy.reset("site.example") is False
+        assert policy.decide("https://site.example/") == "scrape"
+
+    def test_scraping_service_records_outcomes(self, mocker):
+        """Test scrapes are recorded with their sizes and capped token counts."""
+        policy = make_policy()
+        service = ScrapingService(ScrapingSettings(), policy)
+        mocker.patch.object(service, "validate_url")
+        response = mocker.Mock()
+        response.headers = {"Content-Type": "text/html"}
+        response.content = b"<html><body><p>one two three</p></body></html>"
+        long_response = mocker.Mock()
+        long_response.headers = {"Content-Type": "text/html"}
+        long_response.content = (
+            b"<html><body><p>" + b"lorem ipsum dolor " * 20000 + b"</p></body></html>"
+        )
+        mocker.patch.object(
+            service.http_client, "get", side_effect=[response, long_response]
+        )
+        encode = mocker.spy(TextProcessingService.get_encoding(), "encode")
+
+        service.scrape("https://site.example/page")
+        service.scrape("https://long.example/page")
+        mocker.patch.object(service, "_fetch", side_effect=ValueError("boom"))
+        with pytest.raises(ValueError):
+            service.scrape("https://site.example/other")
+
+        stats = policy.stats("site.example")
+        assert stats["samples"] == 2
+        assert stats["success_rate"] == 0.5
+        assert stats["useful_tokens_p50"] == 3
+        assert stats["bytes_p50"] == len(response.content)
+        # Long pages are counted from a prefix, not encoded in full
+        assert policy.stats("long.example")["useful_tokens_p50"] == USEFUL_TOKENS_CAP
+        assert max(len(call.args[0]) for call in encode.call_args_list) < 20000
@@ -0,0 +1,116 @@
+"""Unit tests for PromptBudgetService."""
+
+import pytest
+
+from src.starprobe.config.workflow_settings import WorkflowSettings
+from src.starprobe.services.prompt_budget_service import PromptBudgetService
+from src.starprobe.services.prompt_service import PromptService
+
+
+class TestPromptBudgetService:
+    """Test cases for PromptBudgetService."""
+
+    @pytest.fixture
+    def prompt_service(self):
+        """Create a PromptService with a small context budget."""
+        settings = WorkflowSettings(max_context_tokens=1200, summary_context_ratio=0.3)
+        return PromptService(settings)
+
+    def test_allocate_budget_fits_everything(self):
+        """Test items keep their full size when the budget is large enough."""
+        result = PromptBudgetService.allocate_budget([10, 20], [1.0, 1.0], 100)
+        assert result == [10, 20]
+
+    def test_allocate_budget_redistributes_unused_share(self):
+        """Test small items release their unused share to larger ones."""
+        result = PromptBudgetService.allocate_budget([10, 500, 500], [1, 1, 1], 310)
+        assert result[0] == 10
+        assert result[1] + result[2] <= 300
+        assert result[1] == result[2] == 150
+
+    def test_allocate_budget_respects_weights(self):
+        """Test higher-weight items receive more budget."""
+        result = PromptBudgetService.allocate_budget([1000, 1000], [3.0, 1.0], 400)
+        assert result == [300, 100]
+
+    def test_split_sources(self):
+        """Test formatted research results are split into source blocks."""
+        results = [
+            "Source: https://a.com\nContent: A\n---\nSource: https://b.com\nContent: B\n---",
+            "Source: https://c.com\nContent: C\n---",
+        ]
+        blocks = PromptBudgetService.split_sources(results)
+        assert blocks == [
+            "Source: https://a.com\nContent: A",
+            "Source: https://b.com\nContent: B",
+            "Source: https://c.com\nContent: C",
+        ]
+
+    def test_relevance_weight(self):
+        """Test relevance weight reflects topic term coverage."""
+        topic = "solar panel efficiency"
+        relevant = PromptBudgetService.relevance_weight(
+            "Solar panel efficiency improved", topic
+        )
+        unrelated = PromptBudgetService.relevance_weight("Cooking pasta", topic)
+        assert relevant > unrelated
+        assert unrelated == PromptBudgetService.MIN_SOURCE_WEIGHT
+
+    def test_build_summarize_prompt_within_budget_is_unchanged(self, prompt_service):
+        """Test prompts that fit are returned as generated."""
+        results = ["Source: https://a.com\nContent: short content\n---"]
+        messages = PromptBudgetService.build_summarize_prompt(
+            prompt_service, "topic", "", results
+        )
+        expected = prompt_service.generate_summarize_prompt("topic", "", results[0])
+        assert messages[1].content == expected[1].content
+
+    def test_build_summarize_prompt_trims_to_budget(self, prompt_service):
+        """Test oversized prompts are trimmed and favour relevant sources."""
+        relevant = "Source: https://a.com\nContent: " + "battery chemistry " * 800
+        unrelated = "Source: https://b.com\nContent: " + "football scores " * 800
+        results = [f"{relevant}\n---\n{unrelated}\n---"]
+        reserved = 200
+
+        messages = PromptBudgetService.build_summarize_prompt(
+            prompt_service,
+            "battery chemistry",
+            "Existing summary " * 400,
+            results,
+            reserved_tokens=reserved,
+        )
+
+        used = PromptBudgetService.count_message_tokens(messages)
+        assert used <= prompt_service.configurable.max_context_tokens - reserved
+        content = messages[1].content
+        assert content.count("battery chemistry") > content.count("football scores")
+
+    def test_build_summarize_prompt_drops_inputs_when_fixed_prompt_fills_budget(
+        self, mocker
+    ):
+        """Test a tiny context window with many sources never yields negative budgets."""
+        prompt_service = PromptService(WorkflowSettings(max_context_tokens=64))
+        results = [
+            "\n".join(
+                f"Source: https://{i}.com\nContent: source {i} text\n---"
+                for i in range(30)
+            )
+        ]
+        allocate = mocker.spy(PromptBudgetService, "allocate_budget")
+
+        messages = PromptBudgetService.build_summarize_prompt(
+            prompt_service, "topic", "Existing summary " * 50, results
+        )
+
+        assert allocate.call_args.args[2] == 0
+        assert "Existing summary" not in messages[1].content
+        assert "https://0.com" not in messages[1].content
+
+    def test_build_query_prompt_trims_long_topic(self, prompt_service):
+        """Test an oversized research topic is trimmed to fit."""
+        topic = "renewable energy storage " * 1000
+        messages = PromptBudgetService.build_query_prompt(
+            prompt_service, topic, reserved_tokens=100
+        )
+        used = PromptBudgetService.count_message_tokens(messages)
+        assert used <= prompt_service.configurable.max_context_tokens - 100
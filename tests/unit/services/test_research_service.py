@@ -1,5 +1,8 @@
 """Unit tests for ResearchService."""
 
+import asyncio
+import time
+
 import pytest
 
 from src.starprobe.dependencies import (
@@ -24,7 +27,7 @@ class TestResearchService:
         search_client = _create_search_client(ddgs_settings)
         scraping_service = _create_scraping_service(scraping_settings)
         return _create_research_service(
-            workflow_settings, search_client, scraping_service
+            workflow_settings, search_client, scraping_service, ddgs_settings
         )
 
     @pytest.mark.asyncio
@@ -90,13 +93,29 @@ class TestResearchService:
         self, mocker, research_service
     ):
         """Test behavior when some URLs fail to scrape."""
-        # Set scraper to fail on second URL
         mocker.patch.object(
-            research_service.scraper,
-            "scrape",
-            side_effect=["Scraped content 1", Exception("Network error")],
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": f"https://example.com/{i}",
+                        "title": f"Result {i}",
+                        "content": f"Snippet {i}",
+                    }
+                    for i in range(1, 4)
+                ]
+            },
         )
 
+        # Set scraper to fail on the second URL, whichever order they are scraped in
+        def scrape(url):
+            if url.endswith("/2"):
+                raise Exception("Network error")
+            return f"Scraped content from {url}"
+
+        mocker.patch.object(research_service.scraper, "scrape", side_effect=scrape)
+
         search_str, sources, errors = await research_service.search_and_scrape(
             "test query", loop_count=1
         )
@@ -106,6 +125,9 @@ class TestResearchService:
         assert isinstance(search_str, str)
         assert isinstance(sources, str)
         assert errors == []
+        assert "Scraped content from https://example.com/1" in search_str
+        assert "Scraped content from https://example.com/3" in search_str
+        assert "Snippet 2" in search_str
 
     @pytest.mark.asyncio
     async def test_search_and_scrape_empty_results(self, mocker, research_service):
@@ -128,21 +150,23 @@ class TestResearchService:
     async def test_search_and_scrape_respects_max_results(
         self, mocker, research_service
     ):
-        """Test that search is called with max_results=3."""
+        """Test that search over-fetches up to ddgs_max_results candidates."""
         # Spy on the search method
         spy = mocker.spy(research_service.search_client, "search")
         research_service.search_client.search.return_value = {"results": []}
 
         await research_service.search_and_scrape("test query", loop_count=1)
 
-        # Verify both the primary and fallback queries were attempted with max_results=3
+        # Verify both the primary and fallback queries were attempted with the
+        # configured number of candidates
+        max_results = research_service.ddgs_settings.ddgs_max_results
         call_args = spy.call_args_list
         assert call_args  # ensure at least one call
-        assert call_args[0].kwargs == {"max_results": 3}
+        assert call_args[0].kwargs == {"max_results": max_results}
         assert call_args[0].args[0] == "test query"
         # Fallback query should also respect the max_results parameter
         for call in call_args:
-            assert call.kwargs == {"max_results": 3}
+            assert call.kwargs == {"max_results": max_results}
 
     @pytest.mark.asyncio
     async def test_search_and_scrape_handles_missing_url(
@@ -236,6 +260,535 @@ class TestResearchService:
 
         # Should call search client with correct parameters
         research_service.search_client.search.assert_called_once_with(
-            "test query", max_results=3
+            "test query", max_results=research_service.ddgs_settings.ddgs_max_results
         )
         assert result == {"results": []}
+
+    @pytest.mark.asyncio
+    async def test_search_and_scrape_scrapes_only_top_ranked(
+        self, mocker, research_service
+    ):
+        """Test only the best-ranked candidates are scraped."""
+        research_service.settings = research_service.settings.model_copy(
+            update={"scrape_top_k": 2}
+        )
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": "https://blog.example.com/cooking",
+                        "title": "Cooking tips",
+                        "content": "Recipes",
+                    },
+                    {
+                        "url": "https://example.com/fusion",
+                        "title": "Fusion energy progress",
+                        "content": "Fusion energy reactors",
+                    },
+                    {
+                        "url": "https://en.wikipedia.org/wiki/Fusion_power",
+                        "title": "Fusion power",
+                        "content": "Fusion energy overview",
+                    },
+                ]
+            },
+        )
+        scrape = mocker.patch.object(
+            research_service.scraper, "scrape", return_value="Scraped page"
+        )
+
+        _, sources, errors = await research_service.search_and_scrape(
+            "fusion energy", loop_count=1
+        )
+
+        scraped_urls = {call.args[0] for call in scrape.call_args_list}
+        assert scraped_urls == {
+            "https://example.com/fusion",
+            "https://en.wikipedia.org/wiki/Fusion_power",
+        }
+        assert "cooking" not in sources
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_search_and_scrape_uses_covering_snippet(
+        self, mocker, research_service
+    ):
+        """Test a long snippet covering the query is used without scraping."""
+        snippet = "Fusion energy research " + "explained in detail " * 10
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": "https://example.com/fusion",
+                        "title": "Fusion energy",
+                        "content": snippet,
+                    }
+                ]
+            },
+        )
+        scrape = mocker.patch.object(research_service.scraper, "scrape")
+
+        search_str, _, _ = await research_service.search_and_scrape(
+            "fusion energy", loop_count=1
+        )
+
+        scrape.assert_not_called()
+        assert "Fusion energy research" in search_str
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_scrape_in_parallel(
+        self, mocker, research_service
+    ):
+        """Test a blocking scrape does not stall another request's scrapes."""
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            side_effect=lambda query, **kwargs: {
+                "results": [
+                    {
+                        "url": f"https://example.com/{query}",
+                        "title": query,
+                        "content": "Short snippet",
+                    }
+                ]
+            },
+        )
+        mocker.patch.object(
+            research_service.scraper,
+            "scrape",
+            side_effect=lambda url: time.sleep(0.5) or f"Scraped page {url}",
+        )
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            research_service.search_and_scrape("first", loop_count=1, seen_urls=[]),
+            research_service.search_and_scrape("second", loop_count=1, seen_urls=[]),
+        )
+
+        assert time.perf_counter() - started < 0.9
+        assert "Scraped page https://example.com/first" in results[0][0]
+        assert "Scraped page https://example.com/second" in results[1][0]
+
+    @pytest.mark.asyncio
+    async def test_hedged_scraping_cancels_stragglers(self, mocker, research_service):
+        """Test hedged mode keeps the first k documents and cancels slow hosts."""
+        research_service.settings = research_service.settings.model_copy(
+            update={
+                "hedged_scraping": True,
+                "scrape_top_k": 2,
+                "scrape_hedge_extra": 1,
+                "scrape_deadline_seconds": 5.0,
+            }
+        )
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": f"https://example.com/{name}",
+                        "title": f"Result {name}",
+                        "content": f"Snippet {name}",
+                    }
+                    for name in ("slow", "fast1", "fast2")
+                ]
+            },
+        )
+
+        def scrape(url):
+            if url.endswith("slow"):
+                time.sleep(1.0)
+            return f"Scraped page {url}"
+
+        mocker.patch.object(research_service.scraper, "scrape", side_effect=scrape)
+        notes: list[str] = []
+
+        started = time.perf_counter()
+        search_str, _, errors = await research_service.search_and_scrape(
+            "test query", loop_count=1, notes=notes
+        )
+
+        assert time.perf_counter() - started < 1.0
+        assert "Scraped page https://example.com/fast1" in search_str
+        assert "Scraped page https://example.com/fast2" in search_str
+        assert "example.com/slow" not in search_str
+        assert errors == []
+        assert len(notes) == 1
+        assert "Cancelled 1 of 3 scrapes" in notes[0]
+
+    @pytest.mark.asyncio
+    async def test_hedged_scraping_deadline_uses_snippets(
+        self, mocker, research_service
+    ):
+        """Test fetches still running at the deadline fall back to snippets."""
+        research_service.settings = research_service.settings.model_copy(
+            update={
+                "hedged_scraping": True,
+                "scrape_top_k": 1,
+                "scrape_hedge_extra": 0,
+                "scrape_deadline_seconds": 0.1,
+            }
+        )
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": "https://example.com/slow",
+                        "title": "Slow result",
+                        "content": "Slow snippet",
+                    }
+                ]
+            },
+        )
+        mocker.patch.object(
+            research_service.scraper,
+            "scrape",
+            side_effect=lambda url: time.sleep(0.5) or "Scraped page",
+        )
+        notes: list[str] = []
+
+        search_str, _, _ = await research_service.search_and_scrape(
+            "test query", loop_count=1, notes=notes
+        )
+
+        assert "Slow snippet" in search_str
+        assert "deadline" in notes[0]
+
+    @pytest.mark.asyncio
+    async def test_race_fallback_search_takes_first_non_empty(
+        self, mocker, research_service
+    ):
+        """Test race mode returns the fallback results without waiting for a slow primary."""
+        research_service.settings = research_service.settings.model_copy(
+            update={"search_fallback_mode": "race"}
+        )
+        cancelled = []
+
+        async def search(query, max_results):
+            if query == "test query":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(query)
+                    raise
+            return {
+                "results": [
+                    {
+                        "url": "https://example.com/fallback",
+                        "title": "Fallback",
+                        "content": "Fallback snippet",
+                    }
+                ]
+            }
+
+        mocker.patch.object(research_service.search_client, "search", new=search)
+        mocker.patch.object(research_service.scraper, "scrape", return_value="Page")
+
+        started = time.perf_counter()
+        _, sources, errors = await research_service.search_and_scrape(
+            "test query", loop_count=1
+        )
+
+        assert time.perf_counter() - started < 1.0
+        assert "https://example.com/fallback" in sources
+        assert cancelled == ["test query"]
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_race_fallback_search_cancels_delayed_fallback(
+        self, mocker, research_service
+    ):
+        """Test a fast primary result cancels the fallback before it starts."""
+        research_service.settings = research_service.settings.model_copy(
+            update={
+                "search_fallback_mode": "race",
+                "search_fallback_delay_seconds": 1.0,
+            }
+        )
+        search = mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": "https://example.com/primary",
+                        "title": "Primary",
+                        "content": "Primary snippet",
+                    }
+                ]
+            },
+        )
+        mocker.patch.object(research_service.scraper, "scrape", return_value="Page")
+
+        _, sources, errors = await research_service.search_and_scrape(
+            "test query", loop_count=1
+        )
+
+        search.assert_called_once()
+        assert "https://example.com/primary" in sources
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_merge_fallback_search_combines_results(
+        self, mocker, research_service
+    ):
+        """Test merge mode combines both result sets without duplicates."""
+        research_service.settings = research_service.settings.model_copy(
+            update={"search_fallback_mode": "merge", "scrape_top_k": 5}
+        )
+
+        async def search(query, max_results):
+            urls = (
+                ["https://example.com/a", "https://example.com/b"]
+                if query == "test query"
+                else ["https://example.com/b", "https://example.com/c"]
+            )
+            return {
+                "results": [
+                    {"url": url, "title": f"Page {url[-1]}", "content": "snippet"}
+                    for url in urls
+                ]
+            }
+
+        mocker.patch.object(research_service.search_client, "search", new=search)
+        mocker.patch.object(research_service.scraper, "scrape", return_value="Page")
+
+        _, sources, errors = await research_service.search_and_scrape(
+            "test query", loop_count=1
+        )
+
+        assert sources.count("https://example.com/b") == 1
+        assert "https://example.com/a" in sources
+        assert "https://example.com/c" in sources
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_search_and_scrape_skips_urls_seen_in_earlier_loops(
+        self, mocker, research_service
+    ):
+        """Test URLs used by earlier loops are neither scraped nor returned again."""
+        research_service.settings = research_service.settings.model_copy(
+            update={"scrape_top_k": 5, "seen_url_extra_results": 5}
+        )
+        search = mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": "http://www.example.com/old/?utm_source=x",
+                        "title": "Old page",
+                        "content": "snippet",
+                    },
+                    {
+                        "url": "https://example.com/new",
+                        "title": "New page",
+                        "content": "snippet",
+                    },
+                ]
+            },
+        )
+        scrape = mocker.patch.object(
+            research_service.scraper, "scrape", return_value="Scraped page"
+        )
+        seen_urls = ["https://example.com/old", "https://example.com/other"]
+
+        _, sources, errors = await research_service.search_and_scrape(
+            "test query", loop_count=2, seen_urls=seen_urls
+        )
+
+        search.assert_called_once_with(
+            "test query",
+            max_results=research_service.ddgs_settings.ddgs_max_results + 2,
+        )
+        assert [call.args[0] for call in scrape.call_args_list] == [
+            "https://example.com/new"
+        ]
+        assert "example.com/old" not in sources
+        assert seen_urls[2:] == ["https://example.com/new"]
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_search_and_scrape_fetches_and_cites_the_search_url(
+        self, mocker, research_service
+    ):
+        """Test the canonical URL is only a key; the search URL is fetched and cited."""
+        url = "http://www.example.com/amp/docs%2Fpage/?ref=guide#/route"
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [{"url": url, "title": "Page", "content": "snippet"}]
+            },
+        )
+        scrape = mocker.patch.object(
+            research_service.scraper, "scrape", return_value="Scraped page"
+        )
+        seen_urls: list[str] = []
+
+        _, sources, _ = await research_service.search_and_scrape(
+            "test query", loop_count=1, seen_urls=seen_urls
+        )
+
+        canonical = research_service.url_canonicalizer.canonicalize(url)
+        assert canonical != url
+        scrape.assert_called_once_with(url)
+        assert url in sources
+        assert seen_urls == [canonical]
+
+    @pytest.mark.asyncio
+    async def test_search_and_scrape_notes_when_all_results_were_seen(
+        self, mocker, research_service
+    ):
+        """Test a loop whose results were all used before adds a note, not an error."""
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {"url": "https://example.com/old", "title": "Old", "content": "s"}
+                ]
+            },
+        )
+        scrape = mocker.patch.object(research_service.scraper, "scrape")
+        notes: list[str] = []
+
+        results, _, errors = await research_service.search_and_scrape(
+            "test query",
+            loop_count=2,
+            seen_urls=["https://example.com/old"],
+            notes=notes,
+        )
+
+        scrape.assert_not_called()
+        assert results == ""
+        assert errors == []
+        assert len(notes) == 1 and "already used" in notes[0]
+
+    @pytest.mark.asyncio
+    async def test_domain_policy_skips_and_uses_snippets(
+        self, mocker, research_service
+    ):
+        """Test skipped domains are dropped and snippet-only domains are not scraped."""
+        research_service.settings = research_service.settings.model_copy(
+            update={"scrape_top_k": 3}
+        )
+        decisions = {
+            "https://video.example/watch": "skip",
+            "https://paywall.example/story": "snippet",
+        }
+        research_service.domain_policy = mocker.Mock()
+        research_service.domain_policy.decide.side_effect = lambda url: decisions.get(
+            url, "scrape"
+        )
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            return_value={
+                "results": [
+                    {
+                        "url": url,
+                        "title": f"Page {index}",
+                        "content": f"snippet {index}",
+                    }
+                    for index, url in enumerate(
+                        [
+                            "https://video.example/watch",
+                            "https://paywall.example/story",
+                            "https://open.example/article",
+                        ]
+                    )
+                ]
+            },
+        )
+        scrape = mocker.patch.object(
+            research_service.scraper, "scrape", return_value="Scraped page"
+        )
+
+        results, sources, errors = await research_service.search_and_scrape(
+            "test query", loop_count=1
+        )
+
+        assert [call.args[0] for call in scrape.call_args_list] == [
+            "https://open.example/article"
+        ]
+        assert "video.example" not in sources
+        assert "snippet 1" in results
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_conduct_web_search_carries_state_into_next_pass(
+        self, mocker, research_service
+    ):
+        """Test URLs and fingerprints from one pass are skipped by the next."""
+        from src.starprobe.nodes.node2_conduct_web_search import conduct_web_search
+
+        passes = [
+            ["https://example.com/a", "https://example.com/b"],
+            [
+                "https://www.example.com/a/",
+                "https://mirror.example/a",
+                "https://c.org/",
+            ],
+        ]
+        mocker.patch.object(
+            research_service.search_client,
+            "search",
+            side_effect=[
+                {
+                    "results": [
+                        {"url": url, "title": url, "content": "snippet"} for url in urls
+                    ]
+                }
+                for urls in passes
+            ],
+        )
+        pages = {
+            "a": "Grid scale batteries store solar power for the evening peak. " * 20,
+            "b": "Pumped hydro moves water uphill when electricity is cheap. " * 20,
+            "c": "Flywheels keep spinning mass to smooth short grid swings. " * 20,
+        }
+        scrape = mocker.patch.object(
+            research_service.scraper,
+            "scrape",
+            side_effect=lambda url: pages[
+                "c" if "c.org" in url else "b" if url.endswith("/b") else "a"
+            ],
+        )
+
+        # Carry the update into the next pass the way the graph's reducers do
+        state = {"research_loop_count": 0, "content_fingerprints": [], "seen_urls": []}
+        for _ in passes:
+            update = await conduct_web_search(
+                "grid storage",
+                state["research_loop_count"],
+                [],
+                [],
+                research_service,
+                state["content_fingerprints"],
+                "grid storage",
+                state["seen_urls"],
+            )
+            state = {
+                "research_loop_count": update["research_loop_count"],
+                "content_fingerprints": state["content_fingerprints"]
+                + update["content_fingerprints"],
+                "seen_urls": state["seen_urls"] + update["seen_urls"],
+            }
+
+        # The www variant of /a is skipped as a seen URL; the mirror is
+        # scraped but dropped as a near-duplicate of /a
+        assert [call.args[0] for call in scrape.call_args_list][2:] == [
+            "https://mirror.example/a",
+            "https://c.org/",
+        ]
+        assert "mirror.example" not in update["sources_gathered"][0]
+        assert "https://c.org/" in update["sources_gathered"][0]
+        assert state["research_loop_count"] == 2
+        assert len(state["content_fingerprints"]) == 3
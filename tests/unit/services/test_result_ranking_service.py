@@ -0,0 +1,80 @@
+"""Unit tests for ResultRankingService."""
+
+from src.starprobe.config.workflow_settings import WorkflowSettings
+from src.starprobe.services.result_ranking_service import ResultRankingService
+
+
+class TestResultRankingService:
+    """Test cases for ResultRankingService."""
+
+    def test_rank_results_prefers_relevant_titles(self):
+        """Test results matching the query outrank earlier unrelated ones."""
+        results = [
+            {"url": "https://a.com/x", "title": "Celebrity news", "content": "Gossip"},
+            {
+                "url": "https://b.com/y",
+                "title": "Battery chemistry basics",
+                "content": "Lithium battery chemistry",
+            },
+        ]
+        ranked = ResultRankingService.rank_results(
+            results, "battery chemistry", WorkflowSettings()
+        )
+        assert [r["url"] for r in ranked] == ["https://b.com/y", "https://a.com/x"]
+
+    def test_rank_results_drops_duplicates(self):
+        """Test duplicate URLs and titles are removed."""
+        results = [
+            {"url": "https://www.a.com/page/", "title": "Page", "content": ""},
+            {"url": "https://a.com/page", "title": "Other", "content": ""},
+            {"url": "https://a.com/copy", "title": "Page", "content": ""},
+            {
+                "url": "https://b.com/story",
+                "title": "How grid batteries store power",
+                "content": "",
+            },
+            {
+                "url": "https://c.com/syndicated",
+                "title": "How Grid Batteries Store Power",
+                "content": "",
+            },
+            {"title": "No URL", "content": ""},
+        ]
+        ranked = ResultRankingService.rank_results(results, "page", WorkflowSettings())
+        assert [r["url"] for r in ranked] == [
+            "https://www.a.com/page/",
+            "https://b.com/story",
+        ]
+
+    def test_rank_results_keeps_generic_titles_on_other_hosts(self):
+        """Test short titles like "Home" only count as duplicates on the same host."""
+        results = [
+            {"url": "https://a.com/", "title": "Home", "content": ""},
+            {"url": "https://b.com/", "title": "Home", "content": ""},
+            {"url": "https://www.b.com/index", "title": "home", "content": ""},
+        ]
+        ranked = ResultRankingService.rank_results(results, "home", WorkflowSettings())
+        assert [r["url"] for r in ranked] == ["https://a.com/", "https://b.com/"]
+
+    def test_domain_prior_uses_most_specific_key(self):
+        """Test suffix keys match subdomains and the longest key wins."""
+        priors = {"gov": 0.2, "nasa.gov": 0.5}
+        assert (
+            ResultRankingService.domain_prior("https://www.nasa.gov/x", priors) == 0.5
+        )
+        assert ResultRankingService.domain_prior("https://data.cdc.gov", priors) == 0.2
+        assert ResultRankingService.domain_prior("https://govblog.com", priors) == 0.0
+
+    def test_snippet_covers_query(self):
+        """Test only long snippets containing every query term are sufficient."""
+        long_snippet = {"content": "solar panel efficiency " + "words " * 30}
+        short_snippet = {"content": "solar panel efficiency"}
+        assert ResultRankingService.snippet_covers_query(
+            long_snippet, "solar panel efficiency", 1.0
+        )
+        assert not ResultRankingService.snippet_covers_query(
+            short_snippet, "solar panel efficiency", 1.0
+        )
+        assert not ResultRankingService.snippet_covers_query(
+            long_snippet, "wind turbine efficiency", 1.0
+        )
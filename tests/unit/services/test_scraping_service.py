@@ -1,7 +1,7 @@
 """Unit tests for ScrapingService."""
 
+import httpx
 import pytest
-import requests
 
 from src.starprobe.services.scraping_service import ScrapingService
 
@@ -78,7 +78,9 @@ class TestScrapingService:
         mock_response.headers = {"Content-Type": "text/html"}
         mock_response.content = b"<html><body><p>Test content</p></body></html>"
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch.object(
+            scraping_service.http_client, "get", return_value=mock_response
+        )
 
         result = scraping_service.scrape("https://example.com")
 
@@ -94,7 +96,9 @@ class TestScrapingService:
             b"<html><body><p>Visible</p><script>alert('hidden')</script></body></html>"
         )
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch.object(
+            scraping_service.http_client, "get", return_value=mock_response
+        )
 
         result = scraping_service.scrape("https://example.com")
 
@@ -109,7 +113,9 @@ class TestScrapingService:
         mock_response.headers = {"Content-Type": "text/html"}
         mock_response.content = b"<html><body><p>Content</p><style>.class { color: red; }</style></body></html>"
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch.object(
+            scraping_service.http_client, "get", return_value=mock_response
+        )
 
         result = scraping_service.scrape("https://example.com")
 
@@ -118,7 +124,7 @@ class TestScrapingService:
 
     def test_scrape_timeout_parameter(self, scraping_service, mocker):
         """Test that timeout parameter is passed correctly."""
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch.object(scraping_service.http_client, "get")
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "text/html"}
@@ -128,14 +134,14 @@ class TestScrapingService:
         timeout = (10, 30)
         scraping_service.scrape("https://example.com", timeout=timeout)
 
-        # Verify timeout was passed to requests.get
+        # Verify timeout was passed to the HTTP client
         mock_get.assert_called_once()
         call_kwargs = mock_get.call_args.kwargs
-        assert call_kwargs["timeout"] == timeout
+        assert call_kwargs["timeout"] == httpx.Timeout(30, connect=10)
 
     def test_scrape_default_timeout(self, scraping_service, mocker):
         """Test default timeout when none specified."""
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch.object(scraping_service.http_client, "get")
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "text/html"}
@@ -146,12 +152,14 @@ class TestScrapingService:
 
         # Verify default timeout (30, 90) was used
         call_kwargs = mock_get.call_args.kwargs
-        assert call_kwargs["timeout"] == (30, 90)
+        assert call_kwargs["timeout"] == httpx.Timeout(90, connect=30)
 
     def test_scrape_network_error(self, scraping_service, mocker):
         """Test handling of network errors."""
-        mocker.patch(
-            "requests.get", side_effect=requests.RequestException("Network error")
+        mocker.patch.object(
+            scraping_service.http_client,
+            "get",
+            side_effect=httpx.ConnectError("Network error"),
         )
 
         with pytest.raises(ValueError, match="Failed to retrieve content"):
@@ -160,9 +168,13 @@ class TestScrapingService:
     def test_scrape_http_error(self, scraping_service, mocker):
         """Test handling of HTTP errors (404, 500, etc)."""
         mock_response = mocker.Mock()
-        mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "404 Not Found", request=mocker.Mock(), response=mocker.Mock()
+        )
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch.object(
+            scraping_service.http_client, "get", return_value=mock_response
+        )
 
         with pytest.raises(ValueError, match="Failed to retrieve content"):
             scraping_service.scrape("https://example.com")
@@ -174,7 +186,9 @@ class TestScrapingService:
         mock_response.headers = {"Content-Type": "image/png"}
         mock_response.content = b"fake image data"
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch.object(
+            scraping_service.http_client, "get", return_value=mock_response
+        )
 
         result = scraping_service.scrape("https://example.com/image.png")
 
@@ -188,7 +202,9 @@ class TestScrapingService:
         mock_response.headers = {"Content-Type": "text/html"}
         mock_response.content = b"<html><p>No body tag</p></html>"
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch.object(
+            scraping_service.http_client, "get", return_value=mock_response
+        )
 
         result = scraping_service.scrape("https://example.com")
 
@@ -197,7 +213,7 @@ class TestScrapingService:
 
     def test_scrape_user_agent_header(self, scraping_service, mocker):
         """Test that User-Agent header is set."""
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch.object(scraping_service.http_client, "get")
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "text/html"}
@@ -214,13 +230,15 @@ class TestScrapingService:
 
     def test_scrape_with_settings_timeout(self, mocker):
         """Test that settings timeout is used when provided."""
-        mock_settings = mocker.Mock()
-        mock_settings.scraping_timeout_connect = 5
-        mock_settings.scraping_timeout_read = 15
+        from src.starprobe.config.scraping_settings import ScrapingSettings
+
+        settings = ScrapingSettings(
+            scraping_timeout_connect=5, scraping_timeout_read=15
+        )
 
-        scraping_service = ScrapingService(settings=mock_settings)
+        scraping_service = ScrapingService(settings=settings)
 
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch.object(scraping_service.http_client, "get")
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "text/html"}
@@ -231,4 +249,48 @@ class TestScrapingService:
 
         # Verify settings timeout was used
         call_kwargs = mock_get.call_args.kwargs
-        assert call_kwargs["timeout"] == (5, 15)
+        assert call_kwargs["timeout"] == httpx.Timeout(15, connect=5)
+
+    def test_scrape_reuses_pooled_client(self, scraping_service, mocker):
+        """Test scrapes share one long-lived client and report pool metrics."""
+        mock_response = mocker.Mock()
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.content = b"<html><body>Content</body></html>"
+        mock_response.http_version = "HTTP/2"
+        mock_get = mocker.patch.object(
+            scraping_service.http_client, "get", return_value=mock_response
+        )
+
+        scraping_service.scrape("https://example.com/a")
+        scraping_service.scrape("https://example.com/b")
+
+        assert mock_get.call_count == 2
+        assert "gzip" in mock_get.call_args.kwargs["headers"]["Accept-Encoding"]
+        metrics = scraping_service.metrics()
+        assert metrics["requests_total"] == 2
+        assert metrics["http2_responses_total"] == 2
+        assert metrics["in_flight"] == 0
+        assert metrics["pool_max_connections"] == 100
+
+    def test_close_releases_client(self, scraping_service):
+        """Test close shuts the pooled client and a new one is created on demand."""
+        client = scraping_service.http_client
+        scraping_service.close()
+        assert client.is_closed
+        assert scraping_service.http_client is not client
+
+    def test_extract_text_drops_page_chrome(self):
+        """Test extraction keeps body text and drops navigation, scripts and asides."""
+        html = (
+            "<html><head><title>T</title></head><body>"
+            "<header>Site</header><nav>Menu</nav>"
+            "<p>First paragraph.</p><script>track()</script>"
+            "<aside>Related</aside><p>Second paragraph.</p>"
+            "<footer>Copyright</footer></body></html>"
+        )
+
+        assert (
+            ScrapingService.extract_text(html.encode())
+            == "First paragraph. Second paragraph."
+        )
+        assert ScrapingService.extract_text("<p>No body</p>") == ""
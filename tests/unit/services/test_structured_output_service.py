@@ -0,0 +1,138 @@
+"""Unit tests for StructuredOutputService."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.starprobe.services.structured_output_service import (
+    IncrementalJsonParser,
+    StructuredOutputService,
+)
+
+
+class StreamingClient:
+    """Minimal streaming LLM client that records how far the stream was consumed."""
+
+    def __init__(self, chunks: list[str]):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+        self.kwargs = None
+
+    async def invoke(self, messages, **kwargs):
+        return SimpleNamespace(content="".join(self.chunks))
+
+    def bind_tools(self, tools):
+        return self
+
+    async def astream(self, messages, **kwargs):
+        self.kwargs = kwargs
+        try:
+            for chunk in self.chunks:
+                self.consumed += 1
+                yield SimpleNamespace(content=chunk)
+        finally:
+            self.closed = True
+
+
+class InvokeOnlyClient:
+    """LLM client without streaming support."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.kwargs = None
+
+    async def invoke(self, messages, **kwargs):
+        self.kwargs = kwargs
+        return SimpleNamespace(content=self.content)
+
+    def bind_tools(self, tools):
+        return self
+
+
+class TestIncrementalJsonParser:
+    """Test cases for IncrementalJsonParser."""
+
+    def test_parses_object_split_across_chunks(self):
+        """Test an object is returned once its closing brace arrives."""
+        parser = IncrementalJsonParser(required_key="query")
+        assert parser.feed('{"query": "solar') is None
+        assert parser.feed(' panels", "rationale": "x"') is None
+        assert parser.feed("}") == {"query": "solar panels", "rationale": "x"}
+
+    def test_ignores_surrounding_prose_and_fences(self):
+        """Test text before and after the object is ignored."""
+        parser = IncrementalJsonParser(required_key="query")
+        text = 'Sure!\n```json\n{"query": "ai chips"}\n```\nThis query targets...'
+        assert parser.feed(text) == {"query": "ai chips"}
+
+    def test_handles_braces_inside_strings(self):
+        """Test braces and escaped quotes inside strings do not end the object."""
+        parser = IncrementalJsonParser(required_key="query")
+        payload = {"query": 'use {curly} and \\"quotes\\"', "rationale": "}"}
+        assert parser.feed(json.dumps(payload)) == payload
+
+    def test_skips_objects_missing_required_key(self):
+        """Test objects without the required key are skipped."""
+        parser = IncrementalJsonParser(required_key="follow_up_query")
+        result = parser.feed(
+            '{"knowledge_gap": "gap"} {"knowledge_gap": "gap", "follow_up_query": "q"}'
+        )
+        assert result == {"knowledge_gap": "gap", "follow_up_query": "q"}
+
+    def test_returns_none_for_incomplete_object(self):
+        """Test truncated output never produces a result."""
+        parser = IncrementalJsonParser(required_key="query")
+        assert parser.feed('{"query": "unterminated') is None
+        assert parser.result is None
+
+
+class TestStructuredOutputService:
+    """Test cases for StructuredOutputService."""
+
+    @pytest.mark.asyncio
+    async def test_generate_json_stops_stream_after_complete_object(self):
+        """Test the stream is closed as soon as the object is complete."""
+        client = StreamingClient(
+            ['{"query": ', '"edge ai"', "}", " Rationale:", " more", " text"]
+        )
+
+        result = await StructuredOutputService.generate_json(
+            client, [], required_key="query", max_tokens=64
+        )
+
+        assert result == {"query": "edge ai"}
+        assert client.consumed == 3
+        assert client.closed is True
+        assert client.kwargs == {"max_tokens": 64}
+
+    @pytest.mark.asyncio
+    async def test_generate_json_falls_back_to_invoke(self):
+        """Test non-streaming clients are invoked once and parsed."""
+        client = InvokeOnlyClient('{"query": "fallback path", "rationale": "r"}')
+
+        result = await StructuredOutputService.generate_json(
+            client, [], required_key="query", max_tokens=32
+        )
+
+        assert result == {"query": "fallback path", "rationale": "r"}
+        assert client.kwargs == {"max_tokens": 32}
+
+    @pytest.mark.asyncio
+    async def test_generate_json_returns_none_without_required_key(self):
+        """Test None is returned when the key never appears."""
+        client = StreamingClient(['{"rationale": "no query"}'])
+
+        result = await StructuredOutputService.generate_json(
+            client, [], required_key="query"
+        )
+
+        assert result is None
+        assert client.kwargs == {}
+
+    def test_generation_kwargs_disabled_cap(self):
+        """Test a zero cap disables the max_tokens argument."""
+        assert StructuredOutputService.generation_kwargs(0) == {}
+        assert StructuredOutputService.generation_kwargs(None) == {}
+        assert StructuredOutputService.generation_kwargs(10) == {"max_tokens": 10}
@@ -2,7 +2,7 @@
 
 import tiktoken
 
-from src.starprobe.config import workflow_settings
+from src.starprobe.config import WorkflowSettings, workflow_settings
 from src.starprobe.services.text_processing_service import (
     TextProcessingService,
 )
@@ -177,3 +177,150 @@ class TestTextProcessingService:
             search_results, workflow_settings
         )
         assert result == ""
+
+    def test_get_encoding_is_cached(self):
+        """Test the tokenizer is loaded once per process."""
+        first = TextProcessingService.get_encoding()
+        second = TextProcessingService.get_encoding()
+        assert first is second
+
+    def test_truncate_texts_by_tokens_matches_single_truncation(self):
+        """Test batched truncation matches truncating each text on its own."""
+        texts = ["short text", "word " * 1000, "", "データ " * 500]
+        result = TextProcessingService.truncate_texts_by_tokens(texts, 50)
+        assert result == [
+            TextProcessingService.truncate_text_by_tokens(text, 50) for text in texts
+        ]
+        assert result[0] == "short text"
+        assert result[2] == ""
+
+    def test_truncate_text_by_tokens_large_page_uses_prefix(self, mocker):
+        """Test a very large page is not fully encoded."""
+        text = "The quick brown fox jumps over the lazy dog. " * 25000
+        encoding = TextProcessingService.get_encoding()
+        spy = mocker.spy(encoding, "encode")
+
+        result = TextProcessingService.truncate_text_by_tokens(text, 100)
+
+        encoded_lengths = [len(call.args[0]) for call in spy.call_args_list]
+        assert encoded_lengths
+        assert all(length < len(text) for length in encoded_lengths)
+        mocker.stopall()
+        expected = encoding.decode(encoding.encode(text)[:100])
+        assert result == expected
+
+    def test_truncate_text_by_tokens_zero_limit(self):
+        """Test a zero token limit yields an empty string."""
+        assert TextProcessingService.truncate_text_by_tokens("some text", 0) == ""
+
+    def test_remove_near_duplicates_drops_syndicated_copy(self):
+        """Test a lightly edited copy of a page is dropped."""
+        article = " ".join(f"word{index} topic{index % 7}" for index in range(300))
+        syndicated = article.replace("word10 ", "word10x ") + " Republished by partner."
+        search_results = {
+            "results": [
+                {"url": "https://a.com", "raw_content": article},
+                {"url": "https://b.com", "raw_content": syndicated},
+            ]
+        }
+        result = TextProcessingService.remove_near_duplicates(
+            search_results, workflow_settings
+        )
+        assert [r["url"] for r in result["results"]] == ["https://a.com"]
+
+    def test_remove_near_duplicates_keeps_distinct_and_short_content(self):
+        """Test distinct pages and short snippets are kept."""
+        first = " ".join(f"alpha{index}" for index in range(300))
+        second = " ".join(f"beta{index}" for index in range(300))
+        search_results = {
+            "results": [
+                {"url": "https://a.com", "raw_content": first},
+                {"url": "https://b.com", "raw_content": second},
+                {"url": "https://c.com", "content": "short snippet"},
+                {"url": "https://d.com", "content": "short snippet"},
+            ]
+        }
+        result = TextProcessingService.remove_near_duplicates(
+            search_results, workflow_settings
+        )
+        assert len(result["results"]) == 4
+
+    def test_remove_near_duplicates_uses_seen_fingerprints(self):
+        """Test fingerprints from earlier loops are honoured and extended."""
+        article = " ".join(f"gamma{index}" for index in range(300))
+        seen = [TextProcessingService.compute_simhash(article)]
+        other = " ".join(f"delta{index}" for index in range(300))
+        search_results = {
+            "results": [
+                {"url": "https://a.com", "raw_content": article},
+                {"url": "https://b.com", "raw_content": other},
+            ]
+        }
+        result = TextProcessingService.remove_near_duplicates(
+            search_results, workflow_settings, seen
+        )
+        assert [r["url"] for r in result["results"]] == ["https://b.com"]
+        assert seen[1] == TextProcessingService.compute_simhash(other)
+
+    def test_remove_near_duplicates_disabled(self):
+        """Test the filter can be switched off."""
+        article = " ".join(f"gamma{index}" for index in range(300))
+        search_results = {
+            "results": [
+                {"url": "https://a.com", "raw_content": article},
+                {"url": "https://b.com", "raw_content": article},
+            ]
+        }
+        settings = WorkflowSettings(remove_near_duplicates=False)
+        result = TextProcessingService.remove_near_duplicates(search_results, settings)
+        assert len(result["results"]) == 2
+
+    def test_split_passages_packs_sentences(self):
+        """Test sentences are packed into passages of bounded length."""
+        text = "One two three. Four five six. Seven eight nine ten eleven twelve."
+        passages = TextProcessingService.split_passages(text, 6)
+        assert passages == [
+            "One two three. Four five six.",
+            "Seven eight nine ten eleven twelve.",
+        ]
+        long_sentence = " ".join(f"w{index}" for index in range(10))
+        assert len(TextProcessingService.split_passages(long_sentence, 4)) == 3
+
+    def test_select_relevant_passages_prefers_matching_passage(self):
+        """Test the relevant paragraph is kept over the page introduction."""
+        intro = "Welcome to our website. We publish many articles every day. " * 40
+        relevant = "Solid state battery electrolytes improve energy density. "
+        text = intro + relevant + "Contact us for more information. " * 40
+
+        result = TextProcessingService.select_relevant_passages(
+            [text], "solid state battery electrolytes", 200, 20
+        )
+
+        assert "Solid state battery electrolytes" in result[0]
+        assert TextProcessingService.count_tokens(result[0]) <= 200
+
+    def test_select_relevant_passages_keeps_short_and_unmatched_texts(self):
+        """Test texts that fit or do not match the query are left unchanged."""
+        texts = ["short text", "unrelated words here. " * 200]
+        result = TextProcessingService.select_relevant_passages(
+            texts, "quantum computing", 50, 20
+        )
+        assert result == texts
+
+    def test_deduplicate_and_format_sources_selects_passages(self):
+        """Test formatting with a query keeps the relevant passage of long sources."""
+        content = "Filler sentence about nothing. " * 300 + "Fusion reactor plasma. "
+        search_results = {
+            "results": [{"url": "https://example.com/1", "raw_content": content}]
+        }
+        settings = WorkflowSettings(max_tokens_per_source=50)
+
+        with_query = TextProcessingService.deduplicate_and_format_sources(
+            search_results, settings, query="fusion reactor plasma"
+        )
+        without_query = TextProcessingService.deduplicate_and_format_sources(
+            search_results, settings
+        )
+
+        assert "Fusion reactor plasma" in with_query
+        assert "Fusion reactor plasma" not in without_query
@@ -0,0 +1,86 @@
+"""Unit tests for UrlCanonicalizationService."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.starprobe.config.url_settings import UrlSettings
+from src.starprobe.config.workflow_settings import WorkflowSettings
+from src.starprobe.services.text_processing_service import TextProcessingService
+from src.starprobe.services.url_canonicalization_service import (
+    UrlCanonicalizationService,
+)
+
+CASES = json.loads(
+    (Path(__file__).parent / "fixtures" / "url_canonicalization_cases.json").read_text()
+)
+
+
+class TestUrlCanonicalizationService:
+    """Test cases for UrlCanonicalizationService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with the default rules."""
+        return UrlCanonicalizationService(UrlSettings())
+
+    @pytest.mark.parametrize("group", CASES["equivalent"])
+    def test_equivalent_urls_share_canonical_form(self, service, group):
+        """Test every URL in an equivalence group canonicalizes to the same value."""
+        canonical = {service.canonicalize(url) for url in group}
+        assert canonical == {service.canonicalize(group[0])}
+
+    @pytest.mark.parametrize("first,second", CASES["distinct"])
+    def test_distinct_urls_stay_distinct(self, service, first, second):
+        """Test URLs for different pages are never merged."""
+        assert not service.same_url(first, second)
+
+    def test_canonical_form_is_stable(self, service):
+        """Test canonicalizing a canonical URL leaves it unchanged."""
+        for group in CASES["equivalent"]:
+            for url in group:
+                canonical = service.canonicalize(url)
+                assert service.canonicalize(canonical) == canonical
+
+    def test_non_http_values_are_returned_unchanged(self, service):
+        """Test values that are not http(s) URLs pass through."""
+        assert service.canonicalize(" not a url ") == "not a url"
+        assert service.canonicalize("mailto:a@b.com") == "mailto:a@b.com"
+        assert service.canonicalize("") == ""
+
+    def test_rules_can_be_disabled(self):
+        """Test each rule is controlled by its setting."""
+        service = UrlCanonicalizationService(
+            UrlSettings(
+                url_force_https=False,
+                url_strip_www=False,
+                url_strip_fragment=False,
+                url_drop_query_params=[],
+            )
+        )
+        url = "http://www.example.com/page?utm_source=x#top"
+        assert service.canonicalize(url) == url
+
+    def test_custom_drop_query_params(self):
+        """Test configured parameter patterns are removed."""
+        service = UrlCanonicalizationService(
+            UrlSettings(url_drop_query_params=["session*"])
+        )
+        assert (
+            service.canonicalize("https://a.com/p?sessionid=1&id=7&utm_source=x")
+            == "https://a.com/p?id=7&utm_source=x"
+        )
+
+    def test_deduplicate_and_format_sources_uses_canonical_urls(self):
+        """Test equivalent URLs are listed as a single source."""
+        search_results = {
+            "results": [
+                {"url": "https://a.com/page", "title": "A", "content": "first"},
+                {"url": "http://www.a.com/page/?utm_source=x", "title": "A2"},
+            ]
+        }
+        formatted = TextProcessingService.deduplicate_and_format_sources(
+            search_results, WorkflowSettings()
+        )
+        assert formatted.count("Source:") == 1
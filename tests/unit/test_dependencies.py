@@ -4,6 +4,8 @@ import pytest
 from nexus_sdk import NexusMLXClient, NexusOllamaClient
 from pydantic import ValidationError
 
+from src.starprobe.clients import DdgsClient, FederatedSearchClient
+from src.starprobe.config import DDGSSettings, SearchSettings
 from src.starprobe.dependencies import (
     _create_llm_client,
     _create_prompt_service,
@@ -90,6 +92,23 @@ class TestDependencyProviders:
         assert hasattr(client, "search")
         assert hasattr(client, "close")
 
+    def test_create_search_client_federates_multiple_providers(self):
+        """Test several configured providers are combined in a federated client."""
+        ddgs_settings = DDGSSettings(use_mock_search=False)
+
+        single = _create_search_client(ddgs_settings, SearchSettings())
+        federated = _create_search_client(
+            ddgs_settings, SearchSettings(search_providers="ddgs, local")
+        )
+
+        assert isinstance(single, DdgsClient)
+        assert isinstance(federated, FederatedSearchClient)
+        assert list(federated.providers) == ["ddgs", "local"]
+        with pytest.raises(ValueError):
+            _create_search_client(
+                ddgs_settings, SearchSettings(search_providers="unknown")
+            )
+
     def test_create_scraping_service_returns_service(self):
         """Test that _create_scraping_service returns a scraping service."""
         scraping_settings = get_scraping_settings()